@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import standard_scientific as si
+
+# Benchmark of the thread pool Executor on 10^7 values, for 1, 2, 4, ...
+# workers up to the number of cores, of
+#   - from_floats
+#   - SciDataArray arithmetic (x * y + x)
+#   - the sum of a product, without holding the product in memory
+# The speedup is relative to the same operation without the Executor.
+
+N = 10**7 if len(sys.argv) < 2 else int(sys.argv[1])
+
+def best(func, repeat = 3):
+    t = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        t.append(time.perf_counter() - t0)
+    return min(t)
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    rng = np.random.default_rng(0)
+    v = rng.uniform(1., 10., N)
+    x = si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(v, 6), si.SigFigArray.from_floats(v * 1e-3, 2))
+    y = x[::-1]
+
+    cases = {
+        "from_floats" : (lambda: si.SigFigArray.from_floats(v, 4),
+                         lambda ex: ex.from_floats(v, 4)),
+        "x * y + x"   : (lambda: x * y + x,
+                         lambda ex: ex.map(lambda a, b: a * b + a, x, y)),
+        "sum(x * y)"  : (lambda: si.reductions.reduce_scidata(x * y, "sum"),
+                         lambda ex: ex.reduce("sum", x, y, func = lambda a, b: a * b)),
+    }
+    cores = os.cpu_count() or 1
+    workers = [w for w in (1, 2, 4, 8, 16, 32) if w <= cores] + ([cores] if cores not in (1, 2, 4, 8, 16, 32) else [])
+    print(f"{N} values, {cores} cores")
+    for name, (serial, parallel) in cases.items():
+        t1 = best(serial)
+        print(f"{name:12s} serial {t1:7.3f} s")
+        for w in workers:
+            tw = best(lambda: parallel(si.Executor(workers = w)))
+            print(f"{'':12s} {w:3d} workers {tw:7.3f} s  speedup {t1 / tw:5.2f}")
@@ -10,3 +10,7 @@ print(f"The Hartree Energy is {Eh}")
 print(f"The value of Eh is : {Eh.value}")
 print(f"The standard uncertainty of Eh is : {Eh.unc}")
 print(f"The relative standard ucnertainty of Eh is : {Eh.rel_unc}")
+
+# The CODATA constants are also available without parsing any strings
+print(f"The Hartree Energy from si.constants is {si.constants.E_h}")
+print(f"Constants with Planck in the name : {si.constants.search('Planck')}")
@@ -0,0 +1,61 @@
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import standard_scientific as si
+
+# Benchmark of sending 10^6 values to a worker process, comparing
+#   - the default pickling of dataclasses (as SigFig used to be pickled)
+#   - the compact pickling of SigFig (SigFig.__reduce__)
+#   - pickling a SigFigArray (a few NumPy columns)
+#   - publishing a SigFigArray in shared memory, where only a handle is sent
+
+N = 10**6 if len(sys.argv) < 2 else int(sys.argv[1])
+
+# SigFig without the compact __reduce__, pickled as the class and a field dictionary
+@dataclass
+class DefaultSigFig:
+    value: float
+    sigfigs: int
+    exponent: int
+
+def size_and_time(x):
+    t = time.perf_counter()
+    b = pickle.dumps(x, protocol = pickle.HIGHEST_PROTOCOL)
+    pickle.loads(b)
+    return len(b), time.perf_counter() - t
+
+def total(x):
+    return len(x)
+
+def attached_total(handle):
+    with si.attach(handle) as block:
+        return len(block.array)
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    a = si.SigFigArray.from_floats(rng.uniform(1., 10., N), 6)
+    scalars = a.to_SigFigs()
+    default = [DefaultSigFig(s.value, s.sigfigs, s.exponent) for s in scalars]
+
+    print(f"pickle round trip of {N} values")
+    for name, x in [("default dataclass", default), ("SigFig.__reduce__", scalars), ("SigFigArray", a)]:
+        n, t = size_and_time(x)
+        print(f"  {name:20s} {n / N:8.2f} bytes/value {t:8.3f} s")
+
+    print(f"transfer of {N} values to a worker process")
+    with ProcessPoolExecutor(1) as pool:
+        pool.submit(total, []).result()     #start the worker
+
+        for name, x in [("default dataclass", default), ("SigFig.__reduce__", scalars), ("SigFigArray", a)]:
+            t = time.perf_counter()
+            pool.submit(total, x).result()
+            print(f"  {name:20s} {time.perf_counter() - t:8.3f} s")
+
+        t = time.perf_counter()
+        with si.publish(a) as block:
+            pool.submit(attached_total, block.handle).result()
+        print(f"  {'shared memory':20s} {time.perf_counter() - t:8.3f} s (including the copy into shared memory)")
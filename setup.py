@@ -18,5 +18,6 @@ setup(
     license='MIT',
     packages=find_packages(), 
     long_description=open('README.md').read(),
-    python_requires='>=3.0'
+    python_requires='>=3.0',
+    extras_require={'pandas': ['pandas'], 'arrow': ['pyarrow']}
 )
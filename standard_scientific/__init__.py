@@ -4,5 +4,45 @@ from standard_scientific.sigfig import exponent_from_float
 from standard_scientific.sigfig import SigFig
 from standard_scientific.sigfig import w_round
 from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.sigfig_array import exponents_from_floats
+from standard_scientific.sigfig_array import round_array
+from standard_scientific.sigfig_array import w_round_array
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import to_strings
+from standard_scientific.formatting import write_strings
+from standard_scientific.dual import Dual
+from standard_scientific.covariance import CovarianceRegistry
+from standard_scientific.covariance import registry as covariance_registry
+from standard_scientific.covariance import set_correlation
+from standard_scientific.propagation import propagate
+from standard_scientific.propagation import propagate_covariance
+from standard_scientific.propagation import exp, log, log10, sqrt
+from standard_scientific.propagation import sin, cos, tan, arcsin, arccos, arctan
+from standard_scientific.montecarlo import monte_carlo
+from standard_scientific.graph import QuantityGraph
+from standard_scientific.montecarlo import unc_sigfigs_from_samples
+from standard_scientific.reductions import reduce_sigfigs
+from standard_scientific.reductions import reduce_scidata
+from standard_scientific.shared import publish
+from standard_scientific.shared import attach
+from standard_scientific.shared import SharedHandle
+from standard_scientific.codata import ConstantsRegistry
+from standard_scientific.codata import constants
+from standard_scientific.consistency import consistency_matrix
+from standard_scientific.consistency import inconsistent_pairs
+from standard_scientific.consistency import birge_ratio
+from standard_scientific.fitting import fit
+from standard_scientific.fitting import fit_polynomial
+from standard_scientific.fitting import fit_linear
+from standard_scientific.linalg import matmul, dot, solve, inv
+from standard_scientific.chunked import ChunkedArray
+from standard_scientific.encoding import EncodedArray
+from standard_scientific.ordering import sort, argsort, searchsorted, top_k, between
+from standard_scientific.validation import validate_sigfigs, validate_scidata
+from standard_scientific.parallel import Executor
+from standard_scientific.compact import CompactArray
+from standard_scientific.units import Quantity, Unit, unit, DimensionError
+from standard_scientific.tabulated import Table
 
-__all__ = ['sig_fig', 'scidata']
+__all__ = ['sig_fig', 'scidata', 'sigfig_array', 'scidata_array', 'formatting', 'dual', 'covariance', 'propagation', 'montecarlo', 'graph', 'reductions', 'shared', 'codata', 'consistency', 'fitting', 'linalg', 'chunked', 'encoding', 'ordering', 'validation', 'parallel', 'compact', 'conformance', 'units', 'tabulated', 'allocations']
@@ -0,0 +1,74 @@
+# __main__.py
+#
+# Command line entry point, which streams a file of strings in scientific
+# notation into normalized csv, jsonl or parquet (see convert.py)
+#
+# Usage:
+#   python -m standard_scientific input.txt output.csv
+#   python -m standard_scientific input.txt output.parquet --format parquet --workers 4
+#   cat input.txt | python -m standard_scientific - - --format jsonl
+#   python -m standard_scientific input.txt output.csv --cache parsed
+#
+# The throughput statistics are printed to stderr.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.convert import convert, FORMATS, CHUNK_SIZE
+
+#external imports
+import argparse
+import os
+import sys
+
+#################################################################################
+# main
+#
+def main(argv = None) -> int:
+    '''Run the streaming converter from the command line'''
+    parser = argparse.ArgumentParser(prog = "python -m standard_scientific",
+                                     description = "Stream a file of strings in scientific notation (one per line) "
+                                                   "into normalized csv, jsonl or parquet.")
+    parser.add_argument("input", help = "input file, or - for stdin")
+    parser.add_argument("output", help = "output file, or - for stdout")
+    parser.add_argument("--format", choices = FORMATS, default = None,
+                        help = "output format (default: from the extension of the output, else csv)")
+    parser.add_argument("--workers", type = int, default = 1, help = "number of parsing processes (default: 1)")
+    parser.add_argument("--chunk-size", type = int, default = CHUNK_SIZE, help = f"lines parsed at once (default: {CHUNK_SIZE})")
+    parser.add_argument("--unc-sigfigs", type = int, default = None, help = "round the uncertainties to this many sigfigs")
+    parser.add_argument("--skip-invalid", action = "store_true", help = "skip lines that cannot be parsed")
+    parser.add_argument("--column", default = "data", help = "column name, for parquet (default: data)")
+    parser.add_argument("--cache", default = None, help = "directory of a cache of parsed chunks, so that only changed chunks are parsed")
+    parser.add_argument("--cache-max-mb", type = float, default = None, help = "limit on the size of the cache, in MB")
+    parser.add_argument("--quiet", action = "store_true", help = "do not print the throughput statistics")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        ext = os.path.splitext(args.output)[1].lstrip(".").lower()
+        fmt = ext if ext in FORMATS else "csv"
+
+    if args.cache_max_mb is not None and args.cache is None:
+        print("error: --cache-max-mb requires --cache", file = sys.stderr)
+        return 1
+
+    try:
+        cache = args.cache
+        if cache is not None and args.cache_max_mb is not None:
+            from standard_scientific.parse_cache import ParseCache
+            cache = ParseCache(cache, max_bytes = int(args.cache_max_mb * 1e6))
+        stats = convert(args.input, args.output, fmt = fmt, chunk_size = args.chunk_size, workers = args.workers,
+                        unc_sigfigs = args.unc_sigfigs, skip = args.skip_invalid, column = args.column,
+                        cache = cache)
+    except (AssertionError, ValueError, OSError, ImportError) as e:
+        print(f"error: {e}", file = sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(stats, file = sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
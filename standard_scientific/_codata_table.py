@@ -0,0 +1,136 @@
+# _codata_table.py
+#
+# A subset (38 of them) of the CODATA 2022 recommended values of the
+# fundamental physical constants, transcribed by hand from the NIST ASCII
+# listing in the format written by codata_gen.py. Running codata_gen.py on the
+# full listing replaces it with a table of every constant.
+#
+# DATA holds, for every constant, the fields of its SciData:
+#   (value, sigfigs, exponent, unc, unc_sigfigs, unc_exponent,
+#    rel_unc, rel_unc_sigfigs, rel_unc_exponent, is_exact)
+#
+
+VERSION = 'CODATA 2022'
+
+NAMES = (
+    'atomic mass constant',
+    'Avogadro constant',
+    'Bohr magneton',
+    'Bohr radius',
+    'Boltzmann constant',
+    'classical electron radius',
+    'Compton wavelength',
+    'electron g factor',
+    'electron mass',
+    'electron mass energy equivalent in MeV',
+    'electron volt',
+    'elementary charge',
+    'Faraday constant',
+    'fine-structure constant',
+    'Hartree energy',
+    'Hartree energy in eV',
+    'hyperfine transition frequency of Cs-133',
+    'inverse fine-structure constant',
+    'Josephson constant',
+    'luminous efficacy',
+    'molar gas constant',
+    'molar Planck constant',
+    'neutron mass',
+    'Newtonian constant of gravitation',
+    'Planck constant',
+    'proton-electron mass ratio',
+    'proton mass',
+    'reduced Planck constant',
+    'Rydberg constant',
+    'speed of light in vacuum',
+    'standard acceleration of gravity',
+    'standard atmosphere',
+    'Stefan-Boltzmann constant',
+    'Thomson cross section',
+    'vacuum electric permittivity',
+    'vacuum mag. permeability',
+    'von Klitzing constant',
+    'Wien wavelength displacement law constant',
+)
+
+UNITS = (
+    'kg',
+    'mol^-1',
+    'J T^-1',
+    'm',
+    'J K^-1',
+    'm',
+    'm',
+    '',
+    'kg',
+    'MeV',
+    'J',
+    'C',
+    'C mol^-1',
+    '',
+    'J',
+    'eV',
+    'Hz',
+    '',
+    'Hz V^-1',
+    'lm W^-1',
+    'J mol^-1 K^-1',
+    'J Hz^-1 mol^-1',
+    'kg',
+    'm^3 kg^-1 s^-2',
+    'J Hz^-1',
+    '',
+    'kg',
+    'J s',
+    'm^-1',
+    'm s^-1',
+    'm s^-2',
+    'Pa',
+    'W m^-2 K^-4',
+    'm^2',
+    'F m^-1',
+    'N A^-2',
+    'ohm',
+    'm K',
+)
+
+DATA = (
+    (1.66053906892e-27, 12, -27, 5.2e-37, 2, -37, 3.1e-10, 2, -10, False),
+    (6.02214076e+23, 9, 23, 0.0, 0, 0, 0.0, 0, 0, True),
+    (9.2740100657e-24, 11, -24, 2.9e-33, 2, -33, 3.1e-10, 2, -10, False),
+    (5.29177210544e-11, 12, -11, 8.2e-21, 2, -21, 1.5e-10, 2, -10, False),
+    (1.380649e-23, 7, -23, 0.0, 0, 0, 0.0, 0, 0, True),
+    (2.8179403205e-15, 11, -15, 1.3e-24, 2, -24, 4.6e-10, 2, -10, False),
+    (2.42631023538e-12, 12, -12, 7.6e-22, 2, -22, 3.1e-10, 2, -10, False),
+    (-2.00231930436092, 15, 0, 3.6e-13, 2, -13, 1.8e-13, 2, -13, False),
+    (9.1093837139e-31, 11, -31, 2.8e-40, 2, -40, 3.1e-10, 2, -10, False),
+    (0.51099895069, 11, -1, 1.6e-10, 2, -10, 3.1e-10, 2, -10, False),
+    (1.602176634e-19, 10, -19, 0.0, 0, 0, 0.0, 0, 0, True),
+    (1.602176634e-19, 10, -19, 0.0, 0, 0, 0.0, 0, 0, True),
+    (96485.33212, 10, 4, 0.0, 0, 0, 0.0, 0, 0, True),
+    (0.0072973525643, 11, -3, 1.1e-12, 2, -12, 1.5e-10, 2, -10, False),
+    (4.359744722206e-18, 14, -18, 4.8e-30, 2, -30, 1.1e-12, 2, -12, False),
+    (27.211386245981, 14, 1, 3e-11, 2, -11, 1.1e-12, 2, -12, False),
+    (9192631770.0, 10, 9, 0.0, 0, 0, 0.0, 0, 0, True),
+    (137.035999177, 12, 2, 2.1e-08, 2, -8, 1.5e-10, 2, -10, False),
+    (483597848400000.0, 10, 14, 0.0, 0, 0, 0.0, 0, 0, True),
+    (683.0, 3, 2, 0.0, 0, 0, 0.0, 0, 0, True),
+    (8.314462618, 10, 0, 0.0, 0, 0, 0.0, 0, 0, True),
+    (3.990312712e-10, 10, -10, 0.0, 0, 0, 0.0, 0, 0, True),
+    (1.67492750056e-27, 12, -27, 8.5e-37, 2, -37, 5.1e-10, 2, -10, False),
+    (6.6743e-11, 6, -11, 1.5e-15, 2, -15, 2.2e-05, 2, -5, False),
+    (6.62607015e-34, 9, -34, 0.0, 0, 0, 0.0, 0, 0, True),
+    (1836.152673426, 13, 3, 3.2e-08, 2, -8, 1.7e-11, 2, -11, False),
+    (1.67262192595e-27, 12, -27, 5.2e-37, 2, -37, 3.1e-10, 2, -10, False),
+    (1.054571817e-34, 10, -34, 0.0, 0, 0, 0.0, 0, 0, True),
+    (10973731.568157, 14, 7, 1.2e-05, 2, -5, 1.1e-12, 2, -12, False),
+    (299792458.0, 9, 8, 0.0, 0, 0, 0.0, 0, 0, True),
+    (9.80665, 6, 0, 0.0, 0, 0, 0.0, 0, 0, True),
+    (101325.0, 6, 5, 0.0, 0, 0, 0.0, 0, 0, True),
+    (5.670374419e-08, 10, -8, 0.0, 0, 0, 0.0, 0, 0, True),
+    (6.6524587051e-29, 11, -29, 6.2e-38, 2, -38, 9.3e-10, 2, -10, False),
+    (8.8541878188e-12, 11, -12, 1.4e-21, 2, -21, 1.6e-10, 2, -10, False),
+    (1.25663706127e-06, 12, -6, 2e-16, 2, -16, 1.6e-10, 2, -10, False),
+    (25812.80745, 10, 4, 0.0, 0, 0, 0.0, 0, 0, True),
+    (0.002897771955, 10, -3, 0.0, 0, 0, 0.0, 0, 0, True),
+)
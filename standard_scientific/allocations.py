@@ -0,0 +1,269 @@
+# allocations.py
+#
+# Allocation budgets of the hot paths, measured with tracemalloc, so that
+# changes that allocate more (more Decimal, tuples or intermediate SigFig per
+# operator, more intermediate strings per parse, ...) are caught.
+#
+#   from standard_scientific import allocations
+#   report = allocations.run()
+#   print(report)              #every operation, and where the over budget ones allocate
+#   report.ok
+#
+#   python -m standard_scientific.allocations
+#
+# For every operation (OPERATIONS), three numbers are measured per element
+# (per call, for the scalar operations, and per element of the arrays, for
+# the bulk ones):
+#   blocks : memory blocks still allocated after the call (its results, and
+#            anything it caches or leaks)
+#   nbytes : bytes of those blocks
+#   peak   : the largest number of bytes allocated at once during a call,
+#            beyond what was allocated before it. tracemalloc only traces
+#            the blocks that are alive, so the temporary objects of an
+#            operation (which are freed before it returns) are measured
+#            through the peak they reach.
+#
+# The operation is called once before measuring, so that lazily built
+# caches (format specs, powers of ten, ...) are not counted. The breakdown
+# of an operation (its call sites, by file and line, with the blocks and bytes
+# they kept) is printed for every operation over budget.
+#
+# The budgets (BUDGETS) were recorded with CPython 3.11 on 64 bit Linux, with
+# headroom for other versions and platforms, and should be lowered along
+# with any change that allocates less.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import to_strings
+
+#external imports
+from dataclasses import dataclass, field
+import argparse
+import gc
+import sys
+import tracemalloc
+import warnings
+import numpy as np
+
+#number of elements of the arrays of the bulk operations
+BULK = 1000
+
+#################################################################################
+# Operations
+#
+# Each maps a name to (setup, func, elements), where setup() returns the
+# arguments of func, and elements is the number of elements of each call
+#
+def _sigfigs():
+    return SigFig.from_float(12.345, 5), SigFig.from_float(0.678, 3)
+
+def _scidata():
+    return SciData.from_str("12.345(12)"), SciData.from_str("0.678(9)")
+
+def _arrays():
+    rng = np.random.default_rng(0)
+    return (SigFigArray.from_floats(rng.uniform(1., 100., BULK), 5),
+            SigFigArray.from_floats(rng.uniform(1., 100., BULK), 3))
+
+def _scidata_arrays():
+    a, b = _arrays()
+    return (SciDataArray.from_SigFigArrays(a, SigFigArray.from_floats(np.full(BULK, 0.012), 2)),
+            SciDataArray.from_SigFigArrays(b, SigFigArray.from_floats(np.full(BULK, 0.34), 2)))
+
+def _lines():
+    from standard_scientific.convert import parse_chunk
+    return parse_chunk, [(n, f"{1. + n / 7.:.4f}({11 + n % 80})") for n in range(BULK)]
+
+OPERATIONS = {
+    "SigFig.from_float"       : (lambda: (12.3456789, 4), SigFig.from_float, 1),
+    "SigFig.__add__"          : (_sigfigs, lambda a, b: a + b, 1),
+    "SigFig.__sub__"          : (_sigfigs, lambda a, b: a - b, 1),
+    "SigFig.__mul__"          : (_sigfigs, lambda a, b: a * b, 1),
+    "SigFig.__truediv__"      : (_sigfigs, lambda a, b: a / b, 1),
+    "SigFig.__abs__"          : (lambda: _sigfigs()[:1], abs, 1),
+    "SigFig.__str__"          : (lambda: _sigfigs()[:1], str, 1),
+    "SciData.from_str"        : (lambda: ("-0012.345(67)e-4",), SciData.from_str, 1),
+    "SciData.__add__"         : (_scidata, lambda a, b: a + b, 1),
+    "SciData.__sub__"         : (_scidata, lambda a, b: a - b, 1),
+    "SciData.__mul__"         : (_scidata, lambda a, b: a * b, 1),
+    "SciData.__truediv__"     : (_scidata, lambda a, b: a / b, 1),
+    "SciData.__pow__"         : (_scidata, lambda a, b: a ** b, 1),
+    "SciData.__neg__"         : (lambda: _scidata()[:1], lambda a: -a, 1),
+    "SciData.__abs__"         : (lambda: _scidata()[:1], abs, 1),
+    "SciData.__str__"         : (lambda: _scidata()[:1], str, 1),
+    "SigFigArray.from_floats" : (lambda: (np.linspace(1., 100., BULK), 4), SigFigArray.from_floats, BULK),
+    "SigFigArray.__add__"     : (_arrays, lambda a, b: a + b, BULK),
+    "SigFigArray.__mul__"     : (_arrays, lambda a, b: a * b, BULK),
+    "SciDataArray.__mul__"    : (_scidata_arrays, lambda a, b: a * b, BULK),
+    "to_strings"              : (lambda: _arrays()[:1], to_strings, BULK),
+    "parse_chunk"             : (_lines, lambda f, lines: f(lines), BULK),
+}
+
+#################################################################################
+# Budgets
+#
+# Per element, as (blocks, nbytes, peak), see above
+#
+@dataclass
+class Budget:
+    '''Allocations allowed per element of an operation'''
+    blocks: float
+    nbytes: float
+    peak: float
+
+BUDGETS = {
+    "SigFig.from_float"       : Budget(blocks = 4,    nbytes = 250, peak = 1600),
+    "SigFig.__add__"          : Budget(blocks = 4,    nbytes = 200, peak = 1800),
+    "SigFig.__sub__"          : Budget(blocks = 4,    nbytes = 200, peak = 1800),
+    "SigFig.__mul__"          : Budget(blocks = 4,    nbytes = 200, peak = 1600),
+    "SigFig.__truediv__"      : Budget(blocks = 4,    nbytes = 200, peak = 1600),
+    "SigFig.__abs__"          : Budget(blocks = 4,    nbytes = 200, peak = 1000),
+    "SigFig.__str__"          : Budget(blocks = 1.5,  nbytes = 100, peak = 400),
+    "SciData.from_str"        : Budget(blocks = 12,   nbytes = 600, peak = 3200),
+    "SciData.__add__"         : Budget(blocks = 12,   nbytes = 700, peak = 7700),
+    "SciData.__sub__"         : Budget(blocks = 12,   nbytes = 700, peak = 7700),
+    "SciData.__mul__"         : Budget(blocks = 12,   nbytes = 600, peak = 6800),
+    "SciData.__truediv__"     : Budget(blocks = 12,   nbytes = 600, peak = 6800),
+    "SciData.__pow__"         : Budget(blocks = 12,   nbytes = 600, peak = 6800),
+    "SciData.__neg__"         : Budget(blocks = 12,   nbytes = 600, peak = 6200),
+    "SciData.__abs__"         : Budget(blocks = 12,   nbytes = 600, peak = 6200),
+    "SciData.__str__"         : Budget(blocks = 1.5,  nbytes = 100, peak = 600),
+    "SigFigArray.from_floats" : Budget(blocks = 0.05, nbytes = 40,  peak = 180),
+    "SigFigArray.__add__"     : Budget(blocks = 0.05, nbytes = 40,  peak = 230),
+    "SigFigArray.__mul__"     : Budget(blocks = 0.05, nbytes = 40,  peak = 200),
+    "SciDataArray.__mul__"    : Budget(blocks = 0.1,  nbytes = 80,  peak = 450),
+    "to_strings"              : Budget(blocks = 1.5,  nbytes = 100, peak = 140),
+    "parse_chunk"             : Budget(blocks = 0.1,  nbytes = 80,  peak = 650),
+}
+
+#################################################################################
+# Results
+#
+@dataclass
+class Site:
+    '''Blocks and bytes kept per element by one line of code'''
+    site: str
+    blocks: float
+    nbytes: float
+
+@dataclass
+class Allocation:
+    '''Allocations per element of one operation, and where they were made'''
+    name: str
+    blocks: float
+    nbytes: float
+    peak: float
+    sites: list = field(default_factory = list)
+
+    def over(self, budget: Budget) -> list:
+        '''The measures (blocks, nbytes or peak) over the budget'''
+        return [k for k in ("blocks", "nbytes", "peak") if getattr(self, k) > getattr(budget, k)]
+
+@dataclass
+class AllocationReport:
+    '''The allocations of every operation, and their budgets'''
+    results: list
+    budgets: dict
+
+    @property
+    def failures(self) -> list:
+        return [r for r in self.results if r.name in self.budgets and len(r.over(self.budgets[r.name])) > 0]
+
+    @property
+    def ok(self) -> bool:
+        return len(self.failures) == 0
+
+    def __str__(self):
+        lines = [f"{'operation':24s} {'blocks':>8s} {'budget':>8s} {'bytes':>8s} {'budget':>8s} {'peak':>8s} {'budget':>8s}"]
+        for r in self.results:
+            b = self.budgets.get(r.name, Budget(float("nan"), float("nan"), float("nan")))
+            over = r.over(b)
+            lines.append(f"{r.name:24s} {r.blocks:8.2f} {b.blocks:8.2f} {r.nbytes:8.1f} {b.nbytes:8.1f} {r.peak:8.1f} {b.peak:8.1f}"
+                         + (f"  OVER BUDGET ({', '.join(over)})" if over else ""))
+        for r in self.failures:
+            lines.append(f"{r.name} allocates, per element:")
+            lines.extend(f"  {s.blocks:8.2f} blocks {s.nbytes:8.1f} bytes  {s.site}" for s in r.sites)
+        return "\n".join(lines)
+
+#################################################################################
+# measure
+#
+#   name   : name of the operation (in OPERATIONS)
+#   repeat : number of elements kept alive while the blocks are counted (at
+#            least 3 calls are made, for the bulk operations)
+#   top    : number of call sites in the breakdown
+#
+def measure(name: str, repeat: int = 100, top: int = 10) -> Allocation:
+    '''Measure the allocations per element of an operation with tracemalloc'''
+    assert(name in OPERATIONS), f"Unknown operation {name}, not one of {list(OPERATIONS)}"
+    assert(repeat > 0), f"repeat must be positive, not {repeat}"
+    setup, func, elements = OPERATIONS[name]
+    calls = max(3, repeat // elements)
+    #only the allocations of the operation are counted, not those of measuring it
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+
+    started = tracemalloc.is_tracing()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        args = setup()
+        func(*args)
+        kept = [None] * calls
+        gc.collect()
+        if not started:
+            tracemalloc.start()
+        try:
+            #the peak of a single call
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            kept[0] = func(*args)
+            peak = tracemalloc.get_traced_memory()[1] - current
+            kept[0] = None
+            gc.collect()
+
+            #the blocks kept by many
+            before = tracemalloc.take_snapshot()
+            for i in range(calls):
+                kept[i] = func(*args)
+            after = tracemalloc.take_snapshot()
+        finally:
+            if not started:
+                tracemalloc.stop()
+    before, after = before.filter_traces(filters), after.filter_traces(filters)
+
+    n = calls * elements
+    stats = [s for s in after.compare_to(before, "lineno") if s.size_diff != 0 or s.count_diff != 0]
+    sites = [Site(site = f"{s.traceback[0].filename}:{s.traceback[0].lineno}", blocks = s.count_diff / n, nbytes = s.size_diff / n)
+             for s in sorted(stats, key = lambda s: -s.size_diff)[:top]]
+    return Allocation(name = name, blocks = sum(s.count_diff for s in stats) / n, nbytes = sum(s.size_diff for s in stats) / n,
+                      peak = peak / elements, sites = sites)
+
+#################################################################################
+# run
+#
+def run(names = None, repeat: int = 100, budgets: dict = None) -> AllocationReport:
+    '''Measure every operation, and check them against their budgets'''
+    names = list(OPERATIONS) if names is None else list(names)
+    return AllocationReport([measure(k, repeat) for k in names], BUDGETS if budgets is None else budgets)
+
+#################################################################################
+# main
+#
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(prog = "python -m standard_scientific.allocations",
+                                     description = "Measure the allocations of the hot paths against their budgets")
+    parser.add_argument("--op", action = "append", choices = list(OPERATIONS), help = "operation to measure (default: all)")
+    parser.add_argument("--repeat", type = int, default = 100, help = "number of elements measured (default: 100)")
+    args = parser.parse_args(argv)
+    report = run(args.op, args.repeat)
+    print(report)
+    return 0 if report.ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
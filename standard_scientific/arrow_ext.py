@@ -0,0 +1,228 @@
+# arrow_ext.py
+#
+# Apache Arrow extension types for SigFigArray and SciDataArray, and helpers
+# to read and write them to Parquet, so that the sigfigs and exactness of the
+# data survive a round trip through a data lake.
+#
+#   sigfig  : struct<value: double, sigfigs: int64, exponent: int64>
+#   scidata : struct<value: double, sigfigs: int64, exponent: int64,
+#                    unc: double, unc_sigfigs: int64, unc_exponent: int64,
+#                    is_exact: bool>
+#
+# Missing elements (see SigFigArray.missing) are null. The relative
+# uncertainty of SciData is not stored, and is generated again (with the
+# SigFig division rules, as in SciData.from_str) when the data is read.
+#
+# How this works. The fields of the struct are the NumPy columns of the
+# package's arrays, which Arrow wraps (and NumPy gets back) without copying.
+# The only exception is is_exact, as Arrow stores booleans as bits.
+#
+# pyarrow is an optional dependency, and this module is not imported by
+# standard_scientific itself.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+
+#external imports
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+_SIGFIG_FIELDS = [("value", pa.float64()), ("sigfigs", pa.int64()), ("exponent", pa.int64())]
+_SCIDATA_FIELDS = _SIGFIG_FIELDS + [("unc", pa.float64()), ("unc_sigfigs", pa.int64()),
+                                    ("unc_exponent", pa.int64()), ("is_exact", pa.bool_())]
+
+#################################################################################
+# SigFigType, SciDataType
+#
+# The pandas dtypes of pandas_ext.py are used when converting to pandas
+#
+class SigFigType(pa.ExtensionType):
+    '''Arrow extension type of arrays of SigFig'''
+
+    def __init__(self):
+        super().__init__(pa.struct(_SIGFIG_FIELDS), "standard_scientific.sigfig")
+
+    def __arrow_ext_serialize__(self):
+        return b""
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        return cls()
+
+    def to_pandas_dtype(self):
+        from standard_scientific.pandas_ext import SigFigDtype
+        return SigFigDtype()
+
+class SciDataType(pa.ExtensionType):
+    '''Arrow extension type of arrays of SciData'''
+
+    def __init__(self):
+        super().__init__(pa.struct(_SCIDATA_FIELDS), "standard_scientific.scidata")
+
+    def __arrow_ext_serialize__(self):
+        return b""
+
+    @classmethod
+    def __arrow_ext_deserialize__(cls, storage_type, serialized):
+        return cls()
+
+    def to_pandas_dtype(self):
+        from standard_scientific.pandas_ext import SciDataDtype
+        return SciDataDtype()
+
+#the types must be registered for them to be recognized in Parquet (and IPC) files
+for _t in (SigFigType(), SciDataType()):
+    try:
+        pa.register_extension_type(_t)
+    except pa.ArrowKeyError:
+        pass
+
+#################################################################################
+# to_arrow
+#
+# SigFigArray or SciDataArray -> Arrow ExtensionArray, without copying the
+# numeric columns
+#
+def to_arrow(x):
+    '''Convert a SigFigArray or SciDataArray to an Arrow extension array'''
+    if isinstance(x, SigFigArray):
+        typ = SigFigType()
+        columns = [x.value, x.sigfigs, x.exponent]
+        missing = x.is_missing()
+    else:
+        assert(isinstance(x, SciDataArray)), f"{x} was not an instance of SigFigArray or SciDataArray"
+        typ = SciDataType()
+        columns = [x.value.value, x.value.sigfigs, x.value.exponent,
+                   x.unc.value, x.unc.sigfigs, x.unc.exponent, x.is_exact]
+        missing = x.value.is_missing()
+
+    children = [pa.array(np.ascontiguousarray(c), type = f.type) for c, f in zip(columns, typ.storage_type)]
+    storage = pa.StructArray.from_arrays(children, fields = list(typ.storage_type),
+                                         mask = pa.array(missing) if np.any(missing) else None)
+    return pa.ExtensionArray.from_storage(typ, storage)
+
+#################################################################################
+# from_arrow
+#
+# Arrow extension array (or chunked array of them) -> SigFigArray or
+# SciDataArray. Single arrays are converted without copying the numeric
+# columns (which are then read-only), while the chunks of a chunked array
+# are concatenated.
+#
+#the fields of null elements may themselves be null (as in Parquet files),
+#and are filled with the fields of SigFigArray.missing
+_MISSING = {"value": np.nan, "sigfigs": 0, "exponent": 0,
+            "unc": np.nan, "unc_sigfigs": 0, "unc_exponent": 0, "is_exact": True}
+
+def _column(storage, name):
+    c = storage.field(name)
+    if c.null_count > 0:
+        c = c.fill_null(_MISSING[name])
+    return c.to_numpy(zero_copy_only = False)
+
+def from_arrow(arr):
+    '''Convert an Arrow extension array of SigFig or SciData to a SigFigArray or SciDataArray'''
+    if isinstance(arr, pa.ChunkedArray):
+        if arr.num_chunks == 1:
+            arr = arr.chunk(0)
+        else:
+            arr = pa.concat_arrays(arr.chunks) if arr.num_chunks > 0 else pa.array([], type = arr.type)
+    assert(isinstance(arr.type, (SigFigType, SciDataType))), f"Arrow type {arr.type} is not sigfig or scidata"
+
+    storage = arr.storage
+    missing = storage.is_null().to_numpy(zero_copy_only = False)
+    value = SigFigArray(value = _column(storage, "value"), sigfigs = _column(storage, "sigfigs"),
+                        exponent = _column(storage, "exponent"))
+    if isinstance(arr.type, SigFigType):
+        if np.any(missing):
+            value = value[np.arange(len(value))]
+            value[missing] = None
+        return value
+
+    #the uncertainties of exact elements are stored as missing by to_arrow
+    unc = SigFigArray(value = _column(storage, "unc"), sigfigs = _column(storage, "unc_sigfigs"),
+                      exponent = _column(storage, "unc_exponent"))
+    exact = _column(storage, "is_exact") | missing
+    if np.any(missing):
+        value = value[np.arange(len(value))]
+        value[missing] = None
+    #the relative uncertainties are computed when they are first used
+    return SciDataArray(value = value, unc = unc, rel_unc = None, is_exact = exact)
+
+#################################################################################
+# Parquet
+#
+# Tables are given as dictionaries of name -> column, where every column is a
+# SigFigArray, SciDataArray, or anything that pyarrow can convert (such as a
+# NumPy array). Reading returns the same, with the extension columns
+# converted back to SigFigArray and SciDataArray.
+#
+def _to_table(columns: dict):
+    return pa.table({k: to_arrow(v) if isinstance(v, (SigFigArray, SciDataArray)) else v
+                     for k, v in columns.items()})
+
+def _from_table(table):
+    return {k: from_arrow(c) if isinstance(c.type, (SigFigType, SciDataType)) else c.to_numpy()
+            for k, c in zip(table.column_names, table.columns)}
+
+##########################
+# write_parquet
+#
+# Writes a table (or an iterable of tables, one batch of rows each) to a
+# Parquet file, with row groups of at most row_group_size rows. Writing an
+# iterable only holds a single batch in memory at once.
+#
+# The schema (a pyarrow.Schema, see parquet_schema) is that of the first
+# batch if it is not given. An iterable without any batches writes a file
+# without any rows, which requires the schema.
+#
+def write_parquet(where, columns, row_group_size: int = None, schema = None, **kwargs):
+    '''Write a dictionary of columns (or an iterable of them) to a Parquet file'''
+    batches = [columns] if isinstance(columns, dict) else columns
+    writer = None if schema is None else pq.ParquetWriter(where, schema, **kwargs)
+    try:
+        for batch in batches:
+            table = _to_table(batch)
+            if writer is None:
+                writer = pq.ParquetWriter(where, table.schema, **kwargs)
+            writer.write_table(table, row_group_size = row_group_size)
+        assert(writer is not None), f"Cannot write an empty iterable of tables without a schema"
+    finally:
+        if writer is not None:
+            writer.close()
+
+##########################
+# parquet_schema
+#
+# The schema of tables of the given columns, as name -> SigFigArray or
+# SciDataArray (the class), or any pyarrow type
+#
+def parquet_schema(columns: dict):
+    '''The pyarrow.Schema of a dictionary of column types'''
+    types = {SigFigArray: SigFigType(), SciDataArray: SciDataType()}
+    return pa.schema([(k, types.get(t, t)) for k, t in columns.items()])
+
+##########################
+# iter_parquet
+#
+# Yields the row groups of a Parquet file one at a time, as dictionaries of
+# columns, so that files larger than memory may be processed
+#
+def iter_parquet(where, columns=None):
+    '''Iterate over the row groups of a Parquet file as dictionaries of columns'''
+    f = pq.ParquetFile(where)
+    for i in range(f.num_row_groups):
+        yield _from_table(f.read_row_group(i, columns = columns))
+
+##########################
+# read_parquet
+#
+def read_parquet(where, columns=None):
+    '''Read a Parquet file into a dictionary of columns'''
+    return _from_table(pq.read_table(where, columns = columns))
@@ -0,0 +1,227 @@
+# chunked.py
+#
+# Out-of-core SigFigArray and SciDataArray, for data larger than memory.
+#
+# A ChunkedArray is evaluated one chunk (of chunk_size elements) at a time.
+# Those on disk are directories of memory-mapped columns, and arithmetic,
+# map() (of any elementwise function, such as a rounding) and the other
+# operators return new ChunkedArray that are evaluated lazily, when they are
+# iterated over (chunks), reduced (reduce), saved to disk (save) or brought
+# into memory (compute). Only the chunks being evaluated are held in memory.
+#
+#   x = si.ChunkedArray.write("campaign", chunks)     #from an iterable of arrays
+#   x = si.ChunkedArray.open("campaign")
+#   y = (x * 2.).map(lambda c: si.SigFigArray.from_floats(c.value, 3))
+#   y.reduce("mean"), y.save("scaled")
+#
+# The results are exactly those of the same operations on the whole array in
+# memory: the operators and map are elementwise, and the reductions carry
+# their sums (in the same order as reductions.py) from one chunk to the next
+# before rounding once at the end. With workers > 1, chunks are evaluated in
+# a thread pool (NumPy releases the GIL for most of the work), with at most
+# two chunks per worker in flight, and are always used in order. Their
+# warnings are merged as in parallel.py.
+#
+# On disk, a ChunkedArray is a directory with a meta.json (the kind and the
+# length) and one raw file per column, in the order of shared.py.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.reductions import SigFigAccumulator, SciDataAccumulator
+from standard_scientific.shared import LAYOUTS, array_columns, array_from_views
+from standard_scientific.parallel import imap, warn_merged
+
+#external imports
+import json
+import operator
+import os
+import numpy as np
+
+#default number of elements in a chunk
+CHUNK_SIZE = 1 << 20
+
+#################################################################################
+# _concat
+#
+# Concatenation of in-memory arrays of the same kind
+#
+def _concat(arrays):
+    lazy = any(isinstance(a, SciDataArray) and a._rel_unc is None for a in arrays)
+    kinds, cols = zip(*[array_columns(a, lazy) for a in arrays])
+    assert(len(set(kinds)) == 1), f"Cannot concatenate arrays of kinds {set(kinds)}"
+    return array_from_views(kinds[0], [np.concatenate(c) for c in zip(*cols)])
+
+#in-order results of func over items, with at most two per worker in flight,
+#and the warnings of all of them merged (see parallel.py) once they are done
+def _ordered(func, items, workers: int):
+    events = []
+    try:
+        yield from imap(func, items, workers, events)
+    finally:
+        warn_merged(events)
+
+#################################################################################
+# ChunkedArray
+#
+#   length     : the number of elements
+#   chunk      : function of (start, stop) that evaluates those elements in memory
+#   chunk_size : the number of elements evaluated at once
+#
+# Use ChunkedArray.open, ChunkedArray.write or ChunkedArray.from_array to
+# construct these.
+#
+class ChunkedArray:
+    '''Lazily evaluated, chunked SigFigArray or SciDataArray (possibly on disk)'''
+
+    def __init__(self, length: int, chunk, chunk_size: int = CHUNK_SIZE):
+        assert(chunk_size > 0), f"chunk_size must be positive, not {chunk_size}"
+        self._length = int(length)
+        self._chunk = chunk
+        self.chunk_size = int(chunk_size)
+
+    #########################################################
+    # open
+    # Memory maps a ChunkedArray saved on disk
+    #
+    @classmethod
+    def open(cls, path, chunk_size: int = CHUNK_SIZE):
+        '''Open a ChunkedArray saved in the directory path'''
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        kind, n = meta["kind"], meta["length"]
+        assert(kind in LAYOUTS), f"Unknown kind of array {kind}"
+        if n == 0:
+            cols = [np.empty(0, dtype = d) for d in LAYOUTS[kind]]
+        else:
+            cols = [np.memmap(os.path.join(path, f"{k}.bin"), dtype = d, mode = "r", shape = (n,))
+                    for k, d in enumerate(LAYOUTS[kind])]
+        return cls(n, lambda i0, i1: array_from_views(kind, [np.array(c[i0:i1]) for c in cols]), chunk_size)
+
+    #########################################################
+    # write
+    # Writes an iterable of arrays (or one array) to disk, one at a time
+    #
+    @classmethod
+    def write(cls, path, chunks, chunk_size: int = CHUNK_SIZE):
+        '''Write an iterable of SigFigArray or SciDataArray to the directory path, and open it'''
+        if isinstance(chunks, (SigFigArray, SciDataArray)):
+            chunks = [chunks]
+        os.makedirs(path, exist_ok = True)
+        kind = None
+        files = []
+        n = 0
+        try:
+            for c in chunks:
+                #later chunks are stored as the first is, with or without rel_unc
+                k, cols = array_columns(c, None if kind is None else kind == "scidata_lazy")
+                if kind is None:
+                    kind = k
+                    files = [open(os.path.join(path, f"{i}.bin"), "wb") for i in range(len(cols))]
+                assert(k == kind), f"Cannot write an array of kind {k} to one of kind {kind}"
+                for f, col, dtype in zip(files, cols, LAYOUTS[kind]):
+                    f.write(np.ascontiguousarray(col, dtype = dtype).tobytes())
+                n += len(c)
+        finally:
+            for f in files:
+                f.close()
+        assert(kind is not None), "Cannot write an empty iterable of arrays"
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({"kind": kind, "length": n}, f)
+        return cls.open(path, chunk_size)
+
+    #########################################################
+    # from_array
+    # Chunks an array in memory (mostly for testing)
+    #
+    @classmethod
+    def from_array(cls, x, chunk_size: int = CHUNK_SIZE):
+        '''ChunkedArray of a SigFigArray or SciDataArray in memory'''
+        assert(isinstance(x, (SigFigArray, SciDataArray))), f"{x} was not an instance of SigFigArray or SciDataArray"
+        return cls(len(x), lambda i0, i1: x[i0:i1], chunk_size)
+
+    def __len__(self):
+        return self._length
+
+    def _bounds(self):
+        return [(i, min(self._length, i + self.chunk_size)) for i in range(0, self._length, self.chunk_size)]
+
+    #########################################################
+    # Evaluation
+    #
+    def chunks(self, workers: int = 1):
+        '''Iterate over the evaluated chunks, in order'''
+        assert(workers > 0), f"workers must be positive, not {workers}"
+        return _ordered(lambda b: self._chunk(*b), self._bounds(), workers)
+
+    def compute(self, workers: int = 1):
+        '''Evaluate the whole array in memory'''
+        if self._length == 0:
+            return self._chunk(0, 0)
+        return _concat(list(self.chunks(workers)))
+
+    def save(self, path, workers: int = 1):
+        '''Evaluate the array into the directory path, one chunk at a time, and open it'''
+        chunks = self.chunks(workers) if self._length > 0 else [self._chunk(0, 0)]
+        return ChunkedArray.write(path, chunks, self.chunk_size)
+
+    #########################################################
+    # map
+    # func must be elementwise (its result for an element may only depend on that element)
+    #
+    def map(self, func):
+        '''Lazily apply an elementwise function to every chunk'''
+        return ChunkedArray(self._length, lambda i0, i1: func(self._chunk(i0, i1)), self.chunk_size)
+
+    def _binary(self, op, other, reverse = False):
+        #x * x is one input (as for the arrays in memory), not two independent ones
+        if other is self:
+            def both(i0, i1):
+                c = self._chunk(i0, i1)
+                return op(c, c)
+            return ChunkedArray(self._length, both, self.chunk_size)
+        if isinstance(other, ChunkedArray):
+            assert(len(other) == len(self)), f"ChunkedArray of lengths {len(self)} and {len(other)} are not aligned"
+            get = other._chunk
+        else:
+            get = lambda i0, i1: other
+        if reverse:
+            return ChunkedArray(self._length, lambda i0, i1: op(get(i0, i1), self._chunk(i0, i1)), self.chunk_size)
+        return ChunkedArray(self._length, lambda i0, i1: op(self._chunk(i0, i1), get(i0, i1)), self.chunk_size)
+
+    #########################################################
+    # Arithmetic
+    # The operators of SigFigArray and SciDataArray, chunk by chunk
+    #
+    def __add__(self, other):      return self._binary(operator.add, other)
+    def __radd__(self, other):     return self._binary(operator.add, other, True)
+    def __sub__(self, other):      return self._binary(operator.sub, other)
+    def __rsub__(self, other):     return self._binary(operator.sub, other, True)
+    def __mul__(self, other):      return self._binary(operator.mul, other)
+    def __rmul__(self, other):     return self._binary(operator.mul, other, True)
+    def __truediv__(self, other):  return self._binary(operator.truediv, other)
+    def __rtruediv__(self, other): return self._binary(operator.truediv, other, True)
+    def __neg__(self):             return self.map(operator.neg)
+    def __abs__(self):             return self.map(operator.abs)
+
+    #########################################################
+    # reduce
+    #
+    # The same reductions (with the same results) as reduce_sigfigs and
+    # reduce_scidata of the whole array, returned as a SigFig or SciData
+    # (None if every element is missing)
+    #
+    def reduce(self, how: str, workers: int = 1):
+        '''Sum, mean, product, min, or max of all of the elements'''
+        acc = None
+        for c in self.chunks(workers):
+            if acc is None:
+                acc = SigFigAccumulator(how) if isinstance(c, SigFigArray) else SciDataAccumulator(how)
+            acc.add(c)
+        if acc is None:
+            acc = SigFigAccumulator(how) if isinstance(self._chunk(0, 0), SigFigArray) else SciDataAccumulator(how)
+        return acc.result()
@@ -0,0 +1,206 @@
+# codata.py
+#
+# Contains the ConstantsRegistry class, a registry of the CODATA recommended
+# values of the fundamental physical constants (name -> SciData), and the
+# default registry, si.constants.
+#
+# Usage:
+#   si.constants["speed of light in vacuum"]
+#   si.constants.speed_of_light_in_vacuum    #the name, as an identifier
+#   si.constants.c                           #a few common symbols (see ALIASES)
+#   si.constants.search("Planck")            #names containing a substring
+#
+# How this works. The table is a python module (_codata_table.py) holding the
+# fields of the SciData of every constant, as produced by SciData.from_str,
+# so that no strings are parsed at run time. The
+# module is only imported on the first lookup, and each SciData is only built
+# the first time it is requested, after which the SAME instance is always
+# returned (so that correlations may be registered between constants, see
+# covariance.py).
+#
+# The table shipped is a subset of the constants, transcribed by hand. The
+# table of every constant is built from the listing at
+# https://physics.nist.gov/cuu/Constants/Table/allascii.txt (downloaded
+# separately) with codata_gen.py,
+#
+#   python -m standard_scientific.codata_gen allascii.txt
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.scidata import SciData
+
+#external imports
+import importlib
+import re
+
+#common symbols of constants
+ALIASES = {
+    "c"      : "speed of light in vacuum",
+    "h"      : "Planck constant",
+    "hbar"   : "reduced Planck constant",
+    "e"      : "elementary charge",
+    "k"      : "Boltzmann constant",
+    "N_A"    : "Avogadro constant",
+    "R"      : "molar gas constant",
+    "F"      : "Faraday constant",
+    "G"      : "Newtonian constant of gravitation",
+    "g_n"    : "standard acceleration of gravity",
+    "alpha"  : "fine-structure constant",
+    "R_inf"  : "Rydberg constant",
+    "m_e"    : "electron mass",
+    "m_p"    : "proton mass",
+    "m_n"    : "neutron mass",
+    "m_u"    : "atomic mass constant",
+    "a_0"    : "Bohr radius",
+    "E_h"    : "Hartree energy",
+    "mu_B"   : "Bohr magneton",
+    "eps_0"  : "vacuum electric permittivity",
+    "mu_0"   : "vacuum mag. permeability",
+    "sigma"  : "Stefan-Boltzmann constant",
+}
+
+#################################################################################
+# identifier
+#
+# The name of a constant as a python identifier:
+#   "Newtonian constant of gravitation" -> "newtonian_constant_of_gravitation"
+#
+def identifier(name: str) -> str:
+    '''The name of a constant as a python identifier'''
+    s = re.sub(r"\W+", "_", name.lower()).strip("_")
+    return "_" + s if s[:1].isdigit() else s
+
+#################################################################################
+# ConstantsRegistry
+#
+# Lookup by (exact) name, identifier, or alias is a single dictionary lookup.
+# Substring searches use an index of the three character substrings of every
+# name, so that only the names sharing all of those of the query are checked.
+#
+class ConstantsRegistry:
+    '''Lazily loaded registry of the CODATA fundamental physical constants'''
+
+    def __init__(self, table: str = "standard_scientific._codata_table"):
+        self._table = table
+        self._rows = None
+        self._cache = {}
+
+    ##########################
+    # _load
+    #
+    # Imports the table and builds the indices, on first use
+    #
+    def _load(self):
+        if self._rows is not None:
+            return
+        t = importlib.import_module(self._table)
+        self._version = t.VERSION
+        self._names = t.NAMES
+        self._units = t.UNITS
+        rows = t.DATA
+
+        index = {}
+        for i, n in enumerate(self._names):
+            index[n] = i
+            index[n.lower()] = i
+            index[identifier(n)] = i
+        for a, n in ALIASES.items():
+            if n in index:
+                index[a] = index[n]
+        self._index = index
+
+        grams = {}
+        for i, n in enumerate(self._names):
+            n = n.lower()
+            for j in range(len(n) - 2):
+                grams.setdefault(n[j:j + 3], set()).add(i)
+        self._grams = grams
+        self._rows = rows
+
+    def _row(self, name: str) -> int:
+        self._load()
+        i = self._index.get(name)
+        if i is None:
+            i = self._index.get(name.lower())
+        assert(i is not None), f"{name} is not a constant in {self._version}, see search()"
+        return i
+
+    ##########################
+    # get (and [], and attributes)
+    #
+    def get(self, name: str) -> SciData:
+        '''The SciData of a constant, by name, identifier, or alias'''
+        i = self._row(name)
+        x = self._cache.get(i)
+        if x is None:
+            v, vs, ve, u, us, ue, r, rs, re_, exact = self._rows[i]
+            x = SciData(value = SigFig(v, vs, ve),
+                        unc = None if exact else SigFig(u, us, ue),
+                        rel_unc = None if exact else SigFig(r, rs, re_),
+                        is_exact = exact)
+            self._cache[i] = x
+        return x
+
+    def __getitem__(self, name: str) -> SciData:
+        return self.get(name)
+
+    def __getattr__(self, name: str) -> SciData:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self.get(name)
+        except AssertionError as e:
+            raise AttributeError(str(e)) from None
+
+    def __contains__(self, name: str) -> bool:
+        self._load()
+        return name in self._index or name.lower() in self._index
+
+    def __len__(self):
+        self._load()
+        return len(self._names)
+
+    def __dir__(self):
+        self._load()
+        return sorted(set(object.__dir__(self)) | {identifier(n) for n in self._names} | set(ALIASES))
+
+    ##########################
+    # version, names, unit
+    #
+    @property
+    def version(self) -> str:
+        '''The CODATA adjustment of the table'''
+        self._load()
+        return self._version
+
+    def names(self):
+        '''Names of every constant'''
+        self._load()
+        return list(self._names)
+
+    def unit(self, name: str) -> str:
+        '''Unit of a constant, as written in the NIST listing ("" if dimensionless)'''
+        return self._units[self._row(name)]
+
+    ##########################
+    # search
+    #
+    # Names containing the given substring (ignoring case), in table order
+    #
+    def search(self, s: str):
+        '''Names of the constants containing a substring'''
+        self._load()
+        s = s.lower()
+        if len(s) < 3:
+            candidates = range(len(self._names))
+        else:
+            sets = [self._grams.get(s[j:j + 3], set()) for j in range(len(s) - 2)]
+            candidates = sorted(set.intersection(*sets))
+        return [self._names[i] for i in candidates if s in self._names[i].lower()]
+
+#the default registry
+constants = ConstantsRegistry()
@@ -0,0 +1,96 @@
+# codata_gen.py
+#
+# Generates the table of codata.py (_codata_table.py) from the NIST ASCII listing
+# of the CODATA recommended values, https://physics.nist.gov/cuu/Constants/Table/allascii.txt
+# which must be downloaded separately. Every value is parsed with SciData.from_str
+# here, once, so that the table holds exactly what from_str would produce.
+#
+# Usage:
+#   python -m standard_scientific.codata_gen allascii.txt [output.py]
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.scidata import SciData
+
+#external imports
+import os
+import re
+import sys
+
+#################################################################################
+# parse_listing
+#
+# Reads the NIST ASCII listing, where each constant is a line of
+#
+#   name   value   uncertainty   unit
+#
+# separated by at least two spaces, e.g.
+#
+#   Newtonian constant of gravitation     6.674 30 e-11    0.000 15 e-11    m^3 kg^-1 s^-2
+#   speed of light in vacuum              299 792 458      (exact)          m s^-1
+#
+# Values truncated with "..." are exact, and are kept to the digits given.
+#
+def _concise(value: str, unc: str) -> str:
+    '''The listing's value and uncertainty in the concise form read by SciData.from_str'''
+    value = value.replace("...", "")
+    mant, _, exp = value.partition("e")
+    if unc == "(exact)":
+        return value
+    umant, _, uexp = unc.partition("e")
+    assert(uexp.strip() == exp.strip()), f"Value {value} and uncertainty {unc} have different exponents"
+    digits = re.sub(r"^[0.\s]*", "", umant).replace(" ", "").replace(".", "")
+    return f"{mant.strip()}({digits})" + (f"e{exp.strip()}" if exp else "")
+
+def parse_listing(text: str):
+    '''Parse the NIST ASCII listing into a list of (name, SciData, unit)'''
+    out = []
+    started = False
+    for line in text.splitlines():
+        if line.startswith("-----"):
+            started = True
+            continue
+        if not started or not line.strip():
+            continue
+        cols = re.split(r"\s{2,}", line.strip())
+        assert(len(cols) in (3, 4)), f"Could not split the line: {line}"
+        name, value, unc = cols[:3]
+        unit = cols[3] if len(cols) == 4 else ""
+        out.append((name, SciData.from_str(_concise(value, unc)), unit))
+    return out
+
+def _row(x: SciData):
+    if x.is_exact:
+        return (x.value.value, x.value.sigfigs, x.value.exponent, 0., 0, 0, 0., 0, 0, True)
+    return (x.value.value, x.value.sigfigs, x.value.exponent,
+            x.unc.value, x.unc.sigfigs, x.unc.exponent,
+            x.rel_unc.value, x.rel_unc.sigfigs, x.rel_unc.exponent, False)
+
+def write_table(text: str, path: str):
+    '''Write the table module of the constants in a NIST ASCII listing'''
+    m = re.search(r"(\d{4}) CODATA", text)
+    version = f"CODATA {m.group(1)}" if m else "CODATA"
+    consts = parse_listing(text)
+    with open(path, "w") as f:
+        f.write("# _codata_table.py\n#\n")
+        f.write(f"# {version} recommended values of the fundamental physical constants,\n")
+        f.write("# generated from the NIST ASCII listing by codata_gen.py. DO NOT EDIT.\n#\n")
+        f.write("# DATA holds, for every constant, the fields of its SciData:\n")
+        f.write("#   (value, sigfigs, exponent, unc, unc_sigfigs, unc_exponent,\n")
+        f.write("#    rel_unc, rel_unc_sigfigs, rel_unc_exponent, is_exact)\n#\n\n")
+        f.write(f"VERSION = {version!r}\n\n")
+        f.write("NAMES = (\n" + "".join(f"    {n!r},\n" for n, _, _ in consts) + ")\n\n")
+        f.write("UNITS = (\n" + "".join(f"    {u!r},\n" for _, _, u in consts) + ")\n\n")
+        f.write("DATA = (\n" + "".join(f"    {_row(x)!r},\n" for _, x, _ in consts) + ")\n")
+
+#################################################################################
+# main
+#
+if __name__ == "__main__":
+    assert(len(sys.argv) in (2, 3)), f"usage: python -m standard_scientific.codata_gen allascii.txt [output.py]"
+    out = sys.argv[2] if len(sys.argv) == 3 else os.path.join(os.path.dirname(__file__), "_codata_table.py")
+    with open(sys.argv[1]) as f:
+        write_table(f.read(), out)
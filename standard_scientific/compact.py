@@ -0,0 +1,235 @@
+# compact.py
+#
+# SigFigArray and SciDataArray stored in the narrowest dtypes that hold
+# their data exactly, rather than as float64 values and int64 sigfigs and
+# exponents (24 bytes per sigfig).
+#
+# A value rounded to its sigfig place is a decimal mantissa times a power of
+# ten, value = m * 10**(exponent + 1 - sigfigs), and the mantissa has (at
+# most) sigfigs digits. The values are stored as these integer mantissas:
+# int16 when every element has at most 4 sigfigs, int32 for at most 9, and
+# float64 otherwise. float32 is not used, as it cannot hold decimal values
+# (such as 1.23) exactly, while the mantissas can. The sigfigs and
+# exponents are stored as int8 (or int16 for exponents beyond +/-127). A
+# SigFigArray of 3-4 sigfig values then takes 4 bytes per element, and of 5-9
+# sigfigs, 6 bytes, rather than 24.
+#
+#   c = si.CompactArray.compact(x)        #x is a SigFigArray or SciDataArray
+#   print(c.report())                     #the dtypes and the memory saved
+#   x = c.expand()                        #back to float64 and int64
+#
+# Compaction never loses information. The value of every element is
+# recomputed from its mantissa as round_array does (the mantissa divided by
+# an exact power of ten), and is compared bit for bit with the original;
+# should any element of a column differ (such as values that are not rounded
+# to their sigfig place, or -0.), the whole column is kept as float64.
+#
+# Upcasting is explicit: expand() gives back the float64 array, and the
+# arithmetic operators (and map) expand their operands, compute in float64
+# exactly as the arrays do, and compact the result. The results are
+# therefore identical to those of the float64 arrays.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.sigfig_array import POW10, POW10_MIN, POW10_EXACT
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import as_array
+from standard_scientific.shared import LAYOUTS, array_columns, array_from_views
+
+#external imports
+from dataclasses import dataclass
+import operator
+import numpy as np
+
+#the integer dtypes tried for each kind of column, narrowest first
+_MANTISSAS = (np.int16, np.int32)
+_COUNTS = (np.int8, np.int16, np.int64)
+
+#################################################################################
+# _narrowest
+#
+# The narrowest of the integer dtypes that holds every element of the array a
+#
+def _narrowest(a, dtypes):
+    if a.size == 0:
+        return dtypes[0]
+    lo, hi = int(a.min()), int(a.max())
+    for d in dtypes:
+        if np.iinfo(d).min <= lo and hi <= np.iinfo(d).max:
+            return d
+    return None
+
+#################################################################################
+# _places and _decode
+#
+# The decimal place (sigfigs - 1 - exponent) of every element, and the
+# values of mantissas with those places (nan where missing)
+#
+def _places(sigfigs, exponent):
+    return np.where(sigfigs == 0, 0, sigfigs.astype(np.int64) - 1 - exponent)
+
+def _decode(m, sigfigs, exponent):
+    d = _places(sigfigs, exponent)
+    p = POW10[np.abs(d) - POW10_MIN]
+    v = np.where(d >= 0, m / p, m * p)
+    return np.where(sigfigs == 0, np.nan, v)
+
+#################################################################################
+# _encode
+#
+# The mantissas of a column of values (in the narrowest dtype), or the values
+# themselves if they cannot be recovered exactly from any mantissa
+#
+def _encode(v, sigfigs, exponent):
+    d = _places(sigfigs, exponent)
+    missing = sigfigs == 0
+    if not np.all(np.abs(d) <= POW10_EXACT) or not np.all(np.isfinite(v) | missing):
+        return v
+    p = POW10[np.abs(d) - POW10_MIN]
+    m = np.rint(np.where(missing, 0., np.where(d >= 0, v * p, v / p)))
+    dtype = _narrowest(m, _MANTISSAS)
+    if dtype is None:
+        return v
+    m = m.astype(dtype)
+    back = _decode(m, sigfigs, exponent)
+    same = np.where(missing, np.isnan(v), back.view(np.uint64) == v.view(np.uint64))
+    return m if np.all(same) else v
+
+#################################################################################
+# MemoryReport
+#
+# The memory used by an array stored as float64 and int64, and compacted
+#
+@dataclass
+class MemoryReport:
+    '''Memory used by a CompactArray, and by the same array uncompacted'''
+    kind: str
+    length: int
+    nbytes: int
+    compact_nbytes: int
+    dtypes: list
+
+    @property
+    def saved(self) -> int:
+        return self.nbytes - self.compact_nbytes
+
+    @property
+    def ratio(self) -> float:
+        return self.nbytes / self.compact_nbytes if self.compact_nbytes > 0 else 1.
+
+    def __str__(self):
+        return (f"{self.kind} of {self.length}: {self.nbytes} bytes as float64, {self.compact_nbytes} compacted "
+                f"({self.saved} saved, {self.ratio:.2f}x) with columns {', '.join(self.dtypes)}")
+
+#################################################################################
+# CompactArray
+#
+#   kind    : "sigfig", "scidata" or "scidata_lazy" (see shared.py)
+#   columns : the columns of the array, in the order of shared.array_columns, with
+#             the values (the first of every three) stored as mantissas
+#             where possible
+#
+@dataclass(eq=False)
+class CompactArray:
+    '''SigFigArray or SciDataArray stored in the narrowest exact dtypes'''
+    kind: str
+    columns: list
+
+    #########################################################
+    # compact
+    #
+    @classmethod
+    def compact(cls, x):
+        '''Compact a SigFigArray or SciDataArray (or sequence of SigFig or SciData)'''
+        if isinstance(x, CompactArray):
+            return x
+        kind, cols = array_columns(as_array(x))
+        out = []
+        for k in range(0, len(cols) - len(cols) % 3, 3):
+            v, sf, e = cols[k:k + 3]
+            sft, et = _narrowest(sf, _COUNTS), _narrowest(e, _COUNTS)
+            out.extend([_encode(v, sf, e), sf.astype(sft), e.astype(et)])
+        if kind != "sigfig":
+            out.append(cols[-1])
+        return cls(kind = kind, columns = out)
+
+    #########################################################
+    # expand
+    # The explicit upcast to a SigFigArray or SciDataArray of float64 and int64
+    #
+    def expand(self):
+        '''The SigFigArray or SciDataArray of float64 values and int64 sigfigs and exponents'''
+        cols = []
+        for k in range(0, len(self.columns) - len(self.columns) % 3, 3):
+            v, sf, e = self.columns[k:k + 3]
+            sf, e = sf.astype(np.int64), e.astype(np.int64)
+            cols.extend([_decode(v, sf, e) if v.dtype.kind == "i" else np.array(v), sf, e])
+        if self.kind != "sigfig":
+            cols.append(np.array(self.columns[-1]))
+        return array_from_views(self.kind, cols)
+
+    @property
+    def dtypes(self) -> list:
+        return [str(c.dtype) for c in self.columns]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(c.nbytes for c in self.columns)
+
+    def report(self) -> MemoryReport:
+        '''The memory used by this array, and saved by compacting it'''
+        n = len(self)
+        full = n * sum(np.dtype(d).itemsize for d in LAYOUTS[self.kind])
+        return MemoryReport(kind = self.kind, length = n, nbytes = full, compact_nbytes = self.nbytes, dtypes = self.dtypes)
+
+    @property
+    def shape(self):
+        return self.columns[0].shape
+
+    def __len__(self):
+        return len(self.columns[0])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            return self[np.array([i])].expand()[0]
+        return CompactArray(kind = self.kind, columns = [c[i] for c in self.columns])
+
+    #########################################################
+    # map
+    # func is applied to the expanded array, and its result compacted
+    #
+    def map(self, func):
+        '''Apply a function to the expanded array, and compact the result'''
+        return CompactArray.compact(func(self.expand()))
+
+    #########################################################
+    # Arithmetic
+    # computed on the expanded (float64) arrays, exactly as for those
+    #
+    def _binary(self, op, other, reverse = False):
+        if other is self:
+            return self.map(lambda x: op(x, x))
+        if isinstance(other, CompactArray):
+            other = other.expand()
+        if reverse:
+            return self.map(lambda x: op(other, x))
+        return self.map(lambda x: op(x, other))
+
+    def __add__(self, other):      return self._binary(operator.add, other)
+    def __radd__(self, other):     return self._binary(operator.add, other, True)
+    def __sub__(self, other):      return self._binary(operator.sub, other)
+    def __rsub__(self, other):     return self._binary(operator.sub, other, True)
+    def __mul__(self, other):      return self._binary(operator.mul, other)
+    def __rmul__(self, other):     return self._binary(operator.mul, other, True)
+    def __truediv__(self, other):  return self._binary(operator.truediv, other)
+    def __rtruediv__(self, other): return self._binary(operator.truediv, other, True)
+    def __neg__(self):             return self.map(operator.neg)
+    def __abs__(self):             return self.map(operator.abs)
@@ -0,0 +1,353 @@
+# conformance.py
+#
+# Differential conformance (and throughput) harness for the fast paths.
+#
+# The scalar routines (exponent_from_float, w_round, SigFig.from_float, the
+# SigFig operators and SciData.from_str) are the reference. Every batch or
+# accelerated implementation of the same operation is run over the same
+# large corpus, and every element whose result differs from the reference
+# (bit for bit, including which roundings are sensitive to machine
+# precision) is reported as a mismatch. Each
+# implementation, the reference included, is timed in the same run.
+#
+#   from standard_scientific import conformance
+#   report = conformance.run(n = 100000)
+#   print(report)                               #throughput, and every mismatch
+#   report.ok
+#
+#   python -m standard_scientific.conformance -n 100000
+#
+# The corpora are random, and adversarial where the README says rounding
+# goes wrong. Every element is tagged with its category:
+#   random    : values spread over every decade
+#   halfway   : the floats nearest to decimal half-way points, at their place
+#   pow10     : powers of ten, and the floats on either side of them
+#   tiny      : near zero, subnormal and smallest normal values (and zero)
+#   strings   : NIST style strings, with grouped digits, uncertainties, and
+#               each of the exponent notations
+#
+# New implementations are added with register(op, name, func), where func
+# takes the inputs of the whole corpus (a tuple of arrays) and returns its
+# outputs (a tuple of arrays, one element per input). The inputs that the
+# reference rejects (such as products that overflow, or strings it cannot
+# parse) are counted, and left out of the corpus of the implementations,
+# which (as for the arrays) may reject their whole input at once.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig, exponent_from_float, w_round
+from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray, exponents_from_floats, w_round_array
+from standard_scientific.parallel import Executor
+
+#external imports
+from dataclasses import dataclass, field
+import argparse
+import operator
+import sys
+import time
+import warnings
+import numpy as np
+
+OPS = ("exponent", "w_round", "from_float", "add", "sub", "mul", "div", "from_str")
+
+#################################################################################
+# Corpora
+#
+# Each returns (inputs, categories), with inputs a tuple of arrays
+#
+def _floats(rng, n: int):
+    k = n // 4
+    m = n - 3 * k
+    cat = np.repeat(np.array(["random", "halfway", "pow10", "tiny"]), [m, k, k, k])
+
+    sign = rng.choice([-1., 1.], n)
+    rand = rng.uniform(1., 10., m) * 10.**rng.integers(-300, 300, m)
+
+    #the place d of the half-way points is kept, for the roundings
+    hd = rng.integers(-6, 12, k)
+    half = (rng.integers(0, 10**6, k) + 0.5) / 10.**hd
+
+    pk = rng.integers(-307, 308, k)
+    pow10 = np.array([float(f"1e{p}") for p in pk])
+    pow10 = np.where(rng.random(k) < 1/3, np.nextafter(pow10, 0.), np.where(rng.random(k) < 0.5, np.nextafter(pow10, np.inf), pow10))
+
+    tiny = np.concatenate([rng.integers(1, 1000, k - k // 2) * 5e-324,
+                           rng.uniform(0.5, 2., k // 2) * 2.2250738585072014e-308])
+    tiny[rng.random(k) < 0.05] = 0.
+
+    x = sign * np.concatenate([rand, half, pow10, tiny])
+    places = np.concatenate([np.full(m, np.iinfo(np.int64).min), hd, np.full(2 * k, np.iinfo(np.int64).min)])
+    return x, places, cat
+
+def _sigfigs(rng, x, places):
+    #at the half-way place where there is one, or else 1-15 sigfigs
+    sf = rng.integers(1, 16, len(x))
+    given = places != np.iinfo(np.int64).min
+    return np.where(given, np.maximum(1, exponents_from_floats(x) + 1 + places), sf)
+
+def _strings(rng, n: int):
+    out = []
+    for _ in range(n):
+        digits = "".join(str(d) for d in rng.integers(0, 10, int(rng.integers(1, 16))))
+        lead = str(int(rng.integers(1, 10)))
+        frac = " ".join(digits[i:i + 3] for i in range(0, len(digits), 3))
+        s = f"{rng.choice(['', '-', '+'])}{lead}.{frac}"
+        if rng.random() < 0.7:
+            s += f"({int(rng.integers(1, 100))})"
+        notation = rng.choice(["", " e", "E", " x10^", "x10**", " x 10"])
+        if notation:
+            s += f"{notation}{int(rng.integers(-40, 40))}"
+        out.append(s)
+    return np.array(out, dtype = object)
+
+def corpus(op: str, n: int = 10000, seed: int = 0):
+    '''The randomized and adversarial inputs (and their categories) of an operation'''
+    assert(op in OPS), f"op must be one of {OPS}, not {op}"
+    rng = np.random.default_rng(seed)
+    if op == "from_str":
+        return (_strings(rng, n),), np.full(n, "strings")
+    x, places, cat = _floats(rng, n)
+    if op == "exponent":
+        return (x,), cat
+    sf = _sigfigs(rng, x, places)
+    if op == "w_round":
+        return (x, sf - 1 - exponents_from_floats(x)), cat
+    if op == "from_float":
+        return (x, sf), cat
+    #the other operand is random, and of a similar size for add and sub
+    y = _floats(rng, n)[0]
+    y = y[rng.permutation(n)]
+    if op in ("add", "sub"):
+        y = x * rng.uniform(-2., 2., n)
+    ysf = rng.integers(1, 16, n)
+    return (x, sf, y, ysf), cat
+
+#################################################################################
+# Reference (scalar) implementations
+#
+# func of one element of the inputs, returning a tuple of its outputs
+#
+def _sensitive(func, *args):
+    with warnings.catch_warnings(record = True) as caught:
+        warnings.simplefilter("always")
+        r = func(*args)
+    return r, len(caught) > 0
+
+def _ref_exponent(x):
+    return (exponent_from_float(x),)
+
+def _ref_w_round(x, d):
+    return _sensitive(w_round, x, d)
+
+def _sigfig(s: SigFig):
+    return (s.value, s.sigfigs, s.exponent)
+
+def _ref_from_float(x, sf):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return _sigfig(SigFig.from_float(x, sf))
+
+def _ref_binary(op):
+    def func(x, sf, y, ysf):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return _sigfig(op(SigFig.from_float(x, sf), SigFig.from_float(y, ysf)))
+    return func
+
+def _ref_from_str(s):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        d = SciData.from_str(s)
+    unc = (np.nan, 0, 0) if d.is_exact else _sigfig(d.unc)
+    return _sigfig(d.value) + unc + (d.is_exact,)
+
+REFERENCES = {
+    "exponent": _ref_exponent,
+    "w_round": _ref_w_round,
+    "from_float": _ref_from_float,
+    "add": _ref_binary(operator.add),
+    "sub": _ref_binary(operator.sub),
+    "mul": _ref_binary(operator.mul),
+    "div": _ref_binary(operator.truediv),
+    "from_str": _ref_from_str,
+}
+
+#################################################################################
+# Batch implementations
+#
+def _columns(x: SigFigArray):
+    return (x.value, x.sigfigs, x.exponent)
+
+def _quiet(func):
+    def quiet(*args):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return func(*args)
+    return quiet
+
+def _batch_binary(op):
+    return _quiet(lambda x, sf, y, ysf: _columns(op(SigFigArray.from_floats(x, sf), SigFigArray.from_floats(y, ysf))))
+
+def _parse_chunk(s):
+    from standard_scientific.convert import parse_chunk
+    x = parse_chunk(list(enumerate(s)))[0]
+    return _columns(x.value) + _columns(x.unc) + (x.is_exact,)
+
+def _compacted(x):
+    from standard_scientific.compact import CompactArray
+    return CompactArray.compact(x).expand()
+
+def _parallel():
+    return Executor(workers = 4, chunk_size = 1000)
+
+IMPLEMENTATIONS = {
+    "exponent": {"exponents_from_floats": lambda x: (exponents_from_floats(x),)},
+    "w_round": {"w_round_array": _quiet(lambda x, d: w_round_array(x, d, mask = True)),
+                "Executor.map": _quiet(lambda x, d: _parallel().map(lambda a, b: w_round_array(a, b, mask = True), x, d))},
+    "from_float": {"SigFigArray.from_floats": _quiet(lambda x, sf: _columns(SigFigArray.from_floats(x, sf))),
+                   "Executor.from_floats": _quiet(lambda x, sf: _columns(_parallel().from_floats(x, sf))),
+                   "CompactArray": _quiet(lambda x, sf: _columns(_compacted(SigFigArray.from_floats(x, sf))))},
+    "add": {"SigFigArray.__add__": _batch_binary(operator.add)},
+    "sub": {"SigFigArray.__sub__": _batch_binary(operator.sub)},
+    "mul": {"SigFigArray.__mul__": _batch_binary(operator.mul)},
+    "div": {"SigFigArray.__truediv__": _batch_binary(operator.truediv)},
+    "from_str": {"convert.parse_chunk": _parse_chunk},
+}
+
+def register(op: str, name: str, func):
+    '''Add an implementation of an operation, to be checked against the reference'''
+    assert(op in OPS), f"op must be one of {OPS}, not {op}"
+    IMPLEMENTATIONS[op][name] = func
+
+#################################################################################
+# Results
+#
+@dataclass
+class Mismatch:
+    '''An element on which an implementation differs from the reference'''
+    index: int
+    category: str
+    inputs: tuple
+    expected: object
+    got: object
+
+@dataclass
+class Result:
+    '''The mismatches and throughput of one implementation of one operation'''
+    op: str
+    name: str
+    n: int
+    seconds: float
+    mismatches: list = field(default_factory = list)
+    error: str = None
+    rejected: int = 0
+
+    @property
+    def per_second(self) -> float:
+        return self.n / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and len(self.mismatches) == 0
+
+@dataclass
+class ConformanceReport:
+    '''The results of every implementation, the references included'''
+    results: list
+
+    @property
+    def ok(self) -> bool:
+        return all(r.ok for r in self.results)
+
+    @property
+    def mismatches(self) -> list:
+        return [(r.op, r.name, m) for r in self.results for m in r.mismatches]
+
+    def __str__(self):
+        lines = [f"{'op':12s} {'implementation':28s} {'n':>8s} {'per second':>12s} {'speedup':>8s} {'mismatches':>10s} {'rejected':>8s}"]
+        reference = {r.op: r for r in self.results if r.name == "reference"}
+        for r in self.results:
+            speedup = reference[r.op].seconds / r.seconds if r.seconds > 0 else float("inf")
+            status = r.error if r.error is not None else str(len(r.mismatches))
+            lines.append(f"{r.op:12s} {r.name:28s} {r.n:8d} {r.per_second:12.4g} {speedup:8.1f} {status:>10s} {r.rejected:8d}")
+        for r in self.results:
+            for m in r.mismatches:
+                lines.append(f"{r.op} {r.name} [{m.index}, {m.category}] {m.inputs}: expected {m.expected}, got {m.got}")
+        return "\n".join(lines)
+
+#################################################################################
+# run
+#
+def _same(a, b) -> bool:
+    if isinstance(a, float) or isinstance(b, float):
+        a, b = float(a), float(b)
+        return (np.isnan(a) and np.isnan(b)) or (a == b and np.signbit(a) == np.signbit(b))
+    return a == b
+
+def _reference(op, inputs):
+    func = REFERENCES[op]
+    out = []
+    for args in zip(*inputs):
+        try:
+            out.append(tuple(func(*args)))
+        except Exception as e:
+            out.append(type(e).__name__)
+    return out
+
+def _compare(op, name, inputs, index, cat, expected, func, limit) -> Result:
+    n = len(expected)
+    t = time.perf_counter()
+    try:
+        got = func(*inputs)
+    except Exception as e:
+        return Result(op, name, n, time.perf_counter() - t, error = f"{type(e).__name__}: {e}")
+    seconds = time.perf_counter() - t
+    result = Result(op, name, n, seconds)
+    got = [np.asarray(g) for g in got]
+    for i in range(n):
+        e = expected[i]
+        g = tuple(g[i].item() for g in got)
+        if len(e) != len(g) or not all(_same(u, v) for u, v in zip(e, g)):
+            if len(result.mismatches) < limit:
+                result.mismatches.append(Mismatch(int(index[i]), str(cat[i]), tuple(a[i] for a in inputs), e, g))
+            else:
+                break
+    return result
+
+def run(ops = OPS, n: int = 10000, seed: int = 0, limit: int = 100) -> ConformanceReport:
+    '''Check every implementation of the operations against the scalar reference, and time them'''
+    results = []
+    for op in ops:
+        inputs, cat = corpus(op, n, seed)
+        t = time.perf_counter()
+        expected = _reference(op, inputs)
+        valid = np.array([not isinstance(e, str) for e in expected], dtype = bool)
+        results.append(Result(op, "reference", n, time.perf_counter() - t, rejected = int((~valid).sum())))
+
+        index = np.nonzero(valid)[0]
+        inputs, cat = tuple(a[valid] for a in inputs), cat[valid]
+        expected = [e for e in expected if not isinstance(e, str)]
+        for name, func in IMPLEMENTATIONS[op].items():
+            results.append(_compare(op, name, inputs, index, cat, expected, func, limit))
+    return ConformanceReport(results)
+
+#################################################################################
+# main
+#
+def main(argv = None) -> int:
+    parser = argparse.ArgumentParser(prog = "python -m standard_scientific.conformance",
+                                     description = "Check the batch implementations against the scalar reference")
+    parser.add_argument("-n", type = int, default = 10000, help = "number of inputs per operation (default: 10000)")
+    parser.add_argument("--seed", type = int, default = 0, help = "seed of the corpora (default: 0)")
+    parser.add_argument("--op", action = "append", choices = OPS, help = "operation to check (default: all)")
+    args = parser.parse_args(argv)
+    report = run(args.op or OPS, args.n, args.seed)
+    print(report)
+    return 0 if report.ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
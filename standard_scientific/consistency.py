@@ -0,0 +1,163 @@
+# consistency.py
+#
+# Statistical consistency of sets of SciData. SciData.__eq__ is a strict
+# comparison of sigfigs; the question asked of repeated measurements is
+# rather whether they agree within k combined standard uncertainties, by the
+# z-score
+#
+#   z = |a - b| / sqrt(u_a**2 + u_b**2)
+#
+# of every pair of them (the measurements are taken to be independent).
+#
+#   consistency_matrix(x, k=None) : the N x N z-scores (or z <= k, if k is given)
+#   inconsistent_pairs(x, k)      : only the pairs (i < j) with z > k
+#   birge_ratio(x)                : the weighted mean, chi**2 and Birge ratio
+#
+# How this works. The matrix is computed in square blocks of block_size rows
+# and columns, which fit in cache, and inconsistent_pairs keeps only the
+# (usually few) pairs found in each block, so that its memory is that of one
+# block and of the result, rather than N**2 (N = 10**5 is 10**10 pairs).
+#
+# Exact elements have an uncertainty of zero, so two exact elements have a
+# z-score of zero if they are equal and inf if not. Pairs with a missing
+# element have a z-score of nan, and are never inconsistent.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.scidata import SciData
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import as_array
+from standard_scientific.propagation import propagated_SciData
+
+#external imports
+from dataclasses import dataclass
+import numpy as np
+
+#default number of rows (and columns) of a block, 512 x 512 doubles is 2 MB
+BLOCK_SIZE = 512
+
+#################################################################################
+# _columns
+#
+# The values, variances and validity (non-missing) of the elements
+#
+def _columns(x):
+    x = as_array(x)
+    assert(isinstance(x, SciDataArray)), f"{x} was not a SciDataArray or sequence of SciData"
+    valid = ~x.value.is_missing()
+    value = np.where(valid, x.value.value, 0.)
+    var = np.where(valid & ~x.is_exact, x.unc.value, 0.) ** 2
+    return value, var, valid
+
+#z-scores of the block of rows i0:i1 and columns j0:j1
+def _block(value, var, valid, i0, i1, j0, j1):
+    diff = np.abs(value[i0:i1, None] - value[None, j0:j1])
+    s = np.sqrt(var[i0:i1, None] + var[None, j0:j1])
+    with np.errstate(divide = "ignore", invalid = "ignore"):
+        z = diff / s
+    z[s == 0.] = np.where(diff[s == 0.] == 0., 0., np.inf)
+    z[~(valid[i0:i1, None] & valid[None, j0:j1])] = np.nan
+    return z
+
+#################################################################################
+# consistency_matrix
+#
+#   x          : SciDataArray (or sequence of SciData)
+#   k          : if given, the boolean matrix of z <= k is returned
+#   block_size : rows and columns computed at once
+#
+def consistency_matrix(x, k: float = None, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    '''Matrix of the z-scores of every pair of elements (or whether they are within k)'''
+    assert(block_size > 0), f"block_size must be positive, not {block_size}"
+    assert(k is None or k >= 0), f"k must not be negative, not {k}"
+    value, var, valid = _columns(x)
+    n = len(value)
+    out = np.empty((n, n), dtype = np.float64 if k is None else np.bool_)
+    for i0 in range(0, n, block_size):
+        i1 = min(n, i0 + block_size)
+        for j0 in range(0, n, block_size):
+            j1 = min(n, j0 + block_size)
+            z = _block(value, var, valid, i0, i1, j0, j1)
+            out[i0:i1, j0:j1] = z if k is None else z <= k
+    return out
+
+#################################################################################
+# inconsistent_pairs
+#
+# Returns (i, j, z), the arrays of the indices (i < j) and z-scores of the
+# pairs with z > k, in order of i then j. Only the blocks on or above the
+# diagonal are computed.
+#
+def inconsistent_pairs(x, k: float = 2., block_size: int = BLOCK_SIZE):
+    '''Pairs of elements that disagree by more than k combined standard uncertainties'''
+    assert(block_size > 0), f"block_size must be positive, not {block_size}"
+    assert(k >= 0), f"k must not be negative, not {k}"
+    value, var, valid = _columns(x)
+    n = len(value)
+    found_i, found_j, found_z = [], [], []
+    for i0 in range(0, n, block_size):
+        i1 = min(n, i0 + block_size)
+        rows_i, rows_j, rows_z = [], [], []
+        for j0 in range(i0, n, block_size):
+            j1 = min(n, j0 + block_size)
+            z = _block(value, var, valid, i0, i1, j0, j1)
+            with np.errstate(invalid = "ignore"):
+                bad = z > k
+            if j0 == i0:
+                bad &= np.triu(np.ones(bad.shape, dtype = np.bool_), 1)
+            bi, bj = np.nonzero(bad)
+            rows_i.append(bi + i0)
+            rows_j.append(bj + j0)
+            rows_z.append(z[bi, bj])
+        #order the pairs of this band of rows by i then j
+        bi, bj, bz = np.concatenate(rows_i), np.concatenate(rows_j), np.concatenate(rows_z)
+        order = np.lexsort((bj, bi))
+        found_i.append(bi[order])
+        found_j.append(bj[order])
+        found_z.append(bz[order])
+    if n == 0:
+        return np.empty(0, dtype = np.int64), np.empty(0, dtype = np.int64), np.empty(0)
+    return np.concatenate(found_i), np.concatenate(found_j), np.concatenate(found_z)
+
+#################################################################################
+# ConsistencySummary
+#
+# The weighted (by inverse variance) mean of a set of measurements of the
+# same quantity, with
+#   chi2        : sum of ((x_i - mean) / u_i)**2
+#   dof         : number of measurements - 1
+#   birge_ratio : sqrt(chi2 / dof), which is about 1 for consistent
+#                 measurements, and larger if their uncertainties are too small
+#
+@dataclass
+class ConsistencySummary:
+    '''Weighted mean, chi**2 and Birge ratio of a set of measurements'''
+    mean: SciData
+    chi2: float
+    dof: int
+    birge_ratio: float
+
+#################################################################################
+# birge_ratio
+#
+# The elements must be inexact, and missing elements are skipped. The
+# uncertainty of the mean is 1/sqrt(sum of 1/u_i**2), with the smallest
+# number of sigfigs of the uncertainties (as in propagation.py).
+#
+def birge_ratio(x) -> ConsistencySummary:
+    '''Weighted mean, chi**2 and Birge ratio of measurements of the same quantity'''
+    x = as_array(x)
+    value, var, valid = _columns(x)
+    assert(not np.any(x.is_exact[valid])), "The Birge ratio is undefined for exact elements"
+    assert(np.count_nonzero(valid) > 1), "The Birge ratio requires at least two elements"
+    value, var = value[valid], var[valid]
+    w = 1. / var
+    mean = float(np.sum(w * value) / np.sum(w))
+    chi2 = float(np.sum(w * (value - mean) ** 2))
+    dof = len(value) - 1
+    usf = int(np.min(x.unc.sigfigs[valid]))
+    return ConsistencySummary(mean = propagated_SciData(mean, float(np.sqrt(1. / np.sum(w))), usf),
+                              chi2 = chi2, dof = dof, birge_ratio = float(np.sqrt(chi2 / dof)))
@@ -0,0 +1,243 @@
+# convert.py
+#
+# Streaming conversion of large files of strings in scientific notation
+# (one per line, as read by SciData.from_str) into normalized output:
+#
+#   csv     : text, value, sigfigs, exponent, unc, unc_sigfigs, unc_exponent, is_exact
+#   jsonl   : one object per line, with the same fields
+#   parquet : one column of the Arrow extension type of arrow_ext.py (requires pyarrow)
+#
+# The text field is the normalized string (SciData.__str__) of each row, and
+# the uncertainty fields are empty (null) for exact rows. This is what
+# "python -m standard_scientific" runs, see __main__.py.
+#
+# How this works. The input is read chunk_size lines at a time, and each chunk
+# is parsed into a SciDataArray (with SciData.from_str, so that the results are
+# exactly those of the scalar class) and written before the next is read, so
+# the memory used does not grow with the size of the file. With workers > 1,
+# chunks are parsed in a process pool, with at most two chunks per worker in
+# flight, and are written in their original order.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.scidata import SciData
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import to_strings
+from standard_scientific.propagation import propagated_SciData
+
+#external imports
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import collections
+import csv
+import sys
+import time
+import warnings
+import numpy as np
+
+FORMATS = ("csv", "jsonl", "parquet")
+
+#default number of lines parsed at once
+CHUNK_SIZE = 1 << 14
+
+_FIELDS = ["text", "value", "sigfigs", "exponent", "unc", "unc_sigfigs", "unc_exponent", "is_exact"]
+
+#################################################################################
+# ConvertStats
+#
+@dataclass
+class ConvertStats:
+    '''Throughput statistics of a conversion'''
+    rows: int = 0
+    skipped: int = 0
+    bytes_read: int = 0
+    seconds: float = 0.
+    precision_warnings: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_read / 1e6 / self.seconds if self.seconds > 0 else 0.
+
+    def __str__(self):
+        return (f"{self.rows} rows ({self.skipped} skipped) in {self.seconds:.3f} s : "
+                f"{self.rows_per_second:.0f} rows/s, {self.mb_per_second:.2f} MB/s, "
+                f"{self.precision_warnings} precision warnings"
+                + (f", {self.cache_hits} of {self.cache_hits + self.cache_misses} chunks cached"
+                   if self.cache_hits + self.cache_misses > 0 else ""))
+
+#################################################################################
+# parse_chunk
+#
+# Parses a list of (line number, string) into a SciDataArray, returning
+# (array, number of precision warnings, number of skipped lines). Invalid
+# strings raise a ValueError giving their line number, unless skip is True.
+#
+# With unc_sigfigs, the uncertainties of inexact rows are rounded to that
+# many sigfigs, and their values to the last place of the uncertainty (as
+# propagate() does).
+#
+def parse_chunk(lines, unc_sigfigs: int = None, skip: bool = False):
+    '''Parse a chunk of numbered lines into a SciDataArray'''
+    data = []
+    skipped = 0
+    with warnings.catch_warnings(record = True) as caught:
+        warnings.simplefilter("always")
+        for n, s in lines:
+            try:
+                d = SciData.from_str(s)
+            except (AssertionError, ValueError) as e:
+                if not skip:
+                    raise ValueError(f"line {n}: could not parse {s!r} ({e})") from None
+                skipped += 1
+                continue
+            if unc_sigfigs is not None and not d.is_exact:
+                d = propagated_SciData(d.value.value, d.unc.value, int(unc_sigfigs))
+            data.append(d)
+
+    nwarn = sum(1 for w in caught if issubclass(w.category, UserWarning))
+    return SciDataArray.from_SciData(data), nwarn, skipped
+
+#parse_chunk of a tuple of its arguments, for ProcessPoolExecutor.submit
+def parse_task(task):
+    '''parse_chunk(*task)'''
+    return parse_chunk(*task)
+
+#################################################################################
+# Writers
+#
+# Each writes an iterable of SciDataArray chunks to an open file (or path,
+# for parquet)
+#
+def _rows(x: SciDataArray):
+    unc = np.where(x.is_exact, np.nan, x.unc.value)
+    return zip(to_strings(x), x.value.value.tolist(), x.value.sigfigs.tolist(), x.value.exponent.tolist(),
+               unc.tolist(), x.unc.sigfigs.tolist(), x.unc.exponent.tolist(), x.is_exact.tolist())
+
+def _write_csv(out, chunks):
+    w = csv.writer(out, lineterminator = "\n")
+    w.writerow(_FIELDS)
+    for x in chunks:
+        w.writerows([t, repr(v), s, e, "", "", "", True] if exact else
+                    [t, repr(v), s, e, repr(u), us, ue, False]
+                    for t, v, s, e, u, us, ue, exact in _rows(x))
+
+def _write_jsonl(out, chunks):
+    for x in chunks:
+        out.write("".join(
+            f'{{"text": "{t}", "value": {v!r}, "sigfigs": {s}, "exponent": {e}, '
+            + ('"unc": null, "unc_sigfigs": null, "unc_exponent": null, "is_exact": true}\n' if exact else
+               f'"unc": {u!r}, "unc_sigfigs": {us}, "unc_exponent": {ue}, "is_exact": false}}\n')
+            for t, v, s, e, u, us, ue, exact in _rows(x)))
+
+def _write_parquet(out, chunks, column: str):
+    from standard_scientific.arrow_ext import write_parquet, parquet_schema
+    write_parquet(out, ({column: x} for x in chunks), schema = parquet_schema({column: SciDataArray}))
+
+#################################################################################
+# _numbered_chunks
+#
+# Yields lists of up to chunk_size (line number, string) of the non-blank
+# lines of f, counting the bytes read (of their UTF-8 encoding)
+#
+def _numbered_chunks(f, chunk_size: int, stats: "ConvertStats"):
+    chunk = []
+    for n, line in enumerate(f, 1):
+        stats.bytes_read += len(line.encode())
+        s = line.strip()
+        if s:
+            chunk.append((n, s))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+#parsed chunks in their original order, with at most two per worker in flight
+def _parsed(tasks, workers: int):
+    if workers == 1:
+        for t in tasks:
+            yield parse_task(t)
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        pending = collections.deque()
+        for t in tasks:
+            pending.append(pool.submit(parse_task, t))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+#################################################################################
+# convert
+#
+#   src         : path of the input, an open text file, or "-" for stdin
+#   dst         : path of the output, an open file, or "-" for stdout
+#   fmt         : one of FORMATS
+#   chunk_size  : number of lines parsed at once
+#   workers     : number of processes parsing chunks (1 parses in this process)
+#   unc_sigfigs : if given, the uncertainties are rounded to this many sigfigs
+#   skip        : skip invalid lines, rather than raising a ValueError
+#   column      : name of the column, for parquet
+#   cache       : a ParseCache (or the path of one), from which the chunks
+#                 that did not change since they were last parsed are read,
+#                 see parse_cache.py. The chunks are then split by content,
+#                 with about chunk_size lines each
+#
+# Returns the ConvertStats of the conversion
+#
+def convert(src, dst, fmt: str = "csv", chunk_size: int = CHUNK_SIZE, workers: int = 1,
+            unc_sigfigs: int = None, skip: bool = False, column: str = "data", cache = None) -> ConvertStats:
+    '''Stream a file of strings in scientific notation into normalized csv, jsonl or parquet'''
+    assert(fmt in FORMATS), f"Format {fmt} is not one of {FORMATS}"
+    assert(chunk_size > 0), f"chunk_size must be positive, not {chunk_size}"
+    assert(workers > 0), f"workers must be positive, not {workers}"
+    assert(unc_sigfigs is None or unc_sigfigs > 0), f"unc_sigfigs must be positive, not {unc_sigfigs}"
+
+    stats = ConvertStats()
+    start = time.perf_counter()
+
+    fin = sys.stdin if src == "-" else src if hasattr(src, "read") else open(src, "r")
+    if fmt == "parquet":
+        fout = sys.stdout.buffer if dst == "-" else dst
+    else:
+        fout = sys.stdout if dst == "-" else dst if hasattr(dst, "write") else open(dst, "w", newline = "")
+
+    if cache is not None:
+        from standard_scientific.parse_cache import ParseCache
+        cache = cache if isinstance(cache, ParseCache) else ParseCache(cache)
+
+    def chunks():
+        if cache is not None:
+            parsed = cache.chunks(fin, chunk_size, unc_sigfigs, skip, workers, stats)
+        else:
+            parsed = _parsed(((c, unc_sigfigs, skip) for c in _numbered_chunks(fin, chunk_size, stats)), workers)
+        for x, nwarn, nskip in parsed:
+            stats.rows += len(x)
+            stats.precision_warnings += nwarn
+            stats.skipped += nskip
+            yield x
+
+    try:
+        if fmt == "parquet":
+            _write_parquet(fout, chunks(), column)
+        elif fmt == "jsonl":
+            _write_jsonl(fout, chunks())
+        else:
+            _write_csv(fout, chunks())
+    finally:
+        if fin is not src and fin is not sys.stdin:
+            fin.close()
+        if fout is not dst and fout not in (sys.stdout, sys.stdout.buffer):
+            fout.close()
+
+    stats.seconds = time.perf_counter() - start
+    return stats
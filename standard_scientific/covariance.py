@@ -0,0 +1,171 @@
+# covariance.py
+#
+# Contains the CovarianceRegistry class, which tracks the correlation
+# coefficients between instances of SciData (such as those published
+# among the CODATA constants) so that they may be used when propagating
+# uncertainties.
+#
+# Correlations are stored sparsely, as a dictionary of the nonzero
+# coefficients of each instance, so that registering thousands of
+# constants never requires a dense n^2 matrix. Instances are tracked by
+# identity, and their entries are dropped when they are garbage collected.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.scidata import SciData
+
+#external imports
+import weakref
+import numpy as np
+
+#################################################################################
+# CovarianceRegistry
+#
+# The registry only stores correlation coefficients, r(a, b), and the covariance
+# is built from the standard uncertainties of the instances when needed
+#
+#   cov(a, b) = r(a, b) * u(a) * u(b)
+#
+# so that the two can never disagree. Exact data has no uncertainty and so
+# cannot be correlated with anything.
+#
+class CovarianceRegistry:
+    '''Sparse registry of the correlations between instances of SciData'''
+
+    def __init__(self):
+        self._corr = {}     # id -> {id: r}
+        self._finalizers = {}
+
+    ##########################
+    # set_correlation
+    #
+    # Registers the correlation coefficient between a and b. Setting
+    # a coefficient of 0 removes the entry, along with the tracking of
+    # instances that are left without any correlations.
+    #
+    def set_correlation(self, a: SciData, b: SciData, r: float):
+        '''Register the correlation coefficient between two instances of SciData'''
+        assert(isinstance(a, SciData) and isinstance(b, SciData)), f"Correlations are only defined between instances of SciData"
+        assert(not a.is_exact and not b.is_exact), f"Exact SciData cannot be correlated"
+        assert(a is not b), f"The correlation of SciData with itself is always 1"
+        r = float(r)
+        assert(-1. <= r <= 1.), f"Correlation coefficient {r} is not between -1 and 1"
+
+        ia, ib = id(a), id(b)
+        if r == 0.:
+            self._discard(ia, ib)
+            self._discard(ib, ia)
+            return
+
+        for x in (a, b):
+            if id(x) not in self._finalizers:
+                self._finalizers[id(x)] = weakref.finalize(x, self._forget, id(x))
+        self._corr.setdefault(ia, {})[ib] = r
+        self._corr.setdefault(ib, {})[ia] = r
+
+    ##########################
+    # set_correlations
+    #
+    # Registers many (a, b, r) coefficients at once
+    #
+    def set_correlations(self, triples):
+        '''Register an iterable of (a, b, r) correlation coefficients'''
+        for a, b, r in triples:
+            self.set_correlation(a, b, r)
+
+    ##########################
+    # correlation, covariance
+    #
+    def correlation(self, a: SciData, b: SciData) -> float:
+        '''Correlation coefficient between two instances of SciData (0 if not registered)'''
+        if a is b:
+            return 0. if a.is_exact else 1.
+        return self._corr.get(id(a), {}).get(id(b), 0.)
+
+    def covariance(self, a: SciData, b: SciData) -> float:
+        '''Covariance between two instances of SciData'''
+        r = self.correlation(a, b)
+        if r == 0.:
+            return 0.
+        return r * a.unc.as_exact() * b.unc.as_exact()
+
+    ##########################
+    # remove
+    #
+    # Drops every correlation of x
+    #
+    def remove(self, x: SciData):
+        '''Remove all registered correlations of x'''
+        f = self._finalizers.pop(id(x), None)
+        if f is not None:
+            f.detach()
+        self._forget(id(x))
+
+    def _forget(self, i: int):
+        for j in self._corr.pop(i, {}):
+            self._discard(j, i)
+        self._finalizers.pop(i, None)
+
+    def _discard(self, i: int, j: int):
+        # drops r(i, j) from the entries of i, and stops tracking i once it
+        # has no correlations left
+        corr = self._corr.get(i)
+        if corr is None:
+            return
+        corr.pop(j, None)
+        if not corr:
+            del self._corr[i]
+            f = self._finalizers.pop(i, None)
+            if f is not None:
+                f.detach()
+
+    ##########################
+    # sparse_correlations
+    #
+    # Returns the nonzero off-diagonal correlation coefficients among the
+    # given data in coordinate form, (rows, cols, r), with rows < cols
+    # indexing into data. The cost is proportional to the number of
+    # registered coefficients of the data, not to len(data)**2.
+    #
+    def sparse_correlations(self, data):
+        '''Nonzero correlations among a sequence of SciData as (rows, cols, r) arrays'''
+        index = {id(x): k for k, x in enumerate(data)}
+        rows, cols, vals = [], [], []
+        for k, x in enumerate(data):
+            for j, r in self._corr.get(id(x), {}).items():
+                l = index.get(j)
+                if l is not None and k < l:
+                    rows.append(k)
+                    cols.append(l)
+                    vals.append(r)
+        return (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64), np.array(vals, dtype=float))
+
+    ##########################
+    # covariance_matrix
+    #
+    # Dense covariance matrix of the given data (only intended for small sets)
+    #
+    def covariance_matrix(self, data):
+        '''Dense covariance matrix among a sequence of SciData'''
+        u = np.array([0. if x.is_exact else x.unc.as_exact() for x in data])
+        rows, cols, r = self.sparse_correlations(data)
+        c = np.diag(u * u)
+        c[rows, cols] = r * u[rows] * u[cols]
+        c[cols, rows] = r * u[rows] * u[cols]
+        return c
+
+    def __len__(self):
+        '''Number of registered pairs'''
+        return sum(len(v) for v in self._corr.values()) // 2
+
+#################################################################################
+# The default registry, used by SciData arithmetic and propagate()
+#
+registry = CovarianceRegistry()
+
+def set_correlation(a: SciData, b: SciData, r: float):
+    '''Register the correlation coefficient between a and b in the default registry'''
+    registry.set_correlation(a, b, r)
@@ -0,0 +1,150 @@
+# dual.py
+#
+# Defines the Dual class, a (multi-component) dual number used for
+# forward-mode differentiation. A Dual carries a value together with its
+# gradient with respect to a fixed set of "seeded" inputs, and every
+# operation updates both with the chain rule. This means the derivatives
+# of an expression are obtained in the same pass that evaluates it.
+#
+# Dual plugs into NumPy through __array_ufunc__, so that a function written
+# with np.exp, np.sin, ... (and the usual operators) can be evaluated on
+# floats, arrays, or Duals without modification.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#external imports
+from dataclasses import dataclass
+import numpy as np
+
+#################################################################################
+# Derivatives of the supported ufuncs
+#
+# Unary ufuncs map to f'(x), given (x, f(x)), and binary ufuncs map to
+# the pair of partial derivatives, given (x, y, f(x,y)). The partial
+# derivatives are only evaluated for arguments that are Dual, so that,
+# for example, x**2 never needs log(x).
+#
+_UNARY = {
+    np.negative : lambda x, f: -np.ones_like(f),
+    np.positive : lambda x, f: np.ones_like(f),
+    np.absolute : lambda x, f: np.sign(x),
+    np.exp      : lambda x, f: f,
+    np.log      : lambda x, f: 1. / x,
+    np.log10    : lambda x, f: 1. / (x * np.log(10.)),
+    np.sqrt     : lambda x, f: 0.5 / f,
+    np.square   : lambda x, f: 2. * x,
+    np.sin      : lambda x, f: np.cos(x),
+    np.cos      : lambda x, f: -np.sin(x),
+    np.tan      : lambda x, f: 1. + f * f,
+    np.arcsin   : lambda x, f: 1. / np.sqrt(1. - x * x),
+    np.arccos   : lambda x, f: -1. / np.sqrt(1. - x * x),
+    np.arctan   : lambda x, f: 1. / (1. + x * x),
+    np.sinh     : lambda x, f: np.cosh(x),
+    np.cosh     : lambda x, f: np.sinh(x),
+    np.tanh     : lambda x, f: 1. - f * f,
+}
+
+_BINARY = {
+    np.add         : (lambda x, y, f: np.ones_like(f),  lambda x, y, f: np.ones_like(f)),
+    np.subtract    : (lambda x, y, f: np.ones_like(f),  lambda x, y, f: -np.ones_like(f)),
+    np.multiply    : (lambda x, y, f: y,                lambda x, y, f: x),
+    np.true_divide : (lambda x, y, f: 1. / y,           lambda x, y, f: -f / y),
+    np.power       : (lambda x, y, f: y * np.power(x, y - 1.), lambda x, y, f: f * np.log(x)),
+}
+
+#################################################################################
+# Dual
+#
+# value : float or array
+# grad  : array of shape (n,) + shape(value), where n is the number of seeded
+#         inputs, such that grad[i] = d value / d input_i
+#
+# Operations between Duals with different shapes broadcast as the values do.
+#
+@dataclass(eq=False)
+class Dual:
+    '''Dual number carrying a value and its gradient with respect to seeded inputs'''
+    value: np.ndarray
+    grad: np.ndarray
+
+    ##########################
+    # seed
+    #
+    # The i'th of n independent inputs, with the given value
+    #
+    @classmethod
+    def seed(cls, value, i: int, n: int):
+        '''Dual for the i'th of n independent inputs'''
+        value = np.asarray(value, dtype=float)
+        grad = np.zeros((n,) + value.shape)
+        grad[i] = 1.
+        return cls(value = value if value.ndim else float(value), grad = grad)
+
+    ##########################
+    # __array_ufunc__
+    #
+    # Evaluates the ufunc on the values and applies the chain rule for
+    # every argument that is a Dual
+    #
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or "out" in kwargs:
+            return NotImplemented
+
+        vals = [x.value if isinstance(x, Dual) else x for x in inputs]
+        f = ufunc(*vals, **kwargs)
+        ndim = np.ndim(f)
+
+        if len(inputs) == 1 and ufunc in _UNARY:
+            derivs = [lambda: _UNARY[ufunc](vals[0], f)]
+        elif len(inputs) == 2 and ufunc in _BINARY:
+            dx, dy = _BINARY[ufunc]
+            derivs = [lambda: dx(vals[0], vals[1], f), lambda: dy(vals[0], vals[1], f)]
+        else:
+            return NotImplemented
+
+        grad = None
+        for x, d in zip(inputs, derivs):
+            if isinstance(x, Dual):
+                g = _expand(x.grad, np.ndim(x.value), ndim) * d()
+                grad = g if grad is None else grad + g
+
+        n = grad.shape[0]
+        return Dual(value = f, grad = np.broadcast_to(grad, (n,) + np.shape(f)))
+
+    ##########################
+    # operators, which all defer to the ufuncs
+    #
+    def __add__(self, other):      return np.add(self, other)
+    def __radd__(self, other):     return np.add(other, self)
+    def __sub__(self, other):      return np.subtract(self, other)
+    def __rsub__(self, other):     return np.subtract(other, self)
+    def __mul__(self, other):      return np.multiply(self, other)
+    def __rmul__(self, other):     return np.multiply(other, self)
+    def __truediv__(self, other):  return np.true_divide(self, other)
+    def __rtruediv__(self, other): return np.true_divide(other, self)
+    def __pow__(self, other):      return np.power(self, other)
+    def __rpow__(self, other):     return np.power(other, self)
+    def __neg__(self):             return np.negative(self)
+    def __pos__(self):             return np.positive(self)
+    def __abs__(self):             return np.absolute(self)
+
+    @property
+    def shape(self):
+        return np.shape(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getitem__(self, i):
+        return Dual(value = self.value[i], grad = self.grad[(slice(None),) + (i if isinstance(i, tuple) else (i,))])
+
+#################################################################################
+# _expand
+#
+# Inserts axes into a gradient so that it broadcasts against a result with
+# ndim dimensions (the gradient axis always comes first)
+#
+def _expand(grad, vdim: int, ndim: int):
+    return grad.reshape(grad.shape[:1] + (1,) * (ndim - vdim) + grad.shape[1:])
@@ -0,0 +1,161 @@
+# encoding.py
+#
+# Dictionary encoded (categorical) SigFigArray and SciDataArray, for columns
+# with few distinct values (instrument resolutions, constants, uncertainties
+# repeated millions of times).
+#
+# An EncodedArray stores every distinct element once, in its dictionary (a
+# SigFigArray or SciDataArray), and the elements as int32 codes into it.
+# Elementwise operations (map, the arithmetic operators, str) are computed
+# once per distinct element (or distinct pair of elements, for two encoded
+# arrays) and broadcast through the codes, so that their cost depends on the
+# number of distinct values rather than the length of the array.
+#
+#   e = si.EncodedArray.encode(x)         #x is a SigFigArray or SciDataArray
+#   e.cardinality, e.nbytes
+#   (e * 2.).decode()                     #exactly x * 2., with one multiply per distinct value
+#
+# Elements are distinct if any of their fields differ (the same value with
+# different sigfigs are distinct elements), and missing elements are encoded
+# like any other.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import as_array, to_strings
+from standard_scientific.shared import array_columns
+
+#external imports
+from dataclasses import dataclass
+import operator
+import numpy as np
+
+#################################################################################
+# _unique
+#
+# The first index of every distinct row of a list of equally long columns,
+# and the inverse (the position of every row among them), compared bitwise
+#
+def _unique(cols):
+    n = len(cols[0])
+    if n == 0:
+        return np.empty(0, dtype = np.int64), np.empty(0, dtype = np.int64)
+    #combine the (1-D, and so fast) codes of one column at a time
+    code = np.zeros(n, dtype = np.int64)
+    for c in cols:
+        c = np.ascontiguousarray(c)
+        _, k = np.unique(c.view(np.uint64) if c.dtype.itemsize == 8 else c, return_inverse = True)
+        _, code = np.unique(code * (int(k.max()) + 1) + k.reshape(-1), return_inverse = True)
+        code = code.reshape(-1)
+    first = np.full(int(code.max()) + 1, n, dtype = np.int64)
+    np.minimum.at(first, code, np.arange(n))
+    return first, code
+
+#################################################################################
+# EncodedArray
+#
+#   codes      : int32 index into the dictionary of every element
+#   dictionary : SigFigArray or SciDataArray of the distinct elements
+#
+@dataclass(eq=False)
+class EncodedArray:
+    '''Dictionary encoded SigFigArray or SciDataArray'''
+    codes: np.ndarray
+    dictionary: object
+
+    #########################################################
+    # encode
+    # Interns the distinct elements of x (in order of their first appearance)
+    #
+    @classmethod
+    def encode(cls, x):
+        '''Dictionary encode a SigFigArray or SciDataArray (or sequence of SigFig or SciData)'''
+        if isinstance(x, EncodedArray):
+            return x
+        x = as_array(x)
+        first, inverse = _unique(array_columns(x)[1])
+        assert(len(first) < 2**31), f"{len(first)} distinct elements is too many for int32 codes"
+        order = np.argsort(first, kind = "stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        return cls(codes = rank[inverse].astype(np.int32), dictionary = x[first[order]])
+
+    def decode(self):
+        '''The SigFigArray or SciDataArray of every element'''
+        return self.dictionary[self.codes]
+
+    @property
+    def cardinality(self) -> int:
+        '''The number of distinct elements'''
+        return len(self.dictionary)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(c.nbytes for c in array_columns(self.dictionary)[1])
+
+    def counts(self) -> np.ndarray:
+        '''The number of times each element of the dictionary appears'''
+        return np.bincount(self.codes, minlength = self.cardinality)
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            return self.dictionary[int(self.codes[i])]
+        return EncodedArray(codes = self.codes[i], dictionary = self.dictionary)
+
+    #########################################################
+    # map
+    # func must be elementwise (its result for an element may only depend on that element)
+    #
+    def map(self, func):
+        '''Apply an elementwise function once per distinct element'''
+        return EncodedArray(codes = self.codes, dictionary = func(self.dictionary))
+
+    def to_strings(self) -> list:
+        '''The str of every element, formatting each distinct element once'''
+        return np.array(to_strings(self.dictionary), dtype = object)[self.codes].tolist()
+
+    #########################################################
+    # Arithmetic
+    #
+    # With another EncodedArray, the operation is computed once for every
+    # distinct pair of elements. Other operands (numbers, SigFig, SciData)
+    # are applied to the dictionary.
+    #
+    def _binary(self, op, other, reverse = False):
+        if other is self:
+            return self.map(lambda d: op(d, d))
+        if isinstance(other, EncodedArray):
+            assert(len(other) == len(self)), f"EncodedArray of lengths {len(self)} and {len(other)} are not aligned"
+            a, b = (other, self) if reverse else (self, other)
+            first, inverse = _unique([a.codes.astype(np.int64), b.codes.astype(np.int64)])
+            d = op(a.dictionary[a.codes[first]], b.dictionary[b.codes[first]])
+            return EncodedArray(codes = inverse.astype(np.int32), dictionary = d)
+        if reverse:
+            return self.map(lambda d: op(other, d))
+        return self.map(lambda d: op(d, other))
+
+    def __add__(self, other):      return self._binary(operator.add, other)
+    def __radd__(self, other):     return self._binary(operator.add, other, True)
+    def __sub__(self, other):      return self._binary(operator.sub, other)
+    def __rsub__(self, other):     return self._binary(operator.sub, other, True)
+    def __mul__(self, other):      return self._binary(operator.mul, other)
+    def __rmul__(self, other):     return self._binary(operator.mul, other, True)
+    def __truediv__(self, other):  return self._binary(operator.truediv, other)
+    def __rtruediv__(self, other): return self._binary(operator.truediv, other, True)
+    def __neg__(self):             return self.map(operator.neg)
+    def __abs__(self):             return self.map(operator.abs)
@@ -0,0 +1,182 @@
+# fitting.py
+#
+# Weighted (by inverse variance) linear least squares fits of SciData, which
+# return the parameters as SciData (with sigfigs given by their uncertainties)
+# and their covariance matrix.
+#
+#   fit(x, y, basis)              : y ~ sum_k p_k * basis[k](x)
+#   fit_polynomial(x, y, degree)  : y ~ p_0 + p_1 * x + ... + p_degree * x**degree
+#   fit_linear(x, y)              : y ~ p_0 + p_1 * x
+#
+# Many independent fits are made at once by giving the group (fit) of every
+# point with ids and ngroups, as in reductions.py.
+#
+# How this works. The weighted normal equations (A^T W A) p = A^T W y of all
+# groups are accumulated in one pass over the points (with np.bincount, one
+# entry of the p x p matrices at a time), and are solved together with
+# batched NumPy linear algebra. The columns of A are scaled to unit norm
+# first, which removes the ill conditioning that comes from the columns
+# having very different sizes (such as the powers of x of a polynomial), but
+# not that of nearly dependent columns: the normal equations square the
+# condition number of A. Groups whose scaled normal equations are
+# numerically singular (of rank less than p, as np.linalg.matrix_rank) are
+# given missing parameters and nan covariances, as are those with fewer
+# points than parameters.
+#
+# The covariance of the parameters is (A^T W A)^-1, which takes the
+# uncertainties of y to be correct; multiply it by chi2 / dof for the
+# (Birge) scaled covariance. The uncertainties of x are not used. The sigfigs
+# of the uncertainties of the parameters are the smallest of those of the
+# uncertainties of y (as in propagation.py), unless unc_sigfigs is given.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import as_array
+from standard_scientific.propagation import NO_SIGFIGS
+from standard_scientific.propagation import propagated_SciDataArray
+from standard_scientific.reductions import group_ids
+
+#external imports
+from dataclasses import dataclass
+import numpy as np
+
+#################################################################################
+# FitResult
+#
+#   params : list of SciDataArray, one per parameter, with one element per group
+#   cov    : covariance matrices of the parameters, shape (ngroups, p, p)
+#   chi2   : sum of the squares of the weighted residuals of every group
+#   dof    : number of points - number of parameters of every group
+#
+# Groups with fewer points than parameters have missing parameters and nan
+# covariances.
+#
+@dataclass
+class FitResult:
+    '''Parameters (as SciData), covariances and chi**2 of weighted least squares fits'''
+    params: list
+    cov: np.ndarray
+    chi2: np.ndarray
+    dof: np.ndarray
+
+    def parameters(self, group: int = 0) -> list:
+        '''The parameters of one fit, as a list of SciData'''
+        return [p[group] for p in self.params]
+
+#################################################################################
+# _floats
+#
+# The values of x, which may be floats, a SigFigArray or a SciDataArray (or
+# sequences of SigFig or SciData)
+#
+def _floats(x) -> np.ndarray:
+    if not isinstance(x, (SigFigArray, SciDataArray, np.ndarray)):
+        x = list(x)
+        if len(x) > 0 and isinstance(x[0], (SigFig, SciData)):
+            x = as_array(x)
+    if isinstance(x, SigFigArray):
+        return x.value
+    if isinstance(x, SciDataArray):
+        return x.value.value
+    return np.asarray(x, dtype = np.float64)
+
+#################################################################################
+# fit
+#
+#   x           : the independent variable (floats, SigFigArray or SciDataArray)
+#   y           : the data, a SciDataArray (or sequence of SciData), which must be inexact
+#   basis       : list of functions of (an array of) x
+#   ids         : group (fit) of every point (negative to drop it), None for a single fit
+#   ngroups     : the number of groups
+#   unc_sigfigs : sigfigs of the uncertainties of the parameters
+#
+def fit(x, y, basis, ids = None, ngroups: int = 1, unc_sigfigs: int = None) -> FitResult:
+    '''Weighted least squares fit of y to a linear combination of basis functions of x'''
+    x = _floats(x)
+    y = as_array(y)
+    assert(isinstance(y, SciDataArray)), f"{y} was not a SciDataArray or sequence of SciData"
+    assert(x.shape == y.shape), f"x has shape {x.shape}, but y has shape {y.shape}"
+    assert(len(basis) > 0), "At least one basis function is required"
+
+    g, valid, ngroups = group_ids(~y.value.is_missing(), ids, ngroups)
+    assert(not np.any(y.is_exact[valid])), "Weighted least squares requires inexact data"
+    p = len(basis)
+
+    xv, yv, u = x[valid], y.value.value[valid], y.unc.value[valid]
+    w = 1. / (u * u)
+    A = np.empty((len(xv), p))
+    for k, f in enumerate(basis):
+        A[:, k] = np.broadcast_to(f(xv), xv.shape)
+
+    #the normal equations of every group, with the columns scaled to unit norm
+    N = np.empty((ngroups, p, p))
+    b = np.empty((ngroups, p))
+    for i in range(p):
+        b[:, i] = np.bincount(g, weights = w * A[:, i] * yv, minlength = ngroups)
+        for j in range(i, p):
+            N[:, i, j] = N[:, j, i] = np.bincount(g, weights = w * A[:, i] * A[:, j], minlength = ngroups)
+
+    count = np.bincount(g, minlength = ngroups)
+    found = count >= p
+    scale = np.sqrt(np.diagonal(N, axis1 = 1, axis2 = 2)).copy()
+    scale[~found] = 1.
+    scale[scale == 0.] = 1.
+    N = N / (scale[:, :, None] * scale[:, None, :])
+    N[~found] = np.eye(p)
+
+    #groups whose (scaled) normal equations are numerically singular, such as
+    #a straight line through points that all have the same x, have no fit
+    found &= np.linalg.matrix_rank(N) == p
+    N[~found] = np.eye(p)
+
+    cov = np.linalg.inv(N) / (scale[:, :, None] * scale[:, None, :])
+    value = np.einsum("gij,gj->gi", cov, b)
+    cov[~found] = np.nan
+
+    #chi2 of every group
+    r = yv - np.einsum("nk,nk->n", A, value[g])
+    chi2 = np.bincount(g, weights = w * r * r, minlength = ngroups)
+    chi2[~found] = np.nan
+
+    if unc_sigfigs is None:
+        usf = np.full(ngroups, NO_SIGFIGS)
+        np.minimum.at(usf, g, y.unc.sigfigs[valid])
+    else:
+        usf = np.full(ngroups, int(unc_sigfigs))
+
+    params = []
+    for k in range(p):
+        val = np.where(found, value[:, k], 0.)
+        unc = np.where(found, np.sqrt(np.maximum(np.diagonal(cov, axis1 = 1, axis2 = 2)[:, k], 0.)), 0.)
+        out = propagated_SciDataArray(val, unc, usf)
+        out.value[~found] = None
+        params.append(out)
+
+    return FitResult(params = params, cov = cov, chi2 = chi2, dof = count - p)
+
+#################################################################################
+# fit_polynomial
+#
+# The parameters are in order of increasing power of x
+#
+def fit_polynomial(x, y, degree: int, ids = None, ngroups: int = 1, unc_sigfigs: int = None) -> FitResult:
+    '''Weighted least squares fit of y to a polynomial in x'''
+    assert(degree >= 0), f"The degree must not be negative, not {degree}"
+    basis = [lambda t, k=k: t**k for k in range(degree + 1)]
+    return fit(x, y, basis, ids = ids, ngroups = ngroups, unc_sigfigs = unc_sigfigs)
+
+#################################################################################
+# fit_linear
+#
+# The parameters are the intercept and the slope
+#
+def fit_linear(x, y, ids = None, ngroups: int = 1, unc_sigfigs: int = None) -> FitResult:
+    '''Weighted least squares fit of y to a straight line in x'''
+    return fit_polynomial(x, y, 1, ids = ids, ngroups = ngroups, unc_sigfigs = unc_sigfigs)
@@ -0,0 +1,166 @@
+# formatting.py
+#
+# Bulk string formatting of SigFigArray and SciDataArray, which produces
+# EXACTLY the text of SigFig.__str__ and SciData.__str__ for every element,
+# but without building a python object (and an f-string) per element.
+#
+# How this works. The numbers that __str__ computes per object (the mantissa
+# value * 10**-exponent, and the integer digits of the uncertainty) are
+# computed for whole columns in NumPy, using the same float for 10**k that
+# python's pow(10, k) produces. The format specs are cached per number of
+# sigfigs, and a chunk of rows is formatted with a single call to str.format
+# on the concatenation of their specs.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+
+#external imports
+import functools
+import io
+import numpy as np
+
+#default number of rows formatted at once
+CHUNK_SIZE = 1 << 16
+
+#################################################################################
+# Cached format specs and powers of ten
+#
+@functools.lru_cache(maxsize = None)
+def _sigfig_spec(sigfigs: int) -> str:
+    if sigfigs == 0:
+        return "None"
+    return f"{{:.{sigfigs - 1}e}}"
+
+@functools.lru_cache(maxsize = None)
+def _scidata_spec(sigfigs: int, exact: bool) -> str:
+    if exact:
+        return f"{{:.{sigfigs}}} (exact) E{{:d}}"
+    return f"{{:.{sigfigs}}} ({{:d}}) E{{:d}}"
+
+# pow(10, k) as python computes it (an exact int for k >= 0, which is then
+# rounded to a float when multiplied with one)
+@functools.lru_cache(maxsize = None)
+def _pow10(k: int) -> float:
+    return float(pow(10, k))
+
+#the lookups below index small tables covering the range of the keys, which
+#is much cheaper than finding the unique keys with a sort
+def _pow10_array(k):
+    if len(k) == 0:
+        return np.zeros(0)
+    lo = int(k.min())
+    table = np.array([_pow10(j) for j in range(lo, int(k.max()) + 1)])
+    return table[k - lo]
+
+def _specs(spec, key, exact = None):
+    '''The (cached) spec of every row'''
+    if exact is None:
+        table = np.array([spec(j) for j in range(int(key.max(initial = 0)) + 1)], dtype = object)
+        return table[key]
+    table = np.array([[spec(j, False), spec(j, True)] for j in range(int(key.max(initial = 0)) + 1)], dtype = object)
+    return table[key, exact.astype(np.int64)]
+
+#################################################################################
+# Chunk formatters
+#
+# Each returns the text of a chunk of rows, every row followed by sep
+#
+def _sigfig_chunk(x: SigFigArray, sep: str) -> str:
+    specs = _specs(_sigfig_spec, x.sigfigs)
+    args = x.value[x.sigfigs != 0].tolist()
+    sep = sep.replace("{", "{{").replace("}", "}}")
+    return (sep.join(specs) + sep).format(*args)
+
+def _scidata_chunk(x: SciDataArray, sep: str) -> str:
+    exact = x.is_exact
+    inexact = ~exact
+
+    mant = x.value.value * _pow10_array(-x.value.exponent)
+
+    digits = np.zeros(len(x), dtype = np.int64)
+    k = -x.unc.exponent[inexact] + x.unc.sigfigs[inexact] - 1
+    digits[inexact] = np.trunc(x.unc.value[inexact] * _pow10_array(k)).astype(np.int64)
+
+    #each row uses (mantissa, digits, exponent), with digits dropped for exact rows
+    args = np.empty((len(x), 3), dtype = object)
+    args[:, 0] = mant.tolist()
+    args[:, 1] = digits.tolist()
+    args[:, 2] = x.value.exponent.tolist()
+    keep = np.ones((len(x), 3), dtype = bool)
+    keep[exact, 1] = False
+
+    specs = _specs(_scidata_spec, x.value.sigfigs, exact)
+    sep = sep.replace("{", "{{").replace("}", "}}")
+    return (sep.join(specs) + sep).format(*args[keep].tolist())
+
+#################################################################################
+# as_array
+#
+# Accepts the columnar classes or sequences of the scalar ones
+#
+def as_array(x):
+    '''The SigFigArray or SciDataArray of x'''
+    if isinstance(x, (SigFigArray, SciDataArray)):
+        return x
+    x = list(x)
+    if len(x) > 0 and isinstance(x[0], SciData):
+        return SciDataArray.from_SciData(x)
+    return SigFigArray.from_SigFigs(x)
+
+def _chunks(x, sep: str, chunk_size: int):
+    fmt = _scidata_chunk if isinstance(x, SciDataArray) else _sigfig_chunk
+    for i in range(0, len(x), chunk_size):
+        yield fmt(x[i:i + chunk_size], sep)
+
+#################################################################################
+# to_strings
+#
+# The list of str(x[i]) for every element
+#
+def to_strings(x, chunk_size: int = CHUNK_SIZE):
+    '''List of the string of every element of a SigFigArray or SciDataArray'''
+    x = as_array(x)
+    out = []
+    for text in _chunks(x, "\n", chunk_size):
+        out.extend(text.split("\n")[:-1])
+    return out
+
+#################################################################################
+# write_strings
+#
+# Writes str(x[i]) + sep for every element of x to out, which may be
+#   - a text file (or anything else with .write() taking str)
+#   - a binary file (anything with .write() taking bytes), which receives ASCII
+#   - a preallocated bytearray or writable memoryview, filled from offset
+#
+# Returns the number of characters (or bytes) written. Rows are formatted
+# chunk_size at a time, so that the memory used does not grow with len(x).
+#
+def write_strings(x, out, sep: str = "\n", chunk_size: int = CHUNK_SIZE, offset: int = 0) -> int:
+    '''Write the strings of every element of a SigFigArray or SciDataArray to a file or buffer'''
+    x = as_array(x)
+
+    if isinstance(out, (bytearray, memoryview)):
+        view = memoryview(out).cast("B")
+        pos = offset
+        for text in _chunks(x, sep, chunk_size):
+            b = text.encode("ascii")
+            assert(pos + len(b) <= len(view)), f"Buffer of {len(view)} bytes is too small"
+            view[pos:pos + len(b)] = b
+            pos += len(b)
+        return pos - offset
+
+    binary = isinstance(out, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(out, "mode", "")
+    n = 0
+    for text in _chunks(x, sep, chunk_size):
+        if binary:
+            text = text.encode("ascii")
+        out.write(text)
+        n += len(text)
+    return n
@@ -0,0 +1,255 @@
+# graph.py
+#
+# Contains the QuantityGraph class, a dependency graph of derived quantities
+# (SciData, SigFig, or anything else) declared as expressions over named
+# inputs. Derived quantities are evaluated lazily and memoized, and changing
+# an input only invalidates (and later recomputes) the part of the graph
+# downstream of it.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.scidata import SciData
+
+#external imports
+from dataclasses import dataclass
+from dataclasses import astuple
+import inspect
+import time
+
+#################################################################################
+# Recomputation
+#
+# Record of a single evaluation of a derived quantity, see QuantityGraph.log
+#
+@dataclass
+class Recomputation:
+    '''Record of the evaluation of a derived quantity'''
+    name: str
+    seconds: float
+    changed: bool
+    epoch: int
+
+#################################################################################
+# _same
+#
+# Strict (field by field) equality used to decide if a value has changed.
+# This is intentionally NOT the sigfig equality of SigFig.__eq__, which would
+# let values drift within their last significant place.
+#
+def _same(a, b):
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    #the cached relative uncertainty of SciData (see SciData.rel_unc) follows
+    #from its other fields, and may or may not have been computed yet
+    if isinstance(a, SciData):
+        return a.is_exact == b.is_exact and _same(a.value, b.value) and _same(a.unc, b.unc)
+    if isinstance(a, SigFig):
+        return astuple(a) == astuple(b)
+    if isinstance(a, (int, float, str)):
+        return a == b
+    return False
+
+#################################################################################
+# _Node
+#
+# A single input or derived quantity
+#
+#   func        : the expression (None for inputs)
+#   deps        : names of the arguments of func
+#   value       : the memoized value
+#   computed    : True once the value exists
+#   dirty       : an upstream input has changed since the value was computed
+#   changed_at  : epoch at which the value last changed
+#   computed_at : epoch at which the value was last computed
+#
+@dataclass
+class _Node:
+    func: object
+    deps: tuple
+    value: object = None
+    computed: bool = False
+    dirty: bool = True
+    changed_at: int = 0
+    computed_at: int = -1
+
+#################################################################################
+# QuantityGraph
+#
+# Usage:
+#   g = QuantityGraph()
+#   g.set_input("h", SciData.from_str("6.62607015e-34"))
+#   g.set_input("c", SciData.from_str("299792458"))
+#   g.define("hc", lambda h, c: h * c)   #dependencies are the argument names
+#   g["hc"]                              #evaluated now, and memoized
+#
+# How this works. Every change to an input starts a new "epoch", and marks all
+# of the quantities downstream of the input as dirty (nothing is evaluated).
+# When a dirty quantity is requested, its dependencies are brought up to date
+# first, and it is only re-evaluated if one of them actually changed since it
+# was last computed. If a re-evaluated quantity comes out identical to its
+# previous value, it does not count as changed, so that its own dependents can
+# skip their re-evaluation ("early cutoff").
+#
+# Every evaluation is recorded in .log as a Recomputation, which gives the name,
+# the time it took, and if the value changed.
+#
+class QuantityGraph:
+    '''Dependency graph of lazily evaluated, memoized derived quantities'''
+
+    def __init__(self):
+        self._nodes = {}
+        self._dependents = {}
+        self._epoch = 0
+        self.log = []
+
+    ##########################
+    # set_input
+    #
+    # Sets (or changes) the value of a named input. Setting a value identical
+    # to the current one does nothing.
+    #
+    def set_input(self, name: str, value):
+        '''Set the value of a named input, invalidating everything downstream of it'''
+        node = self._nodes.get(name)
+        assert(node is None or node.func is None), f"{name} is a derived quantity, not an input"
+
+        if node is not None and _same(node.value, value):
+            return
+
+        self._epoch += 1
+        if node is None:
+            node = _Node(func = None, deps = ())
+            self._nodes[name] = node
+            self._dependents.setdefault(name, set())
+        node.value = value
+        node.computed = True
+        node.dirty = False
+        node.changed_at = self._epoch
+        node.computed_at = self._epoch
+
+        for d in self.downstream(name):
+            self._nodes[d].dirty = True
+
+    ##########################
+    # define
+    #
+    # Declares a derived quantity as func of other named quantities. By default,
+    # the dependencies are the names of the arguments of func, in order.
+    #
+    def define(self, name: str, func, depends=None):
+        '''Declare a derived quantity as an expression over other named quantities'''
+        deps = tuple(inspect.signature(func).parameters) if depends is None else tuple(depends)
+        for d in deps:
+            assert(d in self._nodes), f"{name} depends on {d}, which has not been defined"
+            assert(d != name and name not in self.upstream(d)), f"Defining {name} would create a cycle through {d}"
+
+        old = self._nodes.get(name)
+        assert(old is None or old.func is not None), f"{name} is an input, not a derived quantity"
+        if old is not None:
+            for d in old.deps:
+                self._dependents[d].discard(name)
+
+        self._epoch += 1
+        self._nodes[name] = _Node(func = func, deps = deps, changed_at = self._epoch)
+        self._dependents.setdefault(name, set())
+        for d in deps:
+            self._dependents[d].add(name)
+
+        for d in self.downstream(name):
+            self._nodes[d].dirty = True
+
+    ##########################
+    # get (and [])
+    #
+    def get(self, name: str):
+        '''Value of a named quantity, evaluating whatever is out of date'''
+        assert(name in self._nodes), f"{name} has not been defined"
+        node = self._nodes[name]
+        if not node.dirty:
+            return node.value
+
+        args = [self.get(d) for d in node.deps]
+        if (not node.computed or
+            any(self._nodes[d].changed_at > node.computed_at for d in node.deps)):
+
+            t = time.perf_counter()
+            value = node.func(*args)
+            t = time.perf_counter() - t
+
+            changed = not (node.computed and _same(node.value, value))
+            if changed:
+                node.value = value
+                node.changed_at = self._epoch
+            node.computed = True
+            self.log.append(Recomputation(name = name, seconds = t, changed = changed, epoch = self._epoch))
+
+        node.computed_at = self._epoch
+        node.dirty = False
+        return node.value
+
+    def __getitem__(self, name: str):
+        return self.get(name)
+
+    def __contains__(self, name: str):
+        return name in self._nodes
+
+    ##########################
+    # evaluate
+    #
+    # Brings every (or the given) quantities up to date and returns them by name
+    #
+    def evaluate(self, names=None):
+        '''Dictionary of the values of the given (default: all) quantities'''
+        names = list(self._nodes) if names is None else list(names)
+        return {n: self.get(n) for n in names}
+
+    ##########################
+    # Introspection
+    #
+    def inputs(self):
+        '''Names of the inputs'''
+        return [n for n, x in self._nodes.items() if x.func is None]
+
+    def derived(self):
+        '''Names of the derived quantities'''
+        return [n for n, x in self._nodes.items() if x.func is not None]
+
+    def dependencies(self, name: str):
+        '''Names of the direct dependencies of a quantity'''
+        return list(self._nodes[name].deps)
+
+    def is_stale(self, name: str):
+        '''True if the quantity will be brought up to date on its next access'''
+        return self._nodes[name].dirty
+
+    def upstream(self, name: str):
+        '''Set of every quantity that name depends on (directly or not)'''
+        out = set()
+        stack = list(self._nodes[name].deps)
+        while stack:
+            d = stack.pop()
+            if d not in out:
+                out.add(d)
+                stack.extend(self._nodes[d].deps)
+        return out
+
+    def downstream(self, name: str):
+        '''Set of every quantity that depends on name (directly or not)'''
+        out = set()
+        stack = list(self._dependents.get(name, ()))
+        while stack:
+            d = stack.pop()
+            if d not in out:
+                out.add(d)
+                stack.extend(self._dependents[d])
+        return out
+
+    def clear_log(self):
+        '''Empty the log of recomputations'''
+        self.log = []
@@ -0,0 +1,164 @@
+# linalg.py
+#
+# Matrix products and linear solves of SigFigArray (of one or two
+# dimensions), with the floating point work done by BLAS/LAPACK through NumPy.
+#
+#   matmul(a, b) (or a @ b) : matrix products, with the shapes of np.matmul
+#   dot(a, b)               : the dot product of two vectors, as a SigFig
+#   solve(a, b)             : the solution x of a @ x = b
+#   inv(a)                  : the inverse of a
+#
+# Plain numbers (and arrays of them) are taken to be infinitely precise, as
+# in the SigFig operators. Missing elements are not supported.
+#
+# How products are rounded. Evaluating an element c_ij = sum_k a_ik * b_kj
+# with the scalar operators rounds every product to the smaller number of
+# sigfigs of its factors (SigFig.__mul__), and every partial sum to the
+# limiting place of its terms (SigFig.__add__), so that the final place is
+# the largest of the sigfig places of the products. That place is computed
+# here EXACTLY (it is rigorous: it is the place of the chained scalar
+# evaluation), from the exponents of the products a_ik * b_kj, in blocks of
+# rows. The value is the BLAS sum of the unrounded products, rounded ONCE to
+# that place (as in reductions.py). The chain rounds each of its 2K - 1
+# intermediate results (for K terms) by at most half a unit of that place, so
+# the two values differ by at most K units in the last place, and the value
+# here is the nearer to the exact sum. Sums that cancel to zero keep one
+# sigfig (where the chain fails).
+#
+# How solves are rounded. There is no chained scalar evaluation to follow
+# (the operations of an elimination depend on the pivoting), so the sigfigs
+# of solve and inv are a BOUNDED APPROXIMATION: the relative error of the
+# solution is at most cond(a) times that of the data, so that
+#   sigfigs = smallest sigfigs of a and b - floor(log10(cond(a)))
+# (and at least one) for every element of the result.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.sigfig_array import exponents_from_floats
+from standard_scientific.sigfig_array import w_round_array
+
+#external imports
+import numpy as np
+
+#number of products (rows x inner x columns) whose places are computed at once
+BLOCK_SIZE = 1 << 18
+
+#################################################################################
+# _operands
+#
+# The values and sigfigs of a and b, promoted to two dimensions as in
+# np.matmul. The sigfigs of plain numbers are None.
+#
+def _operand(x):
+    if isinstance(x, SigFigArray):
+        assert(not np.any(x.is_missing())), "Matrix operations do not support missing elements"
+        return x.value, x.sigfigs
+    return np.asarray(x, dtype = float), None
+
+def _operands(a, b):
+    assert(isinstance(a, SigFigArray) or isinstance(b, SigFigArray)), "At least one operand must be a SigFigArray"
+    av, asf = _operand(a)
+    bv, bsf = _operand(b)
+    assert(av.ndim in (1, 2) and bv.ndim in (1, 2)), f"Operands must have one or two dimensions, not {av.ndim} and {bv.ndim}"
+    assert(av.shape[-1] == bv.shape[0]), f"Operands have mismatched shapes {av.shape} and {bv.shape}"
+    shape = av.shape[:-1] + bv.shape[1:]
+    if av.ndim == 1:
+        av = av[None, :]
+        asf = None if asf is None else asf[None, :]
+    if bv.ndim == 1:
+        bv = bv[:, None]
+        bsf = None if bsf is None else bsf[:, None]
+    return av, asf, bv, bsf, shape
+
+#################################################################################
+# _limiting_places
+#
+# The largest sigfig place of the products a_ik * b_kj over k, for every
+# (i, j), computed in blocks of rows of a
+#
+def _limiting_places(av, asf, bv, bsf):
+    n, m = av.shape
+    p = bv.shape[1]
+    out = np.empty((n, p), dtype = np.int64)
+    if m == 0:
+        out[:] = 0
+        return out
+    rows = max(1, BLOCK_SIZE // max(1, m * p))
+    for i0 in range(0, n, rows):
+        i1 = min(n, i0 + rows)
+        prod = av[i0:i1, :, None] * bv[None, :, :]
+        if asf is None:
+            sf = bsf[None, :, :]
+        elif bsf is None:
+            sf = asf[i0:i1, :, None]
+        else:
+            sf = np.minimum(asf[i0:i1, :, None], bsf[None, :, :])
+        out[i0:i1] = np.max(exponents_from_floats(prod) - sf + 1, axis = 1)
+    return out
+
+#################################################################################
+# matmul
+#
+def matmul(a, b) -> SigFigArray:
+    '''Matrix product of SigFigArrays (or of a SigFigArray and plain numbers)'''
+    av, asf, bv, bsf, shape = _operands(a, b)
+    limd = _limiting_places(av, asf, bv, bsf)
+    val = w_round_array(av @ bv, -limd)
+    sf = np.maximum(1, exponents_from_floats(val) - limd + 1)
+    out = SigFigArray.from_floats(val, sf)
+    return SigFigArray(value = out.value.reshape(shape), sigfigs = out.sigfigs.reshape(shape),
+                       exponent = out.exponent.reshape(shape))
+
+#################################################################################
+# dot
+#
+def dot(a, b) -> SigFig:
+    '''Dot product of two vectors, at least one of which is a SigFigArray'''
+    c = matmul(a, b)
+    assert(c.shape == ()), f"dot requires two vectors, use matmul for shapes {np.shape(a)} and {np.shape(b)}"
+    return SigFig(value = float(c.value), sigfigs = int(c.sigfigs), exponent = int(c.exponent))
+
+#################################################################################
+# _solve_sigfigs
+#
+# The sigfigs of the solutions of a @ x = b (see the header)
+#
+def _solve_sigfigs(av, *sigfigs) -> int:
+    sf = min(int(np.min(s)) for s in sigfigs if s is not None and np.size(s) > 0)
+    cond = np.linalg.cond(av)
+    if not np.isfinite(cond):
+        raise np.linalg.LinAlgError("Singular matrix")
+    return max(1, sf - int(np.floor(np.log10(max(cond, 1.)))))
+
+def _square(a):
+    assert(isinstance(a, SigFigArray)), f"{a} was not an instance of SigFigArray"
+    assert(a.value.ndim == 2 and a.shape[0] == a.shape[1]), f"Requires a square matrix, not shape {a.shape}"
+    assert(not np.any(a.is_missing())), "Matrix operations do not support missing elements"
+    return a.value
+
+#################################################################################
+# solve
+#
+#   a : square SigFigArray
+#   b : SigFigArray (or plain numbers) of one or two dimensions
+#
+def solve(a: SigFigArray, b) -> SigFigArray:
+    '''Solution x of a @ x = b, with sigfigs bounded by the condition number of a'''
+    av = _square(a)
+    bv, bsf = _operand(b)
+    sf = _solve_sigfigs(av, a.sigfigs, bsf)
+    return SigFigArray.from_floats(np.linalg.solve(av, bv), sf)
+
+#################################################################################
+# inv
+#
+def inv(a: SigFigArray) -> SigFigArray:
+    '''Inverse of a square SigFigArray, with sigfigs bounded by its condition number'''
+    av = _square(a)
+    sf = _solve_sigfigs(av, a.sigfigs)
+    return SigFigArray.from_floats(np.linalg.inv(av), sf)
@@ -0,0 +1,173 @@
+# montecarlo.py
+#
+# Monte Carlo propagation of uncertainties through (possibly strongly
+# nonlinear) functions of SciData values. The function is evaluated on
+# NumPy arrays of samples, so the expensive part of the work never touches
+# the per-object SigFig arithmetic.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.sigfig import exponent_from_float
+from standard_scientific.scidata import SciData
+
+#external imports
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import math
+import numpy as np
+
+#################################################################################
+# _draw_chunk
+#
+# Draws a single chunk of samples and returns its running statistics as
+# (count, mean, sum of squared deviations). This lives at module level so that
+# it can be shipped to the workers of a process pool.
+#
+# The inputs are
+#   func    : the vectorized function
+#   consts  : list of the function arguments, with None in the slots that
+#             are to be sampled
+#   mean    : means of the sampled inputs
+#   std     : standard uncertainties of the sampled inputs
+#   chol    : Cholesky factor of the correlation matrix (or None)
+#   n       : number of samples in this chunk
+#   seed    : SeedSequence for this chunk
+#
+def _draw_chunk(task):
+    func, consts, mean, std, chol, n, seed = task
+
+    rng = np.random.default_rng(seed)
+    z = rng.standard_normal((n, len(mean)))
+    if chol is not None:
+        z = z @ chol.T
+    x = mean + z * std
+
+    cols = iter(x.T)
+    args = [next(cols) if c is None else c for c in consts]
+    y = np.broadcast_to(np.asarray(func(*args), dtype=float), (n,))
+
+    m = float(y.mean())
+    return (n, m, float(((y - m)**2).sum()))
+
+#################################################################################
+# _merge_stats
+#
+# Merges the (count, mean, M2) statistics of two sets of samples (Chan et al.)
+#
+def _merge_stats(a, b):
+    na, ma, sa = a
+    nb, mb, sb = b
+    n = na + nb
+    delta = mb - ma
+    return (n, ma + delta * nb / n, sa + sb + delta * delta * na * nb / n)
+
+#################################################################################
+# unc_sigfigs_from_samples
+#
+# The number of significant figures of a sample standard deviation that are
+# supported by the number of samples. The relative standard error of the
+# standard deviation of N normal samples is roughly 1/sqrt(2(N-1)), so we keep
+# every digit above that level, and always at least one.
+#
+#   N = 10**3 -> 1 sigfig
+#   N = 10**4 -> 2 sigfigs
+#   N = 10**6 -> 3 sigfigs
+#
+def unc_sigfigs_from_samples(n: int) -> int:
+    '''Number of significant figures in a standard deviation supported by n samples'''
+    assert(n > 1), f"At least two samples are required to estimate an uncertainty, got {n}"
+    return max(1, int(math.floor(-math.log10(1. / math.sqrt(2. * (n - 1))))))
+
+#################################################################################
+# monte_carlo
+#
+# Propagates the uncertainties of the SciData inputs through func by sampling.
+#
+#   func        : a NumPy-vectorized function taking one argument per input
+#   inputs      : SciData (or plain floats, which are taken to be exact)
+#   corr        : optional correlation matrix between the inputs (rows and
+#                 columns belonging to exact inputs are ignored)
+#   samples     : total number of samples to draw
+#   chunk_size  : samples drawn at once, which bounds the memory used
+#   workers     : if given, chunks are evaluated on a process pool of this size.
+#                 func must then be picklable (i.e. not a lambda)
+#   seed        : seed for the generator. Each chunk gets its own child of this
+#                 seed, so the result does not depend on the number of workers
+#   unc_sigfigs : sigfigs of the resulting uncertainty. By default this is
+#                 derived from the number of samples (see unc_sigfigs_from_samples)
+#
+# Inputs are sampled as (possibly correlated) normal distributions with the
+# value as mean and the standard uncertainty as standard deviation. Exact
+# inputs are passed to func as floats (see .as_exact()).
+#
+# The value of the result is the sample mean, rounded to the last significant
+# place of its uncertainty (the sample standard deviation), which is the
+# same convention used by SciData.from_str
+#
+def monte_carlo(func, *inputs, corr=None, samples: int = 10**6, chunk_size: int = 10**5,
+                workers=None, seed=None, unc_sigfigs=None):
+    '''Propagate the uncertainties of SciData inputs through a vectorized function by Monte Carlo'''
+
+    assert(len(inputs) > 0), f"monte_carlo requires at least one input"
+    assert(samples > 1), f"Requested samples {samples} must be larger than 1"
+    assert(chunk_size > 0), f"Requested chunk_size {chunk_size} must be larger than 0"
+
+    consts = []
+    mean = []
+    std = []
+    sampled = []
+    for i, x in enumerate(inputs):
+        if isinstance(x, SciData) and not x.is_exact:
+            consts.append(None)
+            mean.append(x.value.as_exact())
+            std.append(x.unc.as_exact())
+            sampled.append(i)
+        elif isinstance(x, SciData):
+            consts.append(x.as_exact())
+        else:
+            consts.append(float(x))
+
+    #nothing to sample, the result is exact
+    if len(sampled) == 0:
+        return SciData.exact_from_float(func(*consts))
+
+    chol = None
+    if corr is not None:
+        corr = np.asarray(corr, dtype=float)
+        assert(corr.shape == (len(inputs), len(inputs))), f"Correlation matrix of shape {corr.shape} does not match {len(inputs)} inputs"
+        assert(np.allclose(corr, corr.T)), f"Correlation matrix is not symmetric"
+        assert(np.allclose(np.diag(corr), 1.)), f"Correlation matrix does not have a unit diagonal"
+        corr = corr[np.ix_(sampled, sampled)]
+        try:
+            chol = np.linalg.cholesky(corr)
+        except np.linalg.LinAlgError as e:
+            assert(False), f"Correlation matrix is not positive definite. {e}"
+
+    mean = np.array(mean)
+    std = np.array(std)
+
+    #one child seed per chunk, so that results are independent of the pool size
+    nchunks = (samples + chunk_size - 1) // chunk_size
+    seeds = np.random.SeedSequence(seed).spawn(nchunks)
+    tasks = [(func, consts, mean, std, chol, min(chunk_size, samples - i * chunk_size), seeds[i])
+             for i in range(nchunks)]
+
+    if workers is None:
+        stats = functools.reduce(_merge_stats, map(_draw_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers = workers) as pool:
+            stats = functools.reduce(_merge_stats, pool.map(_draw_chunk, tasks))
+
+    n, m, m2 = stats
+    s = math.sqrt(m2 / (n - 1))
+
+    usf = unc_sigfigs_from_samples(n) if unc_sigfigs is None else int(unc_sigfigs)
+    unc_SigFig = SigFig.from_float(value = s, sigfigs = usf)
+    val_sfig = max(1, exponent_from_float(m) - unc_SigFig.sigfig_place() + 1)
+    value_SigFig = SigFig.from_float(value = m, sigfigs = val_sfig)
+
+    return SciData.from_SigFigs(value = value_SigFig, unc = unc_SigFig, rel_unc = None, is_exact = False)
@@ -0,0 +1,138 @@
+# ordering.py
+#
+# Sorting, searching and selecting SigFigArray and SciDataArray by value,
+# with NumPy on the columns of values, rather than with python comparisons
+# of every pair of SigFig (or SciData).
+#
+#   argsort(x), sort(x)              : stable, ascending (or descending) order
+#   searchsorted(x, v, side)         : insertion points in a sorted array
+#   top_k(x, k)                      : the k largest (or smallest) elements
+#   between(x, low, high, inclusive) : the elements within a range
+#
+# The order is that of the scalar < (SigFig.__lt__ and SciData.__lt__),
+# which compares values only: elements of equal value (including those
+# that differ in sigfigs, or in uncertainty) are ties.
+#
+# Tie rules. Every sort is stable, so ties keep their original order, in
+# both ascending and descending order, exactly as sorted(x) and
+# sorted(x, reverse=True) of the scalars. top_k returns the same elements as
+# sorted(x, reverse=True)[:k] (or sorted(x)[:k]), so that ties at the k-th
+# place are broken in favor of the earlier elements. searchsorted(x, v,
+# "left") and "right" are bisect_left and bisect_right of the scalars.
+# Missing elements (which the scalars cannot compare) are placed after all
+# of the others, in their original order, and are never within a range.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import as_array
+
+#external imports
+import numpy as np
+
+#################################################################################
+# _values
+#
+# The values of an array (nan where missing), and of things compared to them
+#
+def _values(x) -> np.ndarray:
+    x = as_array(x)
+    if isinstance(x, SciDataArray):
+        x = x.value
+    return np.where(x.is_missing(), np.nan, x.value)
+
+def _as_values(v):
+    if isinstance(v, SciData):
+        v = v.value
+    if isinstance(v, SigFig):
+        return v.value
+    if isinstance(v, (SigFigArray, SciDataArray)):
+        return _values(v)
+    if isinstance(v, (list, tuple)) and len(v) > 0 and isinstance(v[0], (SigFig, SciData)):
+        return _values(v)
+    return np.asarray(v, dtype = float)
+
+#################################################################################
+# argsort and sort
+#
+def argsort(x, descending: bool = False) -> np.ndarray:
+    '''Indices that stably sort a SigFigArray or SciDataArray by value'''
+    v = _values(x)
+    if descending:
+        #negating keeps the ties (and the missing elements) in their original order
+        v = -v
+    return np.argsort(v, kind = "stable")
+
+def sort(x, descending: bool = False):
+    '''Stably sorted copy of a SigFigArray or SciDataArray, by value'''
+    x = as_array(x)
+    return x[argsort(x, descending)]
+
+#################################################################################
+# searchsorted
+#
+#   x    : array sorted in ascending order (as by sort)
+#   v    : SigFig, SciData, number, or an array of them
+#   side : "left" (bisect_left) or "right" (bisect_right)
+#
+def searchsorted(x, v, side: str = "left"):
+    '''Indices at which v would be inserted into a sorted SigFigArray or SciDataArray'''
+    assert(side in ("left", "right")), f"side must be left or right, not {side}"
+    return np.searchsorted(_values(x), _as_values(v), side = side)
+
+#################################################################################
+# top_k
+#
+# The k largest (or smallest) elements in order (largest first), as
+# sorted(x, reverse=True)[:k], and their indices if return_indices
+#
+def top_k(x, k: int, largest: bool = True, return_indices: bool = False):
+    '''The k largest (or smallest) elements of a SigFigArray or SciDataArray'''
+    x = as_array(x)
+    assert(k >= 0), f"k must not be negative, not {k}"
+    key = _values(x)
+    if largest:
+        key = -key
+    valid = np.nonzero(~np.isnan(key))[0]
+    if k > len(valid):
+        #every element in range, then the earliest missing elements
+        idx = np.concatenate([valid[np.argsort(key[valid], kind = "stable")],
+                              np.nonzero(np.isnan(key))[0][:k - len(valid)]])
+    elif k > 0:
+        #those before the k-th value, and the earliest of those tied with it
+        kv = key[valid]
+        t = np.partition(kv, k - 1)[k - 1]
+        below = valid[kv < t]
+        idx = np.concatenate([below, valid[kv == t][:k - len(below)]])
+        idx = idx[np.lexsort((idx, key[idx]))]
+    else:
+        idx = np.empty(0, dtype = np.int64)
+    if return_indices:
+        return x[idx], idx
+    return x[idx]
+
+#################################################################################
+# between
+#
+# Boolean mask of the elements with low <= value <= high (by value, as for
+# the sort, rather than the sigfig == of the scalar <=). inclusive is one of
+# "both", "left", "right" or "neither". Missing elements are never in range.
+#
+def between(x, low = None, high = None, inclusive: str = "both") -> np.ndarray:
+    '''Mask of the elements of a SigFigArray or SciDataArray whose values are within a range'''
+    assert(inclusive in ("both", "left", "right", "neither")), f"inclusive must be both, left, right or neither, not {inclusive}"
+    v = _values(x)
+    mask = ~np.isnan(v)
+    if low is not None:
+        lo = _as_values(low)
+        mask &= (v >= lo) if inclusive in ("both", "left") else (v > lo)
+    if high is not None:
+        hi = _as_values(high)
+        mask &= (v <= hi) if inclusive in ("both", "right") else (v < hi)
+    return mask
@@ -0,0 +1,481 @@
+# pandas_ext.py
+#
+# pandas extension dtypes for columns of SigFig and SciData, backed by the
+# columnar SigFigArray and SciDataArray, so that a DataFrame column of a
+# million SigFig holds a few NumPy arrays rather than a million objects.
+#
+# Usage:
+#   import standard_scientific.pandas_ext     #registers the dtypes
+#   s = pd.Series([SigFig.from_float(1.23, 3), ...], dtype="sigfig")
+#   d = pd.Series([SciData.from_str("1.23(4)"), ...], dtype="scidata")
+#
+# Arithmetic follows the same rules as the scalar classes (see SigFigArray
+# and SciDataArray), reductions and groupby follow reductions.py, and sorting
+# uses the values. Missing elements (NaN, None, pd.NA) are stored as the
+# missing elements of the columnar classes.
+#
+# pandas is an optional dependency, and this module is not imported by
+# standard_scientific itself.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.scidata import SciData
+from standard_scientific.float_compare import eps
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.reductions import reduce_sigfigs
+from standard_scientific.reductions import reduce_scidata
+from standard_scientific.reductions import SIGFIG_REDUCTIONS
+from standard_scientific.reductions import SCIDATA_REDUCTIONS
+
+#external imports
+import operator
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import ExtensionArray
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.extensions import register_extension_dtype
+from pandas.api.extensions import take
+
+#################################################################################
+# _is_na
+#
+# True for the scalars that pandas treats as missing
+#
+def _is_na(x):
+    return x is None or x is pd.NA or (isinstance(x, float) and np.isnan(x))
+
+#################################################################################
+# SigFigDtype, SciDataDtype
+#
+@register_extension_dtype
+class SigFigDtype(ExtensionDtype):
+    '''pandas dtype of columns of SigFig'''
+    name = "sigfig"
+    type = SigFig
+    kind = "O"
+    na_value = np.nan
+    _is_numeric = False
+
+    @classmethod
+    def construct_array_type(cls):
+        return SigFigExtensionArray
+
+    #see arrow_ext.py
+    def __from_arrow__(self, array):
+        from standard_scientific.arrow_ext import from_arrow
+        return SigFigExtensionArray(from_arrow(array))
+
+@register_extension_dtype
+class SciDataDtype(ExtensionDtype):
+    '''pandas dtype of columns of SciData'''
+    name = "scidata"
+    type = SciData
+    kind = "O"
+    na_value = np.nan
+    _is_numeric = False
+
+    @classmethod
+    def construct_array_type(cls):
+        return SciDataExtensionArray
+
+    #see arrow_ext.py
+    def __from_arrow__(self, array):
+        from standard_scientific.arrow_ext import from_arrow
+        return SciDataExtensionArray(from_arrow(array))
+
+#################################################################################
+# _ColumnarExtensionArray
+#
+# The parts of the two extension arrays that only depend on the columnar
+# storage (self._data), which supports len, indexing with integers, slices,
+# masks and index arrays, and assignment of elements.
+#
+class _ColumnarExtensionArray(ExtensionArray):
+
+    _array_type = None
+    _scalar_type = None
+
+    def __init__(self, data):
+        assert(isinstance(data, self._array_type)), f"{data} was not an instance of {self._array_type.__name__}"
+        self._data = data
+
+    ##########################
+    # Construction
+    #
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+        if isinstance(scalars, cls._array_type):
+            return cls(scalars)
+        return cls._from_scalars(list(scalars))
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls._from_scalars([None if v is None else cls._from_key(v) for v in values])
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(cls._concat([x._data for x in to_concat]))
+
+    ##########################
+    # Element access
+    #
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return self.dtype.na_value if self._missing()[item] else self._data[item]
+        item = pd.api.indexers.check_array_indexer(self, item)
+        return type(self)(self._data[item])
+
+    def __setitem__(self, key, value):
+        key = pd.api.indexers.check_array_indexer(self, key)
+        if isinstance(value, type(self)):
+            self._assign(key, value._data)
+        elif _is_na(value) or isinstance(value, self._scalar_type):
+            self._assign(key, None if _is_na(value) else value)
+        else:
+            self._assign(key, type(self)._from_sequence(value)._data)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    #numeric dtypes get the values (see as_exact), with NaN where missing
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and np.dtype(dtype).kind in "fc":
+            return self._values().astype(dtype)
+        out = np.empty(len(self), dtype=object)
+        out[:] = list(self)
+        return out if dtype is None else out.astype(dtype)
+
+    #see arrow_ext.py
+    def __arrow_array__(self, type=None):
+        from standard_scientific.arrow_ext import to_arrow
+        return to_arrow(self._data)
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in self._columns())
+
+    def isna(self):
+        return self._missing().copy()
+
+    def copy(self):
+        return type(self)(self._data[np.arange(len(self))])
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        idx = take(np.arange(len(self)), indices, allow_fill = allow_fill, fill_value = -1)
+        out = self._data[np.maximum(idx, 0)] if len(self) > 0 else self._empty(len(idx))
+        if allow_fill:
+            assert(_is_na(fill_value) or fill_value is self.dtype.na_value), f"Can only fill with missing values, not {fill_value}"
+            for i in np.flatnonzero(idx < 0):
+                self._assign_to(out, i, None)
+        return type(self)(out)
+
+    ##########################
+    # Sorting and factorizing
+    #
+    def _values_for_argsort(self):
+        return self._values()
+
+    def _values_for_factorize(self):
+        keys = np.empty(len(self), dtype=object)
+        keys[:] = [None if x is self.dtype.na_value else self._key(x) for x in self]
+        return keys, None
+
+    #the scalars are not hashable, so this goes through their keys
+    def unique(self):
+        keys, _ = self._values_for_factorize()
+        return self._from_factorized(pd.unique(keys), self)
+
+    ##########################
+    # Display
+    #
+    def _formatter(self, boxed=False):
+        return lambda x: "NaN" if _is_na(x) else str(x)
+
+    ##########################
+    # Comparisons
+    #
+    # Elementwise, as in the scalar classes, and False wherever either side
+    # is missing. == is only defined between two of the scalar type (as in
+    # the scalar classes), and anything else is not equal. The orderings
+    # compare the values, and also accept plain numbers.
+    #
+    def _compare(self, other, op):
+        if isinstance(other, (pd.Series, pd.DataFrame, pd.Index)):
+            return NotImplemented
+        miss = self._missing()
+        if isinstance(other, type(self)):
+            miss = miss | other._missing()
+            other = other._data
+        elif op in (operator.eq, operator.ne) and not isinstance(other, self._scalar_type):
+            return np.full(len(self), op is operator.ne)
+        with np.errstate(invalid="ignore"):
+            out = np.asarray(self._compare_data(self._data, other, op), dtype=bool)
+        return np.where(miss, op is operator.ne, out)
+
+    def __eq__(self, other): return self._compare(other, operator.eq)
+    def __ne__(self, other): return self._compare(other, operator.ne)
+    def __lt__(self, other): return self._compare(other, operator.lt)
+    def __le__(self, other): return self._compare(other, operator.le)
+    def __gt__(self, other): return self._compare(other, operator.gt)
+    def __ge__(self, other): return self._compare(other, operator.ge)
+
+    ##########################
+    # Arithmetic
+    #
+    # Applied to the rows where every operand has data, all other rows are
+    # missing. Operands may be arrays of the same dtype, scalars, plain
+    # numbers, or arrays of numbers (which are taken to be exact). As in
+    # propagate(), an array combined with itself (s * s) is a single input.
+    #
+    def _arith(self, other, op):
+        if isinstance(other, (pd.Series, pd.DataFrame, pd.Index)):
+            return NotImplemented
+        if isinstance(other, ExtensionArray) and not isinstance(other, type(self)):
+            other = np.asarray(other, dtype=float)
+        if isinstance(other, (list, tuple)):
+            other = type(self)._from_sequence(other)
+
+        valid = ~self._missing()
+        if op in (operator.neg, operator.abs):
+            rhs = None
+        elif isinstance(other, type(self)):
+            valid &= ~other._missing()
+            rhs = other._data[valid]
+        elif isinstance(other, np.ndarray) and other.ndim > 0:
+            valid &= ~np.isnan(other.astype(float))
+            rhs = other.astype(float)[valid]
+        elif _is_na(other):
+            valid[:] = False
+            rhs = other
+        else:
+            rhs = other
+
+        out = self._empty(len(self))
+        if np.any(valid):
+            x = self._data[valid]
+            if other is self:
+                rhs = x
+            self._assign_to(out, valid, op(x) if rhs is None else op(x, rhs))
+        return type(self)(out)
+
+    def __add__(self, other):      return self._arith(other, operator.add)
+    def __radd__(self, other):     return self._arith(other, lambda a, b: b + a)
+    def __sub__(self, other):      return self._arith(other, operator.sub)
+    def __rsub__(self, other):     return self._arith(other, lambda a, b: b - a)
+    def __mul__(self, other):      return self._arith(other, operator.mul)
+    def __rmul__(self, other):     return self._arith(other, lambda a, b: b * a)
+    def __truediv__(self, other):  return self._arith(other, operator.truediv)
+    def __rtruediv__(self, other): return self._arith(other, lambda a, b: b / a)
+    def __neg__(self):             return self._arith(None, operator.neg)
+    def __abs__(self):             return self._arith(None, operator.abs)
+
+    ##########################
+    # Reductions and groupby, see reductions.py
+    #
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        if name not in self._reductions:
+            return super()._reduce(name, skipna = skipna, keepdims = keepdims, **kwargs)
+        if not skipna and np.any(self._missing()):
+            out = self.dtype.na_value
+        else:
+            out = self._reducer(self._data, name)[0]
+            out = self.dtype.na_value if out is None else out
+        if keepdims:
+            return type(self)._from_sequence([out])
+        return out
+
+    def _groupby_op(self, *, how, has_dropped_na, min_count, ngroups, ids, **kwargs):
+        if how not in self._reductions:
+            return super()._groupby_op(how = how, has_dropped_na = has_dropped_na, min_count = min_count,
+                                       ngroups = ngroups, ids = ids, **kwargs)
+        out = type(self)(self._reducer(self._data, how, ids, ngroups))
+        if min_count > 0:
+            count = np.bincount(ids[(ids >= 0) & ~self._missing()], minlength = ngroups)
+            out[count < min_count] = None
+        return out
+
+#################################################################################
+# SigFigExtensionArray
+#
+class SigFigExtensionArray(_ColumnarExtensionArray):
+    '''pandas ExtensionArray of SigFig, stored as a SigFigArray'''
+
+    _array_type = SigFigArray
+    _scalar_type = SigFig
+    _reductions = SIGFIG_REDUCTIONS
+
+    @property
+    def dtype(self):
+        return SigFigDtype()
+
+    @classmethod
+    def _from_scalars(cls, scalars):
+        for s in scalars:
+            assert(_is_na(s) or isinstance(s, SigFig)), f"{s} was not an instance of SigFig"
+        return cls(SigFigArray.from_SigFigs([None if _is_na(s) else s for s in scalars]))
+
+    @staticmethod
+    def _key(x):
+        return (x.value, x.sigfigs, x.exponent)
+
+    @staticmethod
+    def _from_key(k):
+        return SigFig(value = k[0], sigfigs = k[1], exponent = k[2])
+
+    @staticmethod
+    def _concat(arrays):
+        return SigFigArray(value = np.concatenate([a.value for a in arrays]),
+                           sigfigs = np.concatenate([a.sigfigs for a in arrays]),
+                           exponent = np.concatenate([a.exponent for a in arrays]))
+
+    @staticmethod
+    def _empty(n):
+        return SigFigArray.missing(n)
+
+    @staticmethod
+    def _assign_to(data, key, other):
+        data[key] = other
+
+    @staticmethod
+    def _compare_data(data, other, op):
+        if isinstance(other, (SigFig, SigFigArray)) or op in (operator.eq, operator.ne):
+            return op(data, other)
+        return op(data.value, np.asarray(other, dtype=float))
+
+    @staticmethod
+    def _reducer(data, how, ids=None, ngroups=1):
+        return reduce_sigfigs(data, how, ids, ngroups)
+
+    def _assign(self, key, other):
+        self._data[key] = other
+
+    def _missing(self):
+        return self._data.is_missing()
+
+    def _columns(self):
+        return (self._data.value, self._data.sigfigs, self._data.exponent)
+
+    def _values(self):
+        return self._data.value.copy()
+
+#################################################################################
+# SciDataExtensionArray
+#
+class SciDataExtensionArray(_ColumnarExtensionArray):
+    '''pandas ExtensionArray of SciData, stored as a SciDataArray'''
+
+    _array_type = SciDataArray
+    _scalar_type = SciData
+    _reductions = SCIDATA_REDUCTIONS
+
+    @property
+    def dtype(self):
+        return SciDataDtype()
+
+    @classmethod
+    def _from_scalars(cls, scalars):
+        for s in scalars:
+            assert(_is_na(s) or isinstance(s, SciData)), f"{s} was not an instance of SciData"
+        out = cls._empty(len(scalars))
+        for i, s in enumerate(scalars):
+            if not _is_na(s):
+                cls._assign_to(out, i, s)
+        return cls(out)
+
+    @staticmethod
+    def _key(x):
+        return (SigFigExtensionArray._key(x.value), x.is_exact,
+                None if x.is_exact else SigFigExtensionArray._key(x.unc),
+                None if x.is_exact or x._rel_unc is None else SigFigExtensionArray._key(x._rel_unc))
+
+    @staticmethod
+    def _from_key(k):
+        f = SigFigExtensionArray._from_key
+        return SciData(value = f(k[0]), unc = None if k[2] is None else f(k[2]),
+                       rel_unc = None if k[3] is None else f(k[3]), is_exact = k[1])
+
+    #the relative uncertainties are left to be computed when first used (see
+    #SciDataArray.rel_unc), unless every array has them already
+    @staticmethod
+    def _concat(arrays):
+        c = SigFigExtensionArray._concat
+        lazy = any(a._rel_unc is None for a in arrays)
+        return SciDataArray(value = c([a.value for a in arrays]), unc = c([a.unc for a in arrays]),
+                            rel_unc = None if lazy else c([a.rel_unc for a in arrays]),
+                            is_exact = np.concatenate([a.is_exact for a in arrays]))
+
+    @staticmethod
+    def _empty(n):
+        return SciDataArray(value = SigFigArray.missing(n), unc = SigFigArray.missing(n),
+                            rel_unc = None, is_exact = np.ones(n, dtype=bool))
+
+    #a single SciData, None (missing), or a SciDataArray. The relative
+    #uncertainties are only assigned to data that has them already.
+    @staticmethod
+    def _assign_to(data, key, other):
+        rel = data._rel_unc is not None
+        if other is None:
+            data.value[key] = None
+            data.unc[key] = None
+            if rel:
+                data.rel_unc[key] = None
+            data.is_exact[key] = True
+        elif isinstance(other, SciData):
+            data.value[key] = other.value
+            data.unc[key] = None if other.is_exact else other.unc
+            if rel:
+                data.rel_unc[key] = None if other.is_exact else other.rel_unc
+            data.is_exact[key] = other.is_exact
+        else:
+            data.value[key] = other.value
+            data.unc[key] = other.unc
+            if rel:
+                data.rel_unc[key] = other.rel_unc
+            data.is_exact[key] = other.is_exact
+
+    #see SciData.__eq__, which compares every field unless either side is
+    #exact, and the orderings, which only compare the values
+    @staticmethod
+    def _compare_data(data, other, op):
+        if isinstance(other, SciData):
+            other = SciDataArray.from_SciData([other])
+        if op in (operator.eq, operator.ne):
+            a, b = data, other
+            rel = (a.rel_unc == b.rel_unc) | (a.rel_unc.is_missing() & b.rel_unc.is_missing())
+            same = (a.value == b.value) & (a.unc == b.unc) & rel
+            va, vb = a.value.value, b.value.value
+            close = np.abs(va - vb) < np.maximum(np.abs(va), np.abs(vb)) * eps
+            eq = np.where(a.is_exact | b.is_exact, close, same)
+            return eq if op is operator.eq else ~eq
+        if isinstance(other, SciDataArray):
+            other = other.value.value
+        return op(data.value.value, np.asarray(other, dtype=float))
+
+    @staticmethod
+    def _reducer(data, how, ids=None, ngroups=1):
+        return reduce_scidata(data, how, ids, ngroups)
+
+    def _assign(self, key, other):
+        self._assign_to(self._data, key, other)
+
+    def _missing(self):
+        return self._data.value.is_missing()
+
+    def _columns(self):
+        d = self._data
+        r = () if d._rel_unc is None else (d.rel_unc.value, d.rel_unc.sigfigs, d.rel_unc.exponent)
+        return (d.value.value, d.value.sigfigs, d.value.exponent, d.unc.value, d.unc.sigfigs, d.unc.exponent) + r + (d.is_exact,)
+
+    def _values(self):
+        return self._data.value.value.copy()
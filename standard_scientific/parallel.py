@@ -0,0 +1,219 @@
+# parallel.py
+#
+# Thread pool execution of the batch (array) operations: rounding,
+# from_floats, arithmetic, and reductions. Arrays are split into chunks
+# (along their first axis), which are evaluated in a pool of threads, and
+# the results are joined in order. NumPy releases the GIL for most of the
+# work on the columns, so that the chunks run on all of the cores.
+#
+#   ex = si.Executor(workers = 8)
+#   x = ex.from_floats(values, 4)
+#   y = ex.map(lambda a, b: a * b + 1., x, x2)
+#   total = ex.reduce("sum", x, func = lambda a: a * 2.)
+#
+# Warnings. w_round_array reports sensitive roundings through the warnings
+# module, whose catch_warnings is not thread safe. Within the chunks, the
+# roundings are instead recorded per thread (see sigfig_array.py), and the
+# calling thread issues them once all of the chunks are done. The i-th
+# rounding of every chunk (which, for elementwise operations, is the same
+# step of the computation) are merged into one warning, counting every
+# sensitive element and naming the first of them, which is exactly the
+# warning of the same operation on the whole array. The warnings therefore
+# do not depend on the number of workers, the chunk size, or the order in
+# which the threads finish. Should the chunks round a different number of
+# times, their warnings are issued one chunk after another, in order.
+#
+# The results are exactly those of the same operations on the whole array,
+# as long as func is elementwise. Reductions are made with the accumulators
+# of reductions.py (shared with chunked.py), which continue their sums in
+# order from one chunk to the next, and so are exactly those of the whole
+# array.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.sigfig_array import w_round_array
+from standard_scientific.sigfig_array import precision_events, precision_warning
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.shared import array_columns, array_from_views
+from standard_scientific.reductions import SigFigAccumulator, SciDataAccumulator
+
+#external imports
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import collections
+import os
+import warnings
+import numpy as np
+
+#default number of elements in a chunk
+CHUNK_SIZE = 1 << 16
+
+#################################################################################
+# _captured
+#
+# func(*args), and the roundings that it recorded in this thread
+#
+def _captured(func, *args):
+    previous = getattr(precision_events, "events", None)
+    precision_events.events = []
+    try:
+        return func(*args), precision_events.events
+    finally:
+        precision_events.events = previous
+
+#################################################################################
+# _merged
+#
+# The roundings of a list of chunks (one list of recorded roundings each),
+# merged in order
+#
+def _merged(chunks) -> list:
+    if len(set(len(c) for c in chunks)) > 1:
+        return [e for c in chunks for e in c]
+    merged = []
+    for step in zip(*chunks):
+        count = sum(e[0] for e in step)
+        first = next((e[2] for e in step if e[0] > 0), None)
+        merged.append((count, sum(e[1] for e in step), first))
+    return merged
+
+#issues the warnings, or records them if this is itself a worker thread
+def warn_merged(chunks):
+    '''Issue (or record) the merged precision warnings of chunks'''
+    merged = _merged(chunks)
+    events = getattr(precision_events, "events", None)
+    if events is not None:
+        events.extend(merged)
+        return
+    for count, size, first in merged:
+        if count > 0:
+            warnings.warn(precision_warning(count, size, first))
+
+#################################################################################
+# imap
+#
+# In-order results of func over items, with at most two per worker in
+# flight. The roundings recorded by each item are appended to events.
+#
+def imap(func, items, workers: int, events: list):
+    '''In-order results of func over items, on worker threads'''
+    if workers == 1:
+        for i in items:
+            r, e = _captured(func, i)
+            events.append(e)
+            yield r
+        return
+    with ThreadPoolExecutor(workers) as pool:
+        pending = collections.deque()
+        for i in items:
+            pending.append(pool.submit(_captured, func, i))
+            if len(pending) >= 2 * workers:
+                r, e = pending.popleft().result()
+                events.append(e)
+                yield r
+        while pending:
+            r, e = pending.popleft().result()
+            events.append(e)
+            yield r
+
+#################################################################################
+# _split and _join
+#
+# Arrays (SigFigArray, SciDataArray and NumPy arrays with the same first
+# dimension) are split into chunks, anything else is given to every chunk
+#
+def _length(args) -> int:
+    n = None
+    for a in args:
+        if isinstance(a, (SigFigArray, SciDataArray)) or (isinstance(a, np.ndarray) and a.ndim > 0):
+            assert(n is None or len(a) == n), f"Arrays of lengths {n} and {len(a)} are not aligned"
+            n = len(a)
+    assert(n is not None), f"At least one argument must be an array"
+    return n
+
+def _split(args, i0: int, i1: int):
+    return [a[i0:i1] if isinstance(a, (SigFigArray, SciDataArray)) or (isinstance(a, np.ndarray) and a.ndim > 0) else a
+            for a in args]
+
+def _join(results):
+    r = results[0]
+    if isinstance(r, tuple):
+        return tuple(_join(list(c)) for c in zip(*results))
+    if isinstance(r, (SigFigArray, SciDataArray)):
+        #the relative uncertainties are left to be computed when first used,
+        #if those of any of the results were
+        lazy = any(isinstance(a, SciDataArray) and a._rel_unc is None for a in results)
+        kinds, cols = zip(*[array_columns(a, lazy) for a in results])
+        return array_from_views(kinds[0], [np.concatenate(c) for c in zip(*cols)])
+    return np.concatenate(results)
+
+#################################################################################
+# Executor
+#
+#   workers    : the number of threads (default: the number of cores)
+#   chunk_size : the number of elements in a chunk
+#
+@dataclass
+class Executor:
+    '''Thread pool for the batch operations on SigFigArray and SciDataArray'''
+    workers: int = None
+    chunk_size: int = CHUNK_SIZE
+
+    def __post_init__(self):
+        if self.workers is None:
+            self.workers = os.cpu_count() or 1
+        assert(self.workers > 0), f"workers must be positive, not {self.workers}"
+        assert(self.chunk_size > 0), f"chunk_size must be positive, not {self.chunk_size}"
+
+    def _bounds(self, n: int):
+        return [(i, min(i + self.chunk_size, n)) for i in range(0, max(n, 1), self.chunk_size)]
+
+    #########################################################
+    # map
+    # func must be elementwise, and return arrays (or a tuple of arrays)
+    #
+    def map(self, func, *args):
+        '''Apply an elementwise function to chunks of the arrays in args, in parallel'''
+        bounds = self._bounds(_length(args))
+        events = []
+        results = list(imap(lambda b: func(*_split(args, *b)), bounds, min(self.workers, len(bounds)), events))
+        warn_merged(events)
+        return _join(results)
+
+    #########################################################
+    # Batch operations
+    #
+    def from_floats(self, value, sigfigs) -> SigFigArray:
+        '''Parallel SigFigArray.from_floats'''
+        value = np.asarray(value, dtype = float)
+        return self.map(SigFigArray.from_floats, value, np.broadcast_to(np.asarray(sigfigs), value.shape))
+
+    def w_round(self, x, d) -> np.ndarray:
+        '''Parallel w_round_array'''
+        x = np.asarray(x, dtype = float)
+        return self.map(w_round_array, x, np.broadcast_to(np.asarray(d), x.shape))
+
+    #########################################################
+    # reduce
+    #
+    # The reduction (as reduce_sigfigs or reduce_scidata of the whole array)
+    # of func(*args), or of args[0] if func is None, without holding all of
+    # func(*args) in memory at once
+    #
+    def reduce(self, how: str, *args, func = None):
+        '''Sum, mean, product, min, or max of an elementwise function of arrays, in parallel'''
+        if func is None:
+            func = lambda a: a
+        bounds = self._bounds(_length(args))
+        events = []
+        acc = None
+        for c in imap(lambda b: func(*_split(args, *b)), bounds, min(self.workers, len(bounds)), events):
+            if acc is None:
+                acc = SigFigAccumulator(how) if isinstance(c, SigFigArray) else SciDataAccumulator(how)
+            acc.add(c)
+        warn_merged(events)
+        return acc.result()
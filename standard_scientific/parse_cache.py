@@ -0,0 +1,314 @@
+# parse_cache.py
+#
+# A persistent, on-disk cache of parsed chunks of files of strings in
+# scientific notation (as read by convert.py), so that re-reading a large
+# file in which only a few lines changed only parses the chunks that changed.
+#
+#   cache = ParseCache("parsed", max_bytes = 1 << 30)
+#   x = cache.load("reference.txt")                   #a SciDataArray
+#   for x, nwarn, nskip in cache.chunks(f): ...        #one chunk at a time
+#   convert("reference.txt", "out.csv", cache = cache)
+#
+# How this works. The lines of the input are split into chunks at lines
+# chosen by their content (those whose crc32 is a multiple of a number set by
+# chunk_size), rather than every chunk_size lines, so that inserting or
+# deleting lines only changes the chunks around them. Each chunk is keyed by
+# a hash of its lines, the parsing options and the version stamp. Chunks
+# found in the cache are memory-mapped (read-only) from a single file of
+# columns, and the others are parsed with
+# convert.parse_chunk and written to the cache. The results are exactly
+# those of parse_chunk, including the counts of precision warnings and
+# skipped lines.
+#
+# The version stamp is a hash of CACHE_VERSION and of the source of the
+# modules that parse (sigfig.py, scidata.py, sigfig_array.py, propagation.py
+# and convert.py), so that any change to the parser invalidates every entry.
+# Entries of other versions are removed when a cache is opened.
+#
+# The cache is limited to max_bytes (and max_entries, if given). Entries are
+# evicted least recently used first, after every pass over an input, so that
+# the chunks of the latest input are kept if they fit.
+#
+# NOTE: A cache may only be used by one process at a time. Entries and the
+#       index are written to temporary files and renamed into place, so an
+#       interrupted write leaves the cache readable.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific import sigfig, scidata, sigfig_array, propagation, convert
+from standard_scientific.convert import CHUNK_SIZE, ConvertStats, parse_task
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.shared import LAYOUTS, array_columns, array_from_views
+
+#external imports
+from concurrent.futures import ProcessPoolExecutor
+import collections
+import functools
+import hashlib
+import json
+import os
+import zlib
+import numpy as np
+
+#format of the cache on disk
+CACHE_VERSION = 1
+
+#default limit on the size of a cache
+MAX_BYTES = 1 << 32
+
+#the columns of an entry (value, unc and is_exact, in the order of shared.py),
+#each 8 byte aligned. The relative uncertainties are computed when first used.
+_ENTRY = LAYOUTS["sigfig"] * 2 + [np.bool_]
+
+def _entry_views(buf, n: int):
+    views = []
+    offset = 0
+    for dtype in _ENTRY:
+        views.append(np.frombuffer(buf, dtype = dtype, count = n, offset = offset))
+        offset += -(-n * np.dtype(dtype).itemsize // 8) * 8
+    return views
+
+def _entry_nbytes(n: int) -> int:
+    return max(1, sum(-(-n * np.dtype(d).itemsize // 8) * 8 for d in _ENTRY))
+
+#################################################################################
+# parser_version
+#
+# The version stamp of the entries, see above
+#
+@functools.lru_cache(maxsize = None)
+def parser_version() -> str:
+    '''Hash of the cache format and of the source of the parser'''
+    h = hashlib.blake2b(str(CACHE_VERSION).encode(), digest_size = 16)
+    for m in (sigfig, scidata, sigfig_array, propagation, convert):
+        with open(m.__file__, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+#################################################################################
+# content_chunks
+#
+# Yields lists of (line number, string) of the non-blank lines of f, ending
+# each chunk after a line whose crc32 is a multiple of chunk_size // 2 (once
+# there are at least chunk_size // 2 lines), or at 4 * chunk_size lines. The
+# chunks have about chunk_size lines on average. The bytes read are counted
+# in stats, if given.
+#
+def content_chunks(f, chunk_size: int = CHUNK_SIZE, stats: ConvertStats = None):
+    '''Split the lines of a file into chunks at lines chosen by their content'''
+    assert(chunk_size > 0), f"chunk_size must be positive, not {chunk_size}"
+    half = max(1, chunk_size // 2)
+    chunk = []
+    for n, line in enumerate(f, 1):
+        if stats is not None:
+            stats.bytes_read += len(line.encode())
+        s = line.strip()
+        if s:
+            chunk.append((n, s))
+            if (len(chunk) >= half and zlib.crc32(s.encode()) % half == 0) or len(chunk) == 4 * chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+#################################################################################
+# ParseCache
+#
+#   path        : directory of the cache (created if needed)
+#   max_bytes   : limit on the total size of the entries
+#   max_entries : limit on the number of entries (None for no limit)
+#
+class ParseCache:
+    '''Persistent cache of parsed chunks of files of strings in scientific notation'''
+
+    def __init__(self, path, max_bytes: int = MAX_BYTES, max_entries: int = None):
+        assert(max_bytes >= 0), f"max_bytes cannot be negative, not {max_bytes}"
+        assert(max_entries is None or max_entries >= 0), f"max_entries cannot be negative, not {max_entries}"
+        self.path = str(path)
+        self.max_bytes = int(max_bytes)
+        self.max_entries = max_entries
+        self.version = parser_version()
+        os.makedirs(self.path, exist_ok = True)
+
+        index = {}
+        if os.path.exists(self._file("index.json")):
+            with open(self._file("index.json")) as f:
+                index = json.load(f)
+        self._entries = index.get("entries", {}) if index.get("version") == self.version else {}
+        self._clock = max((e["used"] for e in self._entries.values()), default = 0)
+
+        #anything that is not an entry of this version (old versions, interrupted writes)
+        for name in os.listdir(self.path):
+            if (name.endswith(".bin") and name[:-4] not in self._entries) or name.endswith(".tmp"):
+                os.remove(self._file(name))
+        self._save_index()
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def _save_index(self):
+        with open(self._file("index.json.tmp"), "w") as f:
+            json.dump({"version": self.version, "entries": self._entries}, f)
+        os.replace(self._file("index.json.tmp"), self._file("index.json"))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        '''Total size of the entries'''
+        return sum(e["nbytes"] for e in self._entries.values())
+
+    #########################################################
+    # Entries
+    #
+    # Each entry is one file of the columns of a SciDataArray (see _ENTRY),
+    # along with (in the index) its length, the number of
+    # precision warnings and skipped lines, and when it was last used
+    #
+    def _key(self, lines, unc_sigfigs, skip) -> str:
+        h = hashlib.blake2b(f"{self.version} {unc_sigfigs} {skip}\n".encode(), digest_size = 16)
+        for _, s in lines:
+            h.update(s.encode())
+            h.update(b"\n")
+        return h.hexdigest()
+
+    #an entry whose file is missing or short (removed or truncated by another
+    #ParseCache on the same directory) is a miss, and is dropped
+    def _get(self, key: str):
+        e = self._entries.get(key)
+        if e is None:
+            return None
+        nbytes = _entry_nbytes(e["length"])
+        try:
+            size = os.path.getsize(self._file(f"{key}.bin"))
+        except OSError:
+            size = -1
+        if size < nbytes:
+            self._entries.pop(key)
+            self._remove(key)
+            return None
+        self._clock += 1
+        e["used"] = self._clock
+        v = _entry_views(np.memmap(self._file(f"{key}.bin"), dtype = np.uint8, mode = "r", shape = (nbytes,)), e["length"])
+        x = SciDataArray(value = array_from_views("sigfig", v[0:3]), unc = array_from_views("sigfig", v[3:6]), rel_unc = None, is_exact = v[6])
+        return x, e["warnings"], e["skipped"]
+
+    def _put(self, key: str, x, nwarn: int, skipped: int):
+        n = len(x)
+        buf = bytearray(_entry_nbytes(n))
+        for v, c in zip(_entry_views(buf, n), array_columns(x.value)[1] + array_columns(x.unc)[1] + [x.is_exact]):
+            v[:] = c
+        with open(self._file(f"{key}.tmp"), "wb") as f:
+            f.write(buf)
+        os.replace(self._file(f"{key}.tmp"), self._file(f"{key}.bin"))
+        self._clock += 1
+        self._entries[key] = {"length": n, "nbytes": len(buf), "warnings": nwarn, "skipped": skipped, "used": self._clock}
+
+    def _remove(self, key: str):
+        try:
+            os.remove(self._file(f"{key}.bin"))
+        except FileNotFoundError:
+            pass
+
+    #########################################################
+    # evict
+    # Removes the least recently used entries until the cache is within its limits
+    #
+    def evict(self) -> int:
+        '''Enforce the limits of the cache, returning the number of entries removed'''
+        nbytes = self.nbytes
+        removed = 0
+        for key in sorted(self._entries, key = lambda k: self._entries[k]["used"]):
+            if nbytes <= self.max_bytes and (self.max_entries is None or len(self._entries) <= self.max_entries):
+                break
+            nbytes -= self._entries.pop(key)["nbytes"]
+            self._remove(key)
+            removed += 1
+        self._save_index()
+        return removed
+
+    def clear(self):
+        '''Remove every entry'''
+        for key in self._entries:
+            self._remove(key)
+        self._entries = {}
+        self._save_index()
+
+    #########################################################
+    # chunks
+    #
+    #   src         : path of the input, or an open text file
+    #   chunk_size  : average number of lines in a chunk (see content_chunks)
+    #   unc_sigfigs : as in parse_chunk
+    #   skip        : as in parse_chunk
+    #   workers     : number of processes parsing the chunks not in the cache
+    #   stats       : ConvertStats to count the bytes read and the cache hits
+    #                 and misses in
+    #
+    # Yields (SciDataArray, number of precision warnings, number of skipped
+    # lines) for every chunk, in order, as parse_chunk does. The arrays of
+    # cached chunks are read-only memory maps, copy them to modify them.
+    #
+    def chunks(self, src, chunk_size: int = CHUNK_SIZE, unc_sigfigs: int = None, skip: bool = False,
+               workers: int = 1, stats: ConvertStats = None):
+        '''Parse the chunks of a file, only parsing those that are not in the cache'''
+        assert(workers > 0), f"workers must be positive, not {workers}"
+        stats = ConvertStats() if stats is None else stats
+        fin = src if hasattr(src, "read") else open(src, "r")
+        pool = ProcessPoolExecutor(workers) if workers > 1 else None
+        pending = collections.deque()
+
+        #in order, with at most two chunks per worker in flight
+        def done(key, r):
+            if key is None:
+                return r
+            r = r.result() if pool is not None else r
+            self._put(key, *r)
+            return r
+
+        try:
+            for lines in content_chunks(fin, chunk_size, stats):
+                key = self._key(lines, unc_sigfigs, skip)
+                hit = self._get(key)
+                if hit is not None:
+                    stats.cache_hits += 1
+                    pending.append((None, hit))
+                else:
+                    stats.cache_misses += 1
+                    task = (lines, unc_sigfigs, skip)
+                    pending.append((key, pool.submit(parse_task, task) if pool is not None else parse_task(task)))
+                while len(pending) > (2 * workers if pool is not None else 0):
+                    yield done(*pending.popleft())
+            while pending:
+                yield done(*pending.popleft())
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures = True)
+            if fin is not src:
+                fin.close()
+            self.evict()
+
+    #########################################################
+    # load
+    # The whole of a file, parsed into a SciDataArray in memory (counting the
+    # rows, warnings and skipped lines in stats, as convert does)
+    #
+    def load(self, src, chunk_size: int = CHUNK_SIZE, unc_sigfigs: int = None, skip: bool = False,
+             workers: int = 1, stats: ConvertStats = None):
+        '''Parse a file into a SciDataArray, only parsing the chunks that are not in the cache'''
+        stats = ConvertStats() if stats is None else stats
+        arrays = []
+        for x, nwarn, nskip in self.chunks(src, chunk_size, unc_sigfigs, skip, workers, stats):
+            arrays.append(x)
+            stats.rows += len(x)
+            stats.precision_warnings += nwarn
+            stats.skipped += nskip
+        if arrays:
+            cols = [np.concatenate(c) for c in zip(*[array_columns(a.value)[1] + array_columns(a.unc)[1] + [a.is_exact] for a in arrays])]
+        else:
+            cols = [np.empty(0, dtype = d) for d in _ENTRY]
+        return SciDataArray(value = array_from_views("sigfig", cols[0:3]), unc = array_from_views("sigfig", cols[3:6]), rel_unc = None, is_exact = cols[6])
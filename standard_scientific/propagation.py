@@ -0,0 +1,303 @@
+# propagation.py
+#
+# First-order (linear) propagation of uncertainties through functions of
+# SciData, using forward-mode differentiation with the Dual class. The
+# function is evaluated ONCE on Dual numbers, which yields the value and
+# all of the partial derivatives with respect to the uncertain inputs at
+# the same time, and the uncertainty follows from
+#
+#   u(f)^2 = sum_i (df/dx_i * u(x_i))^2
+#
+# plus the terms from any correlations between the inputs (see covariance.py).
+#
+# This also provides the elementary functions (exp, log, sqrt, trig, ...)
+# for SciData, SciDataArray, Dual, and plain floats/arrays.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.sigfig import exponent_from_float
+from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.sigfig_array import exponents_from_floats
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.dual import Dual
+from standard_scientific.covariance import CovarianceRegistry
+from standard_scientific.covariance import registry as default_registry
+
+#external imports
+import sys
+import numpy as np
+
+#sentinel number of sigfigs for elements without an uncertain input
+NO_SIGFIGS = np.iinfo(np.int64).max
+
+#################################################################################
+# _is_uncertain
+#
+# True if x is SciData (or SciDataArray) with at least one inexact value
+def _is_uncertain(x):
+    if isinstance(x, SciData):
+        return not x.is_exact
+    if isinstance(x, SciDataArray):
+        return not np.all(x.is_exact)
+    return False
+
+#################################################################################
+# propagate
+#
+# Evaluates func on the given arguments and propagates the uncertainties of
+# the SciData (or SciDataArray) arguments to first order.
+#
+#   func        : function of the arguments. It is called with Dual numbers,
+#                 so it must be written in terms of arithmetic operators and
+#                 NumPy ufuncs (np.exp, np.sin, ...) or the functions below
+#   args        : SciData, SciDataArray, or plain floats/arrays/SigFig, the
+#                 last of which are taken to be exact (see .as_exact())
+#   unc_sigfigs : sigfigs of the resulting uncertainty. By default this is
+#                 the smallest number of sigfigs in the uncertainties of the
+#                 inputs
+#   covariance  : the CovarianceRegistry holding the correlations between
+#                 the inputs. None uses the default registry, and False
+#                 ignores correlations entirely ("no_covar")
+#
+# Following the README, exact inputs enter the calculation through .as_exact(),
+# and the result is only exact if none of the inputs are uncertain (or if the
+# propagated uncertainty vanishes). Inexact results have their value rounded
+# to the last significant place of their uncertainty, as in SciData.from_str.
+#
+# Passing the SAME object more than once treats it as a single input (so that
+# x * x has twice the relative uncertainty of x), while different objects are
+# correlated as given by the registry, which gives
+#
+#   u(f)^2 = sum_ij df/dx_i * df/dx_j * r(x_i, x_j) * u(x_i) * u(x_j)
+#
+# If any argument is a SciDataArray (or array), the function is evaluated on
+# whole arrays at once and a SciDataArray is returned. Elements of the arrays
+# are taken to be independent of one another.
+#
+def propagate(func, *args, unc_sigfigs=None, covariance=None):
+    '''Propagate the uncertainties of SciData arguments through func to first order'''
+
+    #each distinct uncertain input gets its own seed
+    seeds = {}
+    leaves = []
+    for a in args:
+        if _is_uncertain(a) and id(a) not in seeds:
+            seeds[id(a)] = len(leaves)
+            leaves.append(a)
+    n = len(leaves)
+
+    xs = []
+    for a in args:
+        if id(a) in seeds:
+            xs.append(Dual.seed(a.as_exact(), seeds[id(a)], n))
+        elif isinstance(a, (SciData, SciDataArray, SigFig, SigFigArray)):
+            xs.append(a.as_exact())
+        else:
+            xs.append(a)
+
+    out = func(*xs)
+    if isinstance(out, Dual):
+        value, grad = out.value, out.grad
+    else:
+        value, grad = out, np.zeros((n,) + np.shape(out))
+
+    #uncertainties and sigfigs of the inputs (zero for exact elements)
+    gu = np.zeros((n,) + np.shape(value))
+    usf = np.full(np.shape(value), NO_SIGFIGS)
+    for k, a in enumerate(leaves):
+        if isinstance(a, SciDataArray):
+            u = np.where(a.is_exact, 0., a.unc.value)
+            s = np.where(a.is_exact, NO_SIGFIGS, a.unc.sigfigs)
+        else:
+            u = a.unc.value
+            s = a.unc.sigfigs
+        gu[k] = grad[k] * u
+        usf = np.minimum(usf, s)
+    var = (gu**2).sum(axis=0)
+
+    #off-diagonal terms of J.S.J^T from the (sparse) correlations
+    if covariance is not False:
+        reg = default_registry if covariance is None else covariance
+        assert(isinstance(reg, CovarianceRegistry)), f"{reg} was not an instance of CovarianceRegistry"
+        rows, cols, r = reg.sparse_correlations(leaves)
+        if len(r) > 0:
+            r = r.reshape((-1,) + (1,) * np.ndim(value))
+            var = var + 2. * (r * gu[rows] * gu[cols]).sum(axis=0)
+    unc = np.sqrt(np.maximum(var, 0.))
+
+    if unc_sigfigs is not None:
+        usf = np.where(usf == NO_SIGFIGS, usf, int(unc_sigfigs))
+
+    if np.ndim(value) == 0:
+        return propagated_SciData(float(value), float(unc), int(usf))
+    return propagated_SciDataArray(np.asarray(value, dtype=float), unc, usf)
+
+#################################################################################
+# propagate_covariance
+#
+# Propagates uncertainties to a batch of m derived quantities at once, and
+# returns their full covariance matrix along with them.
+#
+#   func     : function of the arguments returning a sequence of m results
+#   args     : SciData or plain numbers, as in propagate()
+#   covariance : CovarianceRegistry of the inputs (None for the default)
+#   register : if True, the correlations between the results are stored in
+#              the registry, so that later arithmetic between them uses them
+#
+# With J the m x n Jacobian from a single evaluation on Dual numbers, and the
+# input covariance S = D.R.D (D the diagonal of uncertainties and R the sparse
+# correlations), the covariance of the results is
+#
+#   J.S.J^T = (JD).(JD)^T + sum_{(i,j) in R} r_ij (JD)_i (JD)_j^T
+#
+# which is evaluated as two matrix products over the nonzero correlations.
+#
+# Returns (list of SciData, m x m covariance matrix)
+#
+def propagate_covariance(func, *args, unc_sigfigs=None, covariance=None, register: bool = False):
+    '''Propagate uncertainties to a batch of derived quantities and return their covariance matrix'''
+
+    reg = default_registry if covariance is None else covariance
+    assert(isinstance(reg, CovarianceRegistry)), f"{reg} was not an instance of CovarianceRegistry"
+
+    seeds = {}
+    leaves = []
+    for a in args:
+        assert(not isinstance(a, SciDataArray)), f"propagate_covariance takes SciData, not SciDataArray"
+        if _is_uncertain(a) and id(a) not in seeds:
+            seeds[id(a)] = len(leaves)
+            leaves.append(a)
+    n = len(leaves)
+
+    xs = []
+    for a in args:
+        if id(a) in seeds:
+            xs.append(Dual.seed(a.as_exact(), seeds[id(a)], n))
+        elif isinstance(a, (SciData, SigFig)):
+            xs.append(a.as_exact())
+        else:
+            xs.append(a)
+
+    outs = list(func(*xs))
+    m = len(outs)
+    value = np.array([float(y.value) if isinstance(y, Dual) else float(y) for y in outs])
+    jac = np.zeros((m, n))
+    for i, y in enumerate(outs):
+        if isinstance(y, Dual):
+            jac[i] = y.grad
+
+    u = np.array([a.unc.as_exact() for a in leaves])
+    jd = jac * u
+    cov = jd @ jd.T
+    rows, cols, r = reg.sparse_correlations(leaves)
+    if len(r) > 0:
+        a = jd[:, rows] * r
+        b = jd[:, cols]
+        cov += a @ b.T + b @ a.T
+
+    usf = min([a.unc.sigfigs for a in leaves], default = NO_SIGFIGS) if unc_sigfigs is None else int(unc_sigfigs)
+    sd = np.sqrt(np.maximum(np.diag(cov), 0.))
+    results = [propagated_SciData(value[i], sd[i], usf if n > 0 else NO_SIGFIGS) for i in range(m)]
+
+    if register:
+        for i in range(m):
+            for j in range(i + 1, m):
+                if sd[i] > 0. and sd[j] > 0. and cov[i, j] != 0. and results[i] is not results[j]:
+                    reg.set_correlation(results[i], results[j], max(-1., min(1., cov[i, j] / (sd[i] * sd[j]))))
+
+    return results, cov
+
+#################################################################################
+# propagated_SciData
+#
+# Builds the SciData result of a propagation
+def propagated_SciData(value, unc, usf):
+    '''SciData of a propagated value and uncertainty, with usf sigfigs in the uncertainty'''
+    if usf == NO_SIGFIGS or unc == 0.:
+        return SciData.exact_from_float(value)
+
+    unc_SigFig = SigFig.from_float(value = unc, sigfigs = usf)
+    val_sfig = max(1, exponent_from_float(value) - unc_SigFig.sigfig_place() + 1)
+    value_SigFig = SigFig.from_float(value = value, sigfigs = val_sfig)
+
+    #the relative uncertainty of zero is undefined
+    if value_SigFig.value == 0.:
+        return SciData(value = value_SigFig, unc = unc_SigFig, rel_unc = None, is_exact = False)
+    return SciData.from_SigFigs(value = value_SigFig, unc = unc_SigFig, rel_unc = None, is_exact = False)
+
+#################################################################################
+# propagated_SciDataArray
+#
+# Builds the SciDataArray result of a propagation (vectorized propagated_SciData)
+def propagated_SciDataArray(value, unc, usf):
+    '''SciDataArray of propagated values and uncertainties, with usf sigfigs in the uncertainties'''
+    assert(value.ndim == 1), f"Propagation over arrays requires one dimensional results, not {value.shape}"
+    n = len(value)
+    exact = (usf == NO_SIGFIGS) | (unc == 0.)
+    inexact = ~exact
+
+    u = SigFigArray.missing(n)
+    u[inexact] = SigFigArray.from_floats(unc[inexact], usf[inexact])
+
+    v = SigFigArray(value = value.copy(), sigfigs = np.full(n, sys.float_info.dig, dtype=np.int64),
+                    exponent = exponents_from_floats(value))
+    val_sfig = np.maximum(1, v.exponent[inexact] - u.sigfig_place()[inexact] + 1)
+    v[inexact] = SigFigArray.from_floats(value[inexact], val_sfig)
+
+    return SciDataArray.from_SigFigArrays(value = v, unc = u, rel_unc = None, is_exact = exact)
+
+#################################################################################
+# Elementary functions
+#
+# These propagate uncertainties for SciData and SciDataArray arguments, and
+# are otherwise the NumPy ufunc of the same name (which also handles Dual).
+#
+def _apply(ufunc, *args):
+    if any(isinstance(a, (SciData, SciDataArray)) for a in args):
+        return propagate(ufunc, *args)
+    return ufunc(*args)
+
+def exp(x):
+    '''Exponential, with first-order propagation of uncertainty'''
+    return _apply(np.exp, x)
+
+def log(x):
+    '''Natural logarithm, with first-order propagation of uncertainty'''
+    return _apply(np.log, x)
+
+def log10(x):
+    '''Base 10 logarithm, with first-order propagation of uncertainty'''
+    return _apply(np.log10, x)
+
+def sqrt(x):
+    '''Square root, with first-order propagation of uncertainty'''
+    return _apply(np.sqrt, x)
+
+def sin(x):
+    '''Sine, with first-order propagation of uncertainty'''
+    return _apply(np.sin, x)
+
+def cos(x):
+    '''Cosine, with first-order propagation of uncertainty'''
+    return _apply(np.cos, x)
+
+def tan(x):
+    '''Tangent, with first-order propagation of uncertainty'''
+    return _apply(np.tan, x)
+
+def arcsin(x):
+    '''Inverse sine, with first-order propagation of uncertainty'''
+    return _apply(np.arcsin, x)
+
+def arccos(x):
+    '''Inverse cosine, with first-order propagation of uncertainty'''
+    return _apply(np.arccos, x)
+
+def arctan(x):
+    '''Inverse tangent, with first-order propagation of uncertainty'''
+    return _apply(np.arctan, x)
@@ -0,0 +1,262 @@
+# reductions.py
+#
+# Reductions (sum, mean, prod, min, max) over SigFigArray and SciDataArray,
+# either of a whole array or of groups of its elements given by an array of
+# group ids (as in a groupby), computed with vectorized NumPy operations.
+#
+# How the results are rounded. A reduction is treated as a SINGLE operation
+# on all of its elements, and rounded once:
+#   sum  : rounded to the limiting (largest) sigfig place of the elements
+#          (keeping at least one sigfig, as for a sum that cancels to zero)
+#   prod : the smallest number of sigfigs of the elements
+#   mean : the sum, divided by the (exact) number of elements
+# Chaining the scalar operators (a + b + c + ...) instead rounds after every
+# step, and so may differ from these in the last place.
+#
+# For SciData, the elements are independent of one another, and the
+# uncertainties are propagated as in propagation.py (the uncertainty of a sum
+# is the root of the sum of the squares). The sigfigs of the result are the
+# smallest of those of the uncertainties.
+#
+# Missing elements are skipped, and groups without any elements are missing.
+# For min and max, the first of any tied elements is returned.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.sigfig_array import exponents_from_floats
+from standard_scientific.sigfig_array import w_round_array
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.propagation import NO_SIGFIGS
+from standard_scientific.propagation import propagated_SciDataArray
+
+#external imports
+import numpy as np
+
+SIGFIG_REDUCTIONS = ("sum", "mean", "prod", "min", "max")
+SCIDATA_REDUCTIONS = ("sum", "mean", "min", "max")
+
+#################################################################################
+# group_ids
+#
+# The ids and number of groups of the non-missing elements
+#
+def group_ids(valid, ids, ngroups):
+    '''Group ids of the valid elements, the valid mask, and the number of groups'''
+    if ids is None:
+        ids = np.zeros(len(valid), dtype=np.int64)
+        ngroups = 1
+    ids = np.asarray(ids, dtype=np.int64)
+    assert(ids.shape == valid.shape), f"Group ids have shape {ids.shape}, but the data has shape {valid.shape}"
+    valid = valid & (ids >= 0)
+    return ids[valid], valid, int(ngroups)
+
+#position (into the selected elements) of the first min/max of every group
+def _arg_extreme(value, ids, ngroups, how):
+    key = value if how == "min" else -value
+    order = np.lexsort((key, ids))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = ids[order][1:] != ids[order][:-1]
+    pos = np.full(ngroups, -1, dtype=np.int64)
+    pos[ids[order][first]] = order[first]
+    return pos
+
+#################################################################################
+# reduce_sigfigs
+#
+#   x       : SigFigArray
+#   how     : one of SIGFIG_REDUCTIONS
+#   ids     : group of every element (negative to drop it), None for a single group
+#   ngroups : the number of groups
+#
+# Returns a SigFigArray with one element per group
+#
+def reduce_sigfigs(x: SigFigArray, how: str, ids=None, ngroups: int = 1) -> SigFigArray:
+    '''Sum, mean, product, min, or max of (groups of) the elements of a SigFigArray'''
+    assert(isinstance(x, SigFigArray)), f"{x} was not an instance of SigFigArray ."
+    assert(how in SIGFIG_REDUCTIONS), f"Reduction {how} is not one of {SIGFIG_REDUCTIONS}"
+
+    g, valid, ngroups = group_ids(~x.is_missing(), ids, ngroups)
+    v = x.value[valid]
+    count = np.bincount(g, minlength = ngroups)
+    found = count > 0
+    out = SigFigArray.missing(ngroups)
+
+    if how in ("min", "max"):
+        pos = _arg_extreme(v, g, ngroups, how)
+        out[found] = x[valid][pos[found]]
+        return out
+
+    if how == "prod":
+        val = np.ones(ngroups)
+        np.multiply.at(val, g, v)
+        sf = np.full(ngroups, NO_SIGFIGS)
+        np.minimum.at(sf, g, x.sigfigs[valid])
+        out[found] = SigFigArray.from_floats(val[found], sf[found])
+        return out
+
+    #sum (and mean), rounded once to the limiting place
+    total = np.bincount(g, weights = v, minlength = ngroups)
+    limd = np.full(ngroups, np.iinfo(np.int64).min)
+    np.maximum.at(limd, g, x.sigfig_place()[valid])
+    out[found] = round_sum(total[found], limd[found], count[found], how)
+    return out
+
+#the sums (or means) of count elements, rounded to their limiting places
+def round_sum(total, limd, count, how) -> SigFigArray:
+    '''Sums (or means) of SigFigs, rounded to their limiting places'''
+    val = w_round_array(total, -limd)
+    s = SigFigArray.from_floats(val, np.maximum(1, exponents_from_floats(val) - limd + 1))
+    if how == "mean":
+        s = SigFigArray.from_floats(s.value / count, s.sigfigs)
+    return s
+
+#################################################################################
+# reduce_scidata
+#
+# As reduce_sigfigs, for a SciDataArray. Returns a SciDataArray with one
+# element per group.
+#
+def reduce_scidata(x: SciDataArray, how: str, ids=None, ngroups: int = 1) -> SciDataArray:
+    '''Sum, mean, min, or max of (groups of) the elements of a SciDataArray'''
+    assert(isinstance(x, SciDataArray)), f"{x} was not an instance of SciDataArray ."
+    assert(how in SCIDATA_REDUCTIONS), f"Reduction {how} is not one of {SCIDATA_REDUCTIONS}"
+
+    g, valid, ngroups = group_ids(~x.value.is_missing(), ids, ngroups)
+    count = np.bincount(g, minlength = ngroups)
+    found = count > 0
+
+    if how in ("min", "max"):
+        pos = _arg_extreme(x.value.value[valid], g, ngroups, how)
+        sel = x[valid][pos[found]]
+        #relative uncertainties that were not computed are not computed here either
+        lazy = x._rel_unc is None
+        out = SciDataArray(value = SigFigArray.missing(ngroups), unc = SigFigArray.missing(ngroups),
+                           rel_unc = None if lazy else SigFigArray.missing(ngroups), is_exact = np.ones(ngroups, dtype=bool))
+        out.value[found] = sel.value
+        out.unc[found] = sel.unc
+        if not lazy:
+            out.rel_unc[found] = sel.rel_unc
+        out.is_exact[found] = sel.is_exact
+        return out
+
+    exact = x.is_exact[valid]
+    u = np.where(exact, 0., x.unc.value[valid])
+    total = np.bincount(g, weights = x.value.value[valid], minlength = ngroups)
+    var = np.bincount(g, weights = u * u, minlength = ngroups)
+    usf = np.full(ngroups, NO_SIGFIGS)
+    np.minimum.at(usf, g, np.where(exact, NO_SIGFIGS, x.unc.sigfigs[valid]))
+
+    return propagate_sum(total, var, usf, count, how)
+
+#the SciData sums (or means) of count independent elements, given the sums
+#of their values and variances (missing where count is zero)
+def propagate_sum(total, var, usf, count, how) -> SciDataArray:
+    '''Sums (or means) of independent SciData, from the sums of their values and variances'''
+    found = count > 0
+    n = np.maximum(count, 1)
+    if how == "mean":
+        total = total / n
+        var = var / (n * n)
+    #the (lazy) relative uncertainties of the missing groups are missing
+    out = propagated_SciDataArray(total, np.sqrt(var), usf)
+    out.value[~found] = None
+    return out
+
+#################################################################################
+# Accumulators
+#
+# The state of a reduction over an array given one chunk at a time (see
+# chunked.py and parallel.py). Sums (and products) are continued from one
+# chunk to the next with ufunc.at, which adds the elements in order exactly
+# as the bincount above does over the whole array. The first of any tied
+# min/max elements is kept.
+#
+def _continued(ufunc, start: float, values) -> float:
+    acc = np.array([start])
+    ufunc.at(acc, np.zeros(len(values), dtype = np.int64), values)
+    return float(acc[0])
+
+class _Extreme:
+    def __init__(self, how):
+        self.how = how
+        self.best = None
+        self.key = None
+
+    def add(self, values, x):
+        if len(values) == 0:
+            return
+        i = int(np.argmin(values) if self.how == "min" else np.argmax(values))
+        v = float(values[i])
+        if self.key is None or (v < self.key if self.how == "min" else v > self.key):
+            self.key = v
+            self.best = x[i]
+
+class SigFigAccumulator:
+    '''reduce_sigfigs of an array given one chunk at a time'''
+    def __init__(self, how):
+        assert(how in SIGFIG_REDUCTIONS), f"Reduction {how} is not one of {SIGFIG_REDUCTIONS}"
+        self.how = how
+        self.count = 0
+        self.total = 1. if how == "prod" else 0.
+        self.limd = np.iinfo(np.int64).min
+        self.sigfigs = NO_SIGFIGS
+        self.extreme = _Extreme(how)
+
+    def add(self, x: SigFigArray):
+        valid = ~x.is_missing()
+        x = x[valid]
+        self.count += len(x)
+        if self.how in ("min", "max"):
+            self.extreme.add(x.value, x)
+        elif self.how == "prod":
+            self.total = _continued(np.multiply, self.total, x.value)
+            if len(x):
+                self.sigfigs = min(self.sigfigs, int(np.min(x.sigfigs)))
+        else:
+            self.total = _continued(np.add, self.total, x.value)
+            if len(x):
+                self.limd = max(self.limd, int(np.max(x.sigfig_place())))
+
+    def result(self):
+        if self.count == 0:
+            return None
+        if self.how in ("min", "max"):
+            return self.extreme.best
+        if self.how == "prod":
+            return SigFigArray.from_floats(np.array([self.total]), self.sigfigs)[0]
+        return round_sum(np.array([self.total]), np.array([self.limd]), np.array([self.count]), self.how)[0]
+
+class SciDataAccumulator:
+    '''reduce_scidata of an array given one chunk at a time'''
+    def __init__(self, how):
+        assert(how in SCIDATA_REDUCTIONS), f"Reduction {how} is not one of {SCIDATA_REDUCTIONS}"
+        self.how = how
+        self.count = 0
+        self.total = 0.
+        self.var = 0.
+        self.usf = NO_SIGFIGS
+        self.extreme = _Extreme(how)
+
+    def add(self, x: SciDataArray):
+        x = x[~x.value.is_missing()]
+        self.count += len(x)
+        if self.how in ("min", "max"):
+            self.extreme.add(x.value.value, x)
+            return
+        u = np.where(x.is_exact, 0., x.unc.value)
+        self.total = _continued(np.add, self.total, x.value.value)
+        self.var = _continued(np.add, self.var, u * u)
+        if len(x):
+            self.usf = min(self.usf, int(np.min(np.where(x.is_exact, NO_SIGFIGS, x.unc.sigfigs))))
+
+    def result(self):
+        if self.count == 0:
+            return None
+        if self.how in ("min", "max"):
+            return self.extreme.best
+        return propagate_sum(np.array([self.total]), np.array([self.var]), np.array([self.usf]),
+                              np.array([self.count]), self.how)[0]
@@ -17,9 +17,19 @@ from standard_scientific.sigfig import exponent_from_float
 
 #external imports
 import functools
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import numpy as np
 import re
+import sys
+
+#################################################################################
+# _propagate
+#
+# propagation.py imports this module, so it can only be imported at call time
+#
+def _propagate(func, *args, **kwargs):
+    from standard_scientific.propagation import propagate
+    return propagate(func, *args, **kwargs)
 
 #################################################################################
 # SciData 
@@ -38,16 +48,44 @@ import re
 #       errors in the rounding in SigFig.  
 #
 @functools.total_ordering
-@dataclass
+@dataclass(init=False)
 class SciData:
     '''Class for representing values and uncertaintines in scientific notation'''
     value: SigFig
     unc: SigFig
-    rel_unc: SigFig
+    _rel_unc: SigFig = field(repr = False, compare = False)
     is_exact: bool
 
-    # Note, default initialization will come from dataclass decorator and will NOT
-    # perform any correctness checking.
+    # Note, default initialization will NOT perform any correctness checking.
+    def __init__(self, value: SigFig, unc: SigFig, rel_unc: SigFig, is_exact: bool):
+        self.value = value
+        self.unc = unc
+        self._rel_unc = rel_unc
+        self.is_exact = is_exact
+
+    ##########################
+    # rel_unc
+    #
+    # The relative uncertainty is only computed (as unc / abs(value), with the
+    # SigFig division rules) when it is first read, and is then cached. Most
+    # data never has its relative uncertainty read, and the division costs a
+    # from_float (with its rounding and Decimal exponent) per datum.
+    #
+    # A relative uncertainty of None on inexact data means "not computed yet".
+    # Those given explicitly (to the constructor, or by assignment) are kept as
+    # they are. Data with a value of zero has no relative uncertainty.
+    #
+    @property
+    def rel_unc(self):
+        r = self._rel_unc
+        if r is None and not self.is_exact and self.unc is not None and self.value.value != 0.:
+            r = self.unc / abs(self.value)
+            self._rel_unc = r
+        return r
+
+    @rel_unc.setter
+    def rel_unc(self, r):
+        self._rel_unc = r
 
     ##########################
     # from_str
@@ -200,11 +238,10 @@ class SciData:
             except Exception as e:
                 assert(False), f"Exception was thrown during the extraction of the uncertainty in {s_in}. {e}"
 
-        #Generate the sigfigs
+        #Generate the sigfigs (the relative uncertainty is computed when it is first used)
         unc_SigFig = SigFig.from_float(value = unc, sigfigs = unc_sfig) if not exact else None 
-        rel_SigFig = unc_SigFig / abs(value_SigFig) if not exact else None
 
-        return SciData(value = value_SigFig, unc = unc_SigFig, rel_unc = rel_SigFig, is_exact = exact) 
+        return SciData(value = value_SigFig, unc = unc_SigFig, rel_unc = None, is_exact = exact) 
 
     ##########################
     # from_SigFigs 
@@ -218,7 +255,8 @@ class SciData:
     #       -> Store data. NOTE, we do NOT check that rel_unc ==
     #          value / unc (with sigfigs) 
     # 2b) The data is inexact and rel_unc is not given
-    #       -> Generate the relative uncertainty from the sig figs 
+    #       -> Generate the relative uncertainty from the sig figs, when it
+    #          is first used (see SciData.rel_unc above) 
     # 2c) We are not given the uncertainty at all and we are not exact
     #       -> This must error!
     #
@@ -241,9 +279,9 @@ class SciData:
             if not rel_unc is None:
                 return SciData(value = value, unc = unc, rel_unc = rel_unc, is_exact = False) 
 
-            # We do NOT have a relative uncertainty, use SigFig division
+            # We do NOT have a relative uncertainty, use SigFig division (lazily)
             else:
-                return SciData(value = value, unc = unc, rel_unc = unc / abs(value), is_exact = False) 
+                return SciData(value = value, unc = unc, rel_unc = None, is_exact = False) 
 
         #in case of exact data
         else:
@@ -253,6 +291,20 @@ class SciData:
 
 
 
+    ##########################
+    # exact_from_float
+    #
+    # Generates exact data from a float (such as the result of arithmetic 
+    # between exact data). The value is stored WITHOUT rounding, so that 
+    # .as_exact() returns the float itself, and the sigfigs are set to the 
+    # number of decimal digits a float can faithfully represent (for printing).
+    #
+    @classmethod
+    def exact_from_float(cls, value: float):
+        fv = float(value)
+        return SciData(value = SigFig(value = fv, sigfigs = sys.float_info.dig, exponent = exponent_from_float(fv)), 
+                       unc = None, rel_unc = None, is_exact = True)
+
     ##########################
     # .json inferfaces
     #To dict
@@ -260,6 +312,21 @@ class SciData:
     #from Dict
 
     
+    ##########################
+    # Arithmetic
+    #
+    # All of the arithmetic is first-order propagation of uncertainty through
+    # propagate() (see propagation.py), where the derivatives are obtained by
+    # evaluating the operation once on Dual numbers. Exact data (and plain 
+    # numbers) enter through .as_exact(), as described in the README, and the
+    # results are only exact if both operands are.
+    #
+    # NOTE: numpy is told to defer to these operators (__array_ufunc__ = None),
+    #       so that np.float64(2.) * x is handled here rather than as an
+    #       object array.
+    #
+    __array_ufunc__ = None
+
     ##########################
     # Add, substract
     #
@@ -269,15 +336,68 @@ class SciData:
     # in this case defaults to the "no covariance" case, 
     # which is not correct but is what I imagine most 
     # users would want.
-    
+    #
+    # default: no covariance value 
+    #
+    # add_covar, sub_covar: with the covariance values in the registry
+    #
+    def __add__(self, other):
+        return _propagate(np.add, self, other, covariance = False)
+
+    def __radd__(self, other):
+        return _propagate(np.add, other, self, covariance = False)
+
+    def __sub__(self, other):
+        return _propagate(np.subtract, self, other, covariance = False)
+
+    def __rsub__(self, other):
+        return _propagate(np.subtract, other, self, covariance = False)
+
+    def add_covar(self, other):
+        return _propagate(np.add, self, other)
+
+    def sub_covar(self, other):
+        return _propagate(np.subtract, self, other)
     
     ##########################
     # Mult. Div. 
     # 
-    # default: with covariance value 
+    # default: with covariance value (see covariance.py)
     #
     # no_covar: no covariance value 
-    
+    #
+    def __mul__(self, other):
+        return _propagate(np.multiply, self, other)
+
+    def __rmul__(self, other):
+        return _propagate(np.multiply, other, self)
+
+    def __truediv__(self, other):
+        return _propagate(np.true_divide, self, other)
+
+    def __rtruediv__(self, other):
+        return _propagate(np.true_divide, other, self)
+
+    def mul_no_covar(self, other):
+        return _propagate(np.multiply, self, other, covariance = False)
+
+    def div_no_covar(self, other):
+        return _propagate(np.true_divide, self, other, covariance = False)
+
+    ##########################
+    # Powers, negation, and abs()
+    #
+    def __pow__(self, other):
+        return _propagate(np.power, self, other)
+
+    def __rpow__(self, other):
+        return _propagate(np.power, other, self)
+
+    def __neg__(self):
+        return _propagate(np.negative, self)
+
+    def __abs__(self):
+        return _propagate(np.absolute, self)
 
     ##########################
     # __eq__ comparison
@@ -315,6 +435,14 @@ class SciData:
         else:
             return (self.value < other)
 
+    ##########################
+    # with_unit()
+    #
+    # returns a Quantity of this data in the given unit (see units.py)
+    def with_unit(self, unit):
+        from standard_scientific.units import Quantity
+        return Quantity(self, unit)
+
     ##########################
     # as_exact()
     # 
@@ -322,6 +450,13 @@ class SciData:
     def as_exact(self):
         return self.value.as_exact()
 
+    ##########################
+    # __reduce__
+    #
+    # Pickles as the arguments of the constructor (see SigFig.__reduce__)
+    def __reduce__(self):
+        return (SciData, (self.value, self.unc, self._rel_unc, self.is_exact))
+
     ##########################
     # string conversion
     def __str__(self):
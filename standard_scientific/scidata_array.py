@@ -0,0 +1,209 @@
+# scidata_array.py
+#
+# Contains the SciDataArray class, which stores many SciData as columns
+# (SigFigArray for the value, uncertainty and relative uncertainty, and
+# a boolean array for exactness) so that they may be manipulated with
+# vectorized NumPy operations.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray
+
+#external imports
+from dataclasses import dataclass, field
+import numpy as np
+
+#################################################################################
+# _propagate
+#
+# propagation.py imports this module, so it can only be imported at call time
+#
+def _propagate(func, *args):
+    from standard_scientific.propagation import propagate
+    return propagate(func, *args)
+
+#################################################################################
+# SciDataArray
+#
+# Columnar storage of many SciData. The uncertainty and relative uncertainty
+# of exact elements are "missing" (see SigFigArray.missing), which mirrors the
+# None stored in the corresponding SciData.
+#
+# NOTE: As with SciData, the default dataclass constructor performs no checks,
+#       and it is HIGHLY RECOMMENDED that you use "from_SigFigArrays" or
+#       "from_SciData" instead.
+#
+@dataclass(init=False, eq=False)
+class SciDataArray:
+    '''Class for representing arrays of values and uncertainties in scientific notation'''
+    value: SigFigArray
+    unc: SigFigArray
+    _rel_unc: SigFigArray = field(repr = False, compare = False)
+    is_exact: np.ndarray
+
+    def __init__(self, value: SigFigArray, unc: SigFigArray, rel_unc: SigFigArray, is_exact: np.ndarray):
+        self.value = value
+        self.unc = unc
+        self._rel_unc = rel_unc
+        self.is_exact = is_exact
+
+    ##########################
+    # rel_unc
+    #
+    # As for SciData, the column of relative uncertainties is only computed
+    # (vectorized, with the SigFig division rules) when it is first read, and is
+    # then cached. A rel_unc of None means "not computed yet", and slices of an
+    # array whose column was not computed are not computed either.
+    #
+    @property
+    def rel_unc(self):
+        r = self._rel_unc
+        if r is None:
+            r = SigFigArray.missing(len(self.value))
+            sel = ~self.is_exact & ~self.unc.is_missing() & ~self.value.is_missing() & (self.value.value != 0.)
+            #elements that are not valid (see validation.py) have no relative uncertainty
+            sel &= (self.value.sigfigs > 0) & (self.unc.sigfigs > 0) & np.isfinite(self.value.value) & (self.unc.value > 0.) & np.isfinite(self.unc.value)
+            if np.any(sel):
+                r[sel] = SigFigArray.from_floats(self.unc.value[sel] / np.abs(self.value.value[sel]),
+                                                 np.minimum(self.unc.sigfigs[sel], self.value.sigfigs[sel]))
+            self._rel_unc = r
+        return r
+
+    @rel_unc.setter
+    def rel_unc(self, r):
+        self._rel_unc = r
+
+    ##########################
+    # from_SigFigArrays
+    #
+    # Vectorized SciData.from_SigFigs. The uncertainties of exact elements are
+    # ignored, and the relative uncertainty is generated with the SigFig
+    # division rules when it is not given (when it is first used, see
+    # SciDataArray.rel_unc above). Elements with a value of zero have no
+    # relative uncertainty.
+    #
+    @classmethod
+    def from_SigFigArrays(cls, value: SigFigArray, unc: SigFigArray, rel_unc: SigFigArray = None, is_exact = False):
+
+        assert(isinstance(value, SigFigArray)), f"{value} was not an instance of SigFigArray ."
+        n = len(value)
+        exact = np.array(np.broadcast_to(np.asarray(is_exact, dtype=bool), (n,)))
+
+        u = SigFigArray.missing(n)
+        r = None
+
+        inexact = ~exact
+        if np.any(inexact):
+            assert(isinstance(unc, SigFigArray)), f"{unc} was not an instance of SigFigArray ."
+            assert(len(unc) == n), f"Uncertainties have length {len(unc)}, but values have length {n}"
+            assert(not np.any(unc.is_missing()[inexact])), f"Inexact elements must have an uncertainty"
+            u[inexact] = unc[inexact]
+
+            if rel_unc is not None:
+                assert(isinstance(rel_unc, SigFigArray)), f"{rel_unc} was not an instance of SigFigArray or None."
+                r = SigFigArray.missing(n)
+                r[inexact] = rel_unc[inexact]
+
+        return cls(value = value, unc = u, rel_unc = r, is_exact = exact)
+
+    ##########################
+    # from_columns
+    #
+    # Bulk construction, validated at the given level ("none", "fast" or
+    # "full", see validation.py), rather than with asserts. Returns the array
+    # and a mask that is True for every invalid element. A given rel_unc is
+    # only copied for the valid inexact elements, and the relative
+    # uncertainties are otherwise computed when first used.
+    #
+    @classmethod
+    def from_columns(cls, value: SigFigArray, unc: SigFigArray, is_exact = False, rel_unc: SigFigArray = None,
+                     validate: str = "fast"):
+        from standard_scientific.validation import scidata_from_columns
+        return scidata_from_columns(value, unc, is_exact, rel_unc, validate)
+
+    ##########################
+    # from_SciData
+    #
+    # Collects a sequence of SciData. The relative uncertainties are left to be
+    # computed when none of the data has had its relative uncertainty computed
+    # (or given).
+    #
+    @classmethod
+    def from_SciData(cls, data):
+        data = list(data)
+        for x in data:
+            assert(isinstance(x, SciData)), f"{x} was not an instance of SciData ."
+        lazy = all(x.is_exact or x._rel_unc is None for x in data)
+        return cls(value = SigFigArray.from_SigFigs([x.value for x in data]),
+                   unc = SigFigArray.from_SigFigs([None if x.is_exact else x.unc for x in data]),
+                   rel_unc = None if lazy else SigFigArray.from_SigFigs([None if x.is_exact else x.rel_unc for x in data]),
+                   is_exact = np.array([x.is_exact for x in data], dtype=bool))
+
+    ##########################
+    # to_SciData
+    #
+    def to_SciData(self):
+        '''Return the elements as a list of SciData'''
+        return [self[i] for i in range(len(self))]
+
+    ##########################
+    # with_unit()
+    #
+    # returns a Quantity of this data in the given unit (see units.py)
+    def with_unit(self, unit):
+        from standard_scientific.units import Quantity
+        return Quantity(self, unit)
+
+    ##########################
+    # as_exact()
+    #
+    # returns the values of this data as if they were exact (infinite sigfigs)
+    def as_exact(self):
+        return self.value.as_exact()
+
+    ##########################
+    # Arithmetic
+    #
+    # Elementwise first-order propagation of uncertainty, see SciData and 
+    # propagation.py. Operands may be SciDataArray, SciData, or plain numbers
+    # and arrays (which are taken to be exact).
+    #
+    __array_ufunc__ = None
+
+    def __add__(self, other):      return _propagate(np.add, self, other)
+    def __radd__(self, other):     return _propagate(np.add, other, self)
+    def __sub__(self, other):      return _propagate(np.subtract, self, other)
+    def __rsub__(self, other):     return _propagate(np.subtract, other, self)
+    def __mul__(self, other):      return _propagate(np.multiply, self, other)
+    def __rmul__(self, other):     return _propagate(np.multiply, other, self)
+    def __truediv__(self, other):  return _propagate(np.true_divide, self, other)
+    def __rtruediv__(self, other): return _propagate(np.true_divide, other, self)
+    def __pow__(self, other):      return _propagate(np.power, self, other)
+    def __rpow__(self, other):     return _propagate(np.power, other, self)
+    def __neg__(self):             return _propagate(np.negative, self)
+    def __abs__(self):             return _propagate(np.absolute, self)
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            if self.is_exact[i]:
+                return SciData(value = self.value[i], unc = None, rel_unc = None, is_exact = True)
+            #an element of a column that was not computed is computed by the SciData (with the same result)
+            rel_unc = None if self._rel_unc is None else self._rel_unc[i]
+            return SciData(value = self.value[i], unc = self.unc[i], rel_unc = rel_unc, is_exact = False)
+        rel_unc = None if self._rel_unc is None else self._rel_unc[i]
+        return SciDataArray(value = self.value[i], unc = self.unc[i], rel_unc = rel_unc, is_exact = self.is_exact[i])
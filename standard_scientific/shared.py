@@ -0,0 +1,165 @@
+# shared.py
+#
+# Publishing SigFigArray and SciDataArray through multiprocessing.shared_memory,
+# so that other processes may attach to them by name without copying (or
+# pickling) any of the data.
+#
+# Usage:
+#   with si.publish(x) as block:                 #copies x into shared memory once
+#       pool.map(work, [block.handle] * n)       #the handle is a few bytes
+#
+#   def work(handle):
+#       with si.attach(handle) as block:
+#           x = block.array                      #a view of the shared memory
+#           ...
+#
+# How this works. All of the columns of an array are stored one after
+# another in a single shared memory block, in a fixed order. The layout
+# only depends on the kind of array and its length, so the handle is just
+# the name of the block, the kind and the length.
+#
+# NOTE: The arrays of a block are views of the shared memory, and closing the
+#       block while any of them are still in use raises a BufferError. Copy
+#       anything that must outlive it. Blocks are cleaned up by the resource
+#       tracker of the publishing process, and so should be attached by its
+#       children (such as multiprocessing or concurrent.futures workers).
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+
+#external imports
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+import sys
+import numpy as np
+
+#the columns of each kind of array, in the order they are stored (also by
+#the other modules that store arrays as columns, such as compact.py). A
+#SciDataArray whose relative uncertainties were not computed yet (see
+#SciDataArray.rel_unc) is stored without them, as "scidata_lazy", so that
+#storing it does not compute them.
+_SIGFIG_COLUMNS = [np.float64, np.int64, np.int64]
+LAYOUTS = {"sigfig": _SIGFIG_COLUMNS,
+           "scidata": _SIGFIG_COLUMNS * 3 + [np.bool_],
+           "scidata_lazy": _SIGFIG_COLUMNS * 2 + [np.bool_]}
+
+#lazy is whether to leave out the relative uncertainties of a SciDataArray
+#(by default, if they were not computed yet)
+def array_columns(x, lazy: bool = None):
+    '''Kind ("sigfig", "scidata" or "scidata_lazy") and columns of a SigFigArray or SciDataArray'''
+    if isinstance(x, SigFigArray):
+        return "sigfig", [x.value, x.sigfigs, x.exponent]
+    assert(isinstance(x, SciDataArray)), f"{x} was not an instance of SigFigArray or SciDataArray"
+    lazy = x._rel_unc is None if lazy is None else lazy
+    cols = []
+    for s in (x.value, x.unc) if lazy else (x.value, x.unc, x.rel_unc):
+        cols.extend(array_columns(s)[1])
+    return "scidata_lazy" if lazy else "scidata", cols + [x.is_exact]
+
+#views of the columns of a block (every column is 8 byte aligned)
+def _views(buf, kind: str, n: int):
+    views = []
+    offset = 0
+    for dtype in LAYOUTS[kind]:
+        views.append(np.frombuffer(buf, dtype = dtype, count = n, offset = offset))
+        offset += -(-n * np.dtype(dtype).itemsize // 8) * 8
+    return views
+
+def _nbytes(kind: str, n: int) -> int:
+    return max(1, sum(-(-n * np.dtype(d).itemsize // 8) * 8 for d in LAYOUTS[kind]))
+
+def array_from_views(kind: str, views):
+    '''SigFigArray or SciDataArray of the columns of a kind (see array_columns)'''
+    if kind == "sigfig":
+        return SigFigArray(value = views[0], sigfigs = views[1], exponent = views[2])
+    if kind == "scidata_lazy":
+        return SciDataArray(value = array_from_views("sigfig", views[0:3]), unc = array_from_views("sigfig", views[3:6]),
+                            rel_unc = None, is_exact = views[6])
+    return SciDataArray(value = array_from_views("sigfig", views[0:3]), unc = array_from_views("sigfig", views[3:6]),
+                        rel_unc = array_from_views("sigfig", views[6:9]), is_exact = views[9])
+
+#################################################################################
+# SharedHandle
+#
+# What a process needs to attach to a published array. This is small, and
+# is what should be sent to the workers.
+#
+@dataclass(frozen=True)
+class SharedHandle:
+    '''Name, kind and length of a published SigFigArray or SciDataArray'''
+    name: str
+    kind: str
+    length: int
+
+#################################################################################
+# SharedBlock
+#
+# A shared memory block holding an array, either published by this process
+# (owner = True) or attached to. Closing a block releases this process's
+# view of it, and the owner also removes it when it is closed.
+#
+class SharedBlock:
+    '''Shared memory block holding a SigFigArray or SciDataArray'''
+
+    def __init__(self, shm, handle: SharedHandle, owner: bool):
+        self._shm = shm
+        self._unlinked = False
+        self.handle = handle
+        self.owner = owner
+        self.array = array_from_views(handle.kind, _views(shm.buf, handle.kind, handle.length))
+
+    #the views hold the memory, so that it cannot be unmapped while they are in use
+    def close(self):
+        '''Release the block (and remove it, if this process published it)'''
+        if self._shm is None:
+            return
+        self.array = None
+        if self.owner and not self._unlinked:
+            self._shm.unlink()
+            self._unlinked = True
+        try:
+            self._shm.close()
+        except BufferError:
+            raise BufferError(f"Arrays of shared block {self.handle.name} are still in use, copy them before closing") from None
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+#################################################################################
+# publish
+#
+# Copies x into a new shared memory block (the only copy that is made)
+#
+def publish(x, name: str = None) -> SharedBlock:
+    '''Copy a SigFigArray or SciDataArray into shared memory, returning the published block'''
+    kind, cols = array_columns(x)
+    n = len(x)
+    shm = shared_memory.SharedMemory(name = name, create = True, size = _nbytes(kind, n))
+    views = _views(shm.buf, kind, n)
+    for v, c in zip(views, cols):
+        v[:] = c
+    del views
+    return SharedBlock(shm, SharedHandle(name = shm.name, kind = kind, length = n), owner = True)
+
+#################################################################################
+# attach
+#
+# Attaches to a published block by its handle, without copying anything
+#
+def attach(handle: SharedHandle) -> SharedBlock:
+    '''Attach to a published SigFigArray or SciDataArray'''
+    assert(isinstance(handle, SharedHandle)), f"{handle} was not an instance of SharedHandle"
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name = handle.name, track = False)
+    else:
+        shm = shared_memory.SharedMemory(name = handle.name)
+    return SharedBlock(shm, handle, owner = False)
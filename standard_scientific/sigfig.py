@@ -47,7 +47,9 @@ def w_round(x: float, d: int) -> float:
     if abs(uxf - lxf) > (5.0 * pow(10., -di - 1 )):
         uex = exponent_from_float(uxf)
         lex = exponent_from_float(lxf)
-        warnings.warn(UserWarning(f"{x:.{ex + di + 1}e} rounding is sensitive to machine precision: {uxf:.{uex + di + 1}e} vs {lxf:.{lex + di + 1}e}")) 
+        #rounding to the left of the leading digit (of x, or of 0.) leaves no digits to show
+        warnings.warn(UserWarning(f"{x:.{max(0, ex + di + 1)}e} rounding is sensitive to machine precision: "
+                                  f"{uxf:.{max(0, uex + di + 1)}e} vs {lxf:.{max(0, lex + di + 1)}e}"))
 
     return rxf
 
@@ -127,6 +129,15 @@ class SigFig:
     def sigfig_place(self):
         return self.exponent - (self.sigfigs - 1) 
 
+    #########################################################
+    # __reduce__
+    #
+    # Pickles as the arguments of the constructor, rather than as the
+    # (much larger) dictionary of the fields
+    #
+    def __reduce__(self):
+        return (SigFig, (self.value, self.sigfigs, self.exponent))
+
     #########################################################
     # to string
     # returns a string of a given float to the designated number of significant figures  
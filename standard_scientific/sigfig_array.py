@@ -0,0 +1,409 @@
+# sigfig_array.py
+#
+# Defines the SigFigArray class and associated functions, which store
+# many significant figures as NumPy columns (value, sigfigs, exponent)
+# rather than as individual SigFig objects.
+#
+# Everything in here is written to reproduce the scalar routines in
+# sigfig.py EXACTLY, not approximately. Where a vectorized shortcut cannot
+# be proven to agree with the scalar result, we fall back to the scalar
+# routine for that element.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.float_compare import eps
+from standard_scientific.sigfig import exponent_from_float
+
+#external imports
+from dataclasses import dataclass
+from decimal import Decimal
+import numpy as np
+import threading
+import warnings
+
+#################################################################################
+# Tables of the powers of ten
+#
+# POW10[k - POW10_MIN] is float(10**k), and POW10_BELOW marks the powers where
+# float(10**k) is strictly less than the true 10**k (such as 1e23). Together
+# these let us decide 10**k <= |x| exactly, which is what exponent_from_float
+# does through Decimal.
+#
+POW10_MIN = -325
+POW10_MAX = 310
+POW10 = np.array([float(f"1e{k}") for k in range(POW10_MIN, POW10_MAX + 1)])
+POW10_BELOW = np.array([Decimal(float(f"1e{k}")) < Decimal(f"1e{k}") for k in range(POW10_MIN, POW10_MAX + 1)])
+
+#the largest power of 10 that is exactly representable
+POW10_EXACT = 22
+
+# pow(10., k) exactly as python computes it, used for the same comparisons as
+# in the SigFig class
+_PYPOW10_MAX = 308
+_PYPOW10 = np.array([pow(10., k) for k in range(POW10_MIN, _PYPOW10_MAX + 1)] + [np.inf])
+
+def pypow10(k):
+    '''pow(10., k) for an array of k'''
+    return _PYPOW10[np.clip(k, POW10_MIN, _PYPOW10_MAX + 1) - POW10_MIN]
+
+#################################################################################
+# _ge_pow10
+#
+# True where |x| >= 10**k exactly
+def _ge_pow10(ax, k):
+    i = k - POW10_MIN
+    p = POW10[i]
+    return np.where(POW10_BELOW[i], ax > p, ax >= p)
+
+#################################################################################
+# exponents_from_floats
+#
+# Vectorized version of exponent_from_float. A first guess from log10 is
+# corrected with the exact power of ten tables above, so that the result is
+# identical to the Decimal-based scalar version (including cases like 1e23,
+# which is stored as 9.9999999999999991611392e22).
+#
+# Non-finite values (which the scalar version refuses) are given an exponent of 0
+#
+def exponents_from_floats(x) -> np.ndarray:
+    '''Given an array of floats, determine the exponents used in their SI representation'''
+    x = np.asarray(x, dtype=float)
+    ax = np.abs(x)
+    ok = np.isfinite(ax) & (ax > 0.)
+
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        e = np.floor(np.log10(np.where(ok, ax, 1.))).astype(np.int64)
+    e = np.clip(e, POW10_MIN + 1, POW10_MAX - 1)
+
+    e = np.where(_ge_pow10(ax, e + 1), e + 1, e)
+    e = np.where(_ge_pow10(ax, e), e, e - 1)
+
+    return np.where(ok, e, 0)
+
+#################################################################################
+# round_array
+#
+# Vectorized version of python's round(x, d), which rounds the exact binary
+# value of x half-to-even and returns the closest float to the rounded decimal.
+#
+# We scale by an exactly representable power of ten, round to an integer, and
+# scale back, which is correctly rounded in the final step. The only way this can
+# disagree with python is if the scaled value lands close enough to a half-integer
+# that the rounding of the scaling step could have moved it across. Those
+# elements (and elements with |d| > 22, where the powers are inexact) are handed
+# to python's round.
+#
+def round_array(x, d) -> np.ndarray:
+    '''Vectorized round(x, d), identical to python's round for floats'''
+    x = np.asarray(x, dtype=float)
+    d = np.broadcast_to(np.asarray(d, dtype=np.int64), x.shape)
+
+    fast = (np.abs(d) <= POW10_EXACT) & np.isfinite(x)
+    dd = np.where(fast, d, 0)
+    p = POW10[np.abs(dd) - POW10_MIN]
+
+    with np.errstate(over = 'ignore', invalid = 'ignore'):
+        y = np.where(dd >= 0, x * p, x / p)
+        m = np.rint(y)
+        r = np.where(dd >= 0, m / p, m * p)
+
+        #too close to the half-way point, or too large to have a fractional part
+        f = np.abs(np.abs(y - np.floor(y)) - 0.5)
+        fast &= (f > 4. * eps * np.abs(y) + 4. * eps) & (np.abs(y) < 2.**51)
+
+    if not np.all(fast):
+        r = np.array(r)
+        for i in zip(*np.nonzero(~fast)):
+            r[i] = round(float(x[i]), int(d[i]))
+
+    return r
+
+#################################################################################
+# w_round_array
+#
+# Vectorized version of w_round. Rather than warning once per element, a
+# single warning is issued for the whole array that reports the number of
+# sensitive elements and the first of them (in the same format as w_round).
+# The sensitive elements may be recovered by passing mask=True, which returns
+# (rounded, mask).
+#
+# Within parallel.py's worker threads (where catch_warnings is not safe to
+# use), the warning is instead recorded in precision_events as
+# (count, size, first) for every call, and is issued later by the calling
+# thread.
+#
+precision_events = threading.local()
+
+def precision_warning(count: int, size: int, first: str) -> UserWarning:
+    '''The warning of count roundings (of size) sensitive to machine precision'''
+    return UserWarning(f"{count} of {size} roundings are sensitive to machine precision, first: {first}")
+
+def w_round_array(x, d, mask: bool = False):
+    '''Vectorized rounding that warns if any rounding is sensitive to relative machine error'''
+    x = np.asarray(x, dtype=float)
+    d = np.broadcast_to(np.asarray(d, dtype=np.int64), x.shape)
+
+    rxf = round_array(x, d)
+    uxf = round_array(x + x*eps, d)
+    lxf = round_array(x - x*eps, d)
+
+    with np.errstate(over = 'ignore', invalid = 'ignore'):
+        bad = np.abs(uxf - lxf) > (5.0 * np.power(10., -d.astype(float) - 1))
+
+    events = getattr(precision_events, "events", None)
+    first = None
+    if np.any(bad):
+        i = tuple(np.argwhere(bad)[0])
+        xi, di, ui, li = float(x[i]), int(d[i]), float(uxf[i]), float(lxf[i])
+        ex = exponent_from_float(xi)
+        uex = exponent_from_float(ui)
+        lex = exponent_from_float(li)
+        first = (f"{xi:.{max(0, ex + di + 1)}e} rounding is sensitive to machine precision: "
+                 f"{ui:.{max(0, uex + di + 1)}e} vs {li:.{max(0, lex + di + 1)}e}")
+        if events is None:
+            warnings.warn(precision_warning(int(bad.sum()), bad.size, first))
+    if events is not None:
+        events.append((int(bad.sum()), bad.size, first))
+
+    if mask:
+        return rxf, bad
+    return rxf
+
+
+#################################################################################
+# SigFigArray
+#
+# Columnar storage of many SigFig, with one NumPy array for each of the
+# SigFig fields. As with SigFig, the default dataclass constructor just
+# copies data, and "from_floats" should be used to generate correct sigfigs.
+#
+# Elements without data ("missing", such as the uncertainty of exact SciData)
+# are stored as value = nan, sigfigs = 0 and exponent = 0 (see SigFigArray.missing)
+#
+# Indexing with an integer returns a SigFig, while slices, masks and index
+# arrays return a new SigFigArray
+#
+@dataclass(eq=False)
+class SigFigArray:
+    '''Class for representing arrays of data in scientific notation with significant figures'''
+    value: np.ndarray
+    sigfigs: np.ndarray
+    exponent: np.ndarray
+
+    #########################################################
+    # from_floats
+    # Vectorized SigFig.from_float
+    #
+    @classmethod
+    def from_floats(cls, value, sigfigs):
+        '''Given an array of floats and (array of) sigfigs, return a SigFigArray'''
+        fv = np.asarray(value, dtype=float)
+        sf = np.array(np.broadcast_to(np.asarray(sigfigs, dtype=np.int64), fv.shape))
+
+        assert(np.all(sf > 0)), f"Requested sigfigs cannot be less than 1"
+        assert(np.all(np.isfinite(fv))), f"Values could not be converted to finite floats"
+
+        exp = exponents_from_floats(fv)
+
+        return cls(value = w_round_array(fv, (sf - 1) - exp), sigfigs = sf, exponent = exp)
+
+    #########################################################
+    # from_SigFigs
+    # Collects a sequence of SigFig (or None, for missing elements)
+    #
+    @classmethod
+    def from_SigFigs(cls, sigfigs):
+        '''Collect a sequence of SigFig (or None) into a SigFigArray'''
+        sigfigs = list(sigfigs)
+        out = cls.missing(len(sigfigs))
+        for i, s in enumerate(sigfigs):
+            if s is not None:
+                assert(isinstance(s, SigFig)), f"{s} was not an instance of scientific_notation:SigFig ."
+                out.value[i] = s.value
+                out.sigfigs[i] = s.sigfigs
+                out.exponent[i] = s.exponent
+        return out
+
+    #########################################################
+    # from_columns
+    # Bulk construction from columns, validated at the given level
+    # ("none", "fast" or "full", see validation.py). Returns the array and
+    # a mask that is True for every element that is not a valid sigfig.
+    # The exponents are computed from the values when not given.
+    #
+    @classmethod
+    def from_columns(cls, value, sigfigs, exponent = None, validate: str = "fast"):
+        '''Given columns of values, sigfigs (and exponents), return a SigFigArray and its violation mask'''
+        from standard_scientific.validation import sigfigs_from_columns
+        return sigfigs_from_columns(value, sigfigs, exponent, validate)
+
+    #########################################################
+    # missing
+    # An array of n elements without any data
+    #
+    @classmethod
+    def missing(cls, n: int):
+        '''SigFigArray of n missing elements'''
+        return cls(value = np.full(n, np.nan), sigfigs = np.zeros(n, dtype=np.int64), exponent = np.zeros(n, dtype=np.int64))
+
+    #########################################################
+    # to_SigFigs
+    #
+    def to_SigFigs(self):
+        '''Return the elements as a list of SigFig (None where missing)'''
+        return [self[i] for i in range(len(self))]
+
+    def is_missing(self):
+        '''Boolean array that is True where elements have no data'''
+        return self.sigfigs == 0
+
+    #########################################################
+    # sigfig_place (see SigFig.sigfig_place)
+    #
+    def sigfig_place(self):
+        return self.exponent - (self.sigfigs - 1)
+
+    #########################################################
+    # as_exact (see SigFig.as_exact)
+    #
+    def as_exact(self):
+        return self.value
+
+    #########################################################
+    # contains(other), see SigFig.contains
+    #
+    def contains(self, other):
+        o = other.value if isinstance(other, (SigFig, SigFigArray)) else np.asarray(other, dtype=float)
+        return np.abs(self.value - o) < (5.0 * pypow10(self.sigfig_place() - 1))
+
+    #########################################################
+    # Comparisons
+    #
+    # These are elementwise versions of the SigFig comparisons, returning
+    # boolean arrays. As in SigFig, == is only defined between sigfigs.
+    #
+    __hash__ = None
+
+    def __eq__(self, other):
+        assert(isinstance(other, (SigFig, SigFigArray))), f"__eq__ undefined except for comparision between sigfigs, perhaps you meant .contains() ?"
+        return ((self.sigfigs == other.sigfigs) &
+                (self.exponent == other.exponent) &
+                (np.abs(self.value - other.value) < (5.0 * pypow10(self.sigfig_place() - 1))))
+
+    def __ne__(self, other):
+        return ~(self == other)
+
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, (SigFig, SigFigArray)) else other)
+
+    def __le__(self, other):
+        return (self < other) | (self == other)
+
+    def __gt__(self, other):
+        return ~(self <= other)
+
+    def __ge__(self, other):
+        return ~(self < other)
+
+    #########################################################
+    # Arithmetic
+    #
+    # Elementwise versions of the SigFig operators, which follow exactly the
+    # same rules (and give exactly the same results) as the scalar versions:
+    #
+    #   +, - : the result is rounded to the limiting (largest) sigfig place,
+    #          and its sigfigs are adjusted to match
+    #   *, / : the result has the smallest number of sigfigs of the two
+    #
+    # Plain numbers (and arrays of them) are taken to be infinitely precise.
+    # Missing elements are not supported here.
+    #
+    __array_ufunc__ = None
+
+    def _add(self, other, sign):
+        if isinstance(other, (SigFig, SigFigArray)):
+            limd = np.maximum(self.sigfig_place(), other.sigfig_place())
+            o = other.value
+        else:
+            limd = self.sigfig_place()
+            o = np.asarray(other, dtype=float)
+        val = w_round_array(self.value + o if sign > 0 else self.value - o, -limd)
+        ex = exponents_from_floats(val)
+        return SigFigArray.from_floats(value = val, sigfigs = ex - limd + 1)
+
+    def __add__(self, other):
+        return self._add(other, 1)
+
+    def __radd__(self, other):
+        return self._add(other, 1)
+
+    def __sub__(self, other):
+        return self._add(other, -1)
+
+    def __rsub__(self, other):
+        return (-self)._add(-np.asarray(other, dtype=float), -1)
+
+    def __mul__(self, other):
+        if isinstance(other, (SigFig, SigFigArray)):
+            return SigFigArray.from_floats(value = self.value * other.value,
+                                           sigfigs = np.minimum(self.sigfigs, other.sigfigs))
+        return SigFigArray.from_floats(value = self.value * np.asarray(other, dtype=float), sigfigs = self.sigfigs)
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __truediv__(self, other):
+        if isinstance(other, (SigFig, SigFigArray)):
+            return SigFigArray.from_floats(value = self.value / other.value,
+                                           sigfigs = np.minimum(self.sigfigs, other.sigfigs))
+        return SigFigArray.from_floats(value = self.value / np.asarray(other, dtype=float), sigfigs = self.sigfigs)
+
+    def __rtruediv__(self, other):
+        return SigFigArray.from_floats(value = np.asarray(other, dtype=float) / self.value, sigfigs = self.sigfigs)
+
+    #matrix products, see linalg.py
+    def __matmul__(self, other):
+        from standard_scientific.linalg import matmul
+        return matmul(self, other)
+
+    def __rmatmul__(self, other):
+        from standard_scientific.linalg import matmul
+        return matmul(other, self)
+
+    def __abs__(self):
+        return SigFigArray(value = np.abs(self.value), sigfigs = self.sigfigs.copy(), exponent = self.exponent.copy())
+
+    def __neg__(self):
+        return SigFigArray(value = -self.value, sigfigs = self.sigfigs.copy(), exponent = self.exponent.copy())
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            if self.sigfigs[i] == 0:
+                return None
+            return SigFig(value = float(self.value[i]), sigfigs = int(self.sigfigs[i]), exponent = int(self.exponent[i]))
+        return SigFigArray(value = self.value[i], sigfigs = self.sigfigs[i], exponent = self.exponent[i])
+
+    def __setitem__(self, i, other):
+        if other is None:
+            self.value[i] = np.nan
+            self.sigfigs[i] = 0
+            self.exponent[i] = 0
+        else:
+            self.value[i] = other.value
+            self.sigfigs[i] = other.sigfigs
+            self.exponent[i] = other.exponent
@@ -0,0 +1,169 @@
+# tabulated.py
+#
+# Tables of SciData (a property y tabulated against x, such as a quantity
+# against temperature or pressure), with vectorized lookup of the entries
+# that bracket many query points at once, and interpolation between them.
+#
+#   Table.from_SciData(x, y)   : a table, sorted by x once at construction
+#   table.bracket(q)           : index of the entry at or below every query
+#   table.interpolate(q, kind) : "linear" or "cubic" interpolation at q
+#
+# How this works. The values of x are sorted (with ordering.argsort) when the
+# table is built, and every lookup is a single np.searchsorted of the query
+# values, rather than a linear scan of the entries for every query.
+#
+# The interpolated values are linear (between the two bracketing entries) or
+# cubic (the Lagrange polynomial through the two bracketing entries and one
+# more on either side), and their uncertainties are propagated from the
+# entries used (x and y) and from the query points, as in propagation.py.
+# Different entries (and different query points) are taken to be
+# independent. The sigfigs of the results follow from their uncertainties,
+# as for any other propagation, and interpolation of exact entries at exact
+# points is exact.
+#
+# Queries outside the range of x raise an AssertionError, unless
+# extrapolate=True, in which case the first (or last) interval is extended.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig import SigFig
+from standard_scientific.scidata import SciData
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.scidata_array import SciDataArray
+from standard_scientific.formatting import as_array
+from standard_scientific.ordering import argsort
+from standard_scientific.propagation import propagate
+
+#external imports
+from dataclasses import dataclass
+import numpy as np
+
+#number of entries used by each kind of interpolation
+_POINTS = {"linear": 2, "cubic": 4}
+
+#################################################################################
+# _linear and _cubic
+#
+# The interpolating polynomials, written with operators only so that they are
+# evaluated on Dual numbers by propagate()
+#
+def _linear(q, x0, x1, y0, y1):
+    return y0 + (q - x0) / (x1 - x0) * (y1 - y0)
+
+def _cubic(q, x0, x1, x2, x3, y0, y1, y2, y3):
+    d0, d1, d2, d3 = q - x0, q - x1, q - x2, q - x3
+    return (y0 * (d1 * d2 * d3) / ((x0 - x1) * (x0 - x2) * (x0 - x3))
+          + y1 * (d0 * d2 * d3) / ((x1 - x0) * (x1 - x2) * (x1 - x3))
+          + y2 * (d0 * d1 * d3) / ((x2 - x0) * (x2 - x1) * (x2 - x3))
+          + y3 * (d0 * d1 * d2) / ((x3 - x0) * (x3 - x1) * (x3 - x2)))
+
+#################################################################################
+# _queries
+#
+# The query points as a SciDataArray, or as floats (which are exact), and
+# whether a single point was given
+#
+def _queries(q):
+    if isinstance(q, SciData):
+        return SciDataArray.from_SciData([q]), True
+    if isinstance(q, SigFig):
+        return np.array([q.as_exact()]), True
+    if isinstance(q, (SigFigArray, SciDataArray)):
+        return q, False
+    if isinstance(q, (list, tuple)) and len(q) > 0 and isinstance(q[0], (SigFig, SciData)):
+        return as_array(q), False
+    q = np.asarray(q, dtype = float)
+    return q.reshape(-1), q.ndim == 0
+
+#################################################################################
+# Table
+#
+#   x     : SciDataArray of the abscissae, in ascending order
+#   y     : SciDataArray of the tabulated values
+#   order : indices that sorted the entries as they were given
+#
+# NOTE: As with SciData, the default dataclass constructor performs no checks,
+#       use "from_SciData" instead.
+#
+@dataclass(eq=False)
+class Table:
+    '''Tabulated SciData, with vectorized lookup and interpolation'''
+    x: SciDataArray
+    y: SciDataArray
+    order: np.ndarray
+
+    ##########################
+    # from_SciData
+    #
+    # x and y are SciDataArray or sequences of SciData (or SigFig, which are
+    # exact), in any order. The values of x must be distinct.
+    #
+    @classmethod
+    def from_SciData(cls, x, y):
+        x, y = as_array(x), as_array(y)
+        if isinstance(x, SigFigArray):
+            x = SciDataArray.from_SigFigArrays(x, None, None, True)
+        if isinstance(y, SigFigArray):
+            y = SciDataArray.from_SigFigArrays(y, None, None, True)
+        assert(len(x) == len(y)), f"x has {len(x)} entries, but y has {len(y)}"
+        assert(len(x) >= 2), f"A table requires at least two entries, not {len(x)}"
+        assert(not np.any(x.value.is_missing()) and not np.any(y.value.is_missing())), f"A table cannot have missing entries"
+        order = argsort(x)
+        x, y = x[order], y[order]
+        assert(np.all(np.diff(x.value.value) > 0.)), f"The values of x in a table must be distinct"
+        return cls(x = x, y = y, order = order)
+
+    def __len__(self):
+        return len(self.x)
+
+    ##########################
+    # bracket
+    #
+    # Index i (into the sorted entries) of the interval x[i] <= q <= x[i+1]
+    # of every query point, from 0 to len(self)-2. Points outside of the
+    # table are given the first (or last) interval.
+    #
+    def bracket(self, q) -> np.ndarray:
+        '''Index of the entry at or below every query point'''
+        q, _ = _queries(q)
+        v = q.value.value if isinstance(q, SciDataArray) else (q.value if isinstance(q, SigFigArray) else q)
+        i = np.searchsorted(self.x.value.value, v, side = "right") - 1
+        return np.clip(i, 0, len(self) - 2)
+
+    ##########################
+    # interpolate
+    #
+    #   q           : query points (SciData, SigFig, numbers, or arrays of them)
+    #   kind        : "linear" or "cubic"
+    #   extrapolate : allow query points outside of the table
+    #
+    # Returns a SciDataArray (or a SciData, for a single query point)
+    #
+    def interpolate(self, q, kind: str = "linear", extrapolate: bool = False):
+        '''Interpolate the table at the query points, with propagated uncertainties'''
+        assert(kind in _POINTS), f"kind must be one of {list(_POINTS)}, not {kind}"
+        assert(len(self) >= _POINTS[kind]), f"{kind} interpolation requires at least {_POINTS[kind]} entries, not {len(self)}"
+        q, single = _queries(q)
+        if isinstance(q, SigFigArray):
+            q = q.as_exact()
+        v = q.value.value if isinstance(q, SciDataArray) else q
+        assert(not np.any(np.isnan(v))), f"Query points cannot be missing"
+        if not extrapolate:
+            xv = self.x.value.value
+            bad = (v < xv[0]) | (v > xv[-1])
+            assert(not np.any(bad)), f"{int(bad.sum())} query points are outside of the table [{xv[0]}, {xv[-1]}]"
+
+        #the first entry of every stencil
+        i = self.bracket(v)
+        if kind == "cubic":
+            i = np.clip(i - 1, 0, len(self) - 4)
+        idx = [i + k for k in range(_POINTS[kind])]
+
+        func = _linear if kind == "linear" else _cubic
+        r = propagate(func, q, *[self.x[j] for j in idx], *[self.y[j] for j in idx], covariance = False)
+        return r[0] if single else r
+
+    __call__ = interpolate
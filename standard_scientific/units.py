@@ -0,0 +1,329 @@
+# units.py
+#
+# Physical units for SciData and SciDataArray.
+#
+# A Unit is a vector of the integer exponents of the SI base units (its
+# dimension) and the factor that converts it to the coherent SI unit of
+# that dimension, so that
+#
+#   km/h  = (1, 0, -1, 0, 0, 0, 0) with a factor of 1000/3600
+#   eV    = (2, 1, -2, 0, 0, 0, 0) with a factor of 1.602176634e-19 (exact)
+#   Eh    = (2, 1, -2, 0, 0, 0, 0) with the CODATA Hartree energy (inexact)
+#
+# Units are optional: a Quantity pairs data (SciData or SciDataArray) with a
+# Unit, and is made with si.Quantity(x, "km/h") or x.with_unit("km/h").
+#
+#   v = si.SciData.from_str("88.0(5)").with_unit("km/h")
+#   v.to("m/s")                       #a single multiply by the cached factor
+#   v * si.Quantity(t, "s")           #km/h s
+#
+# What this costs. Strings are only parsed once (unit() is memoized), and
+# the conversion factor of every (from, to) pair of units is computed once
+# (with SciData arithmetic, so that inexact factors carry their
+# uncertainties) and memoized. A conversion is then a single multiply of the
+# data by the factor, vectorized for SciDataArray, with the sigfigs and
+# uncertainties handled exactly as for any other multiply by SciData (an
+# exact factor keeps the sigfigs of the data). Dimension checks compare the
+# seven exponents of two units, and never parse a string.
+#
+# Unit strings are products of units, each with an optional SI prefix and
+# integer power ("m2", "m^2", "m**2", "s-1"). Everything after a "/" is in
+# the denominator: "J/mol K" and "J/(mol K)" are both J mol-1 K-1. Units
+# with offsets (such as degrees Celsius) are not supported.
+#
+# Adding or subtracting quantities of different dimensions raises a
+# DimensionError (these are errors in the data, and are not asserts, which
+# python -O would remove).
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.scidata import SciData
+from standard_scientific.scidata_array import SciDataArray
+
+#external imports
+from dataclasses import dataclass, field
+import functools
+import re
+import numpy as np
+
+#the SI base units, in the order of the dimension vectors
+BASE_UNITS = ("m", "kg", "s", "A", "K", "mol", "cd")
+
+def _dims(m = 0, kg = 0, s = 0, A = 0, K = 0, mol = 0, cd = 0) -> tuple:
+    return (m, kg, s, A, K, mol, cd)
+
+#name -> (dimension, factor), where the factor is a float (exact) or the name of a CODATA constant
+UNITS = {
+    "m": (_dims(m = 1), 1.), "g": (_dims(kg = 1), 1e-3), "kg": (_dims(kg = 1), 1.), "s": (_dims(s = 1), 1.),
+    "A": (_dims(A = 1), 1.), "K": (_dims(K = 1), 1.), "mol": (_dims(mol = 1), 1.), "cd": (_dims(cd = 1), 1.),
+    "Hz": (_dims(s = -1), 1.),
+    "N": (_dims(m = 1, kg = 1, s = -2), 1.),
+    "Pa": (_dims(m = -1, kg = 1, s = -2), 1.),
+    "J": (_dims(m = 2, kg = 1, s = -2), 1.),
+    "W": (_dims(m = 2, kg = 1, s = -3), 1.),
+    "C": (_dims(s = 1, A = 1), 1.),
+    "V": (_dims(m = 2, kg = 1, s = -3, A = -1), 1.),
+    "ohm": (_dims(m = 2, kg = 1, s = -3, A = -2), 1.), "Ω": (_dims(m = 2, kg = 1, s = -3, A = -2), 1.),
+    "S": (_dims(m = -2, kg = -1, s = 3, A = 2), 1.),
+    "F": (_dims(m = -2, kg = -1, s = 4, A = 2), 1.),
+    "T": (_dims(kg = 1, s = -2, A = -1), 1.),
+    "Wb": (_dims(m = 2, kg = 1, s = -2, A = -1), 1.),
+    "H": (_dims(m = 2, kg = 1, s = -2, A = -2), 1.),
+    "L": (_dims(m = 3), 1e-3),
+    "min": (_dims(s = 1), 60.), "h": (_dims(s = 1), 3600.), "d": (_dims(s = 1), 86400.),
+    "Å": (_dims(m = 1), 1e-10), "angstrom": (_dims(m = 1), 1e-10),
+    "in": (_dims(m = 1), 0.0254), "ft": (_dims(m = 1), 0.3048), "lb": (_dims(kg = 1), 0.45359237),
+    "eV": (_dims(m = 2, kg = 1, s = -2), 1.602176634e-19),
+    "cal": (_dims(m = 2, kg = 1, s = -2), 4.184),
+    "bar": (_dims(m = -1, kg = 1, s = -2), 1e5), "atm": (_dims(m = -1, kg = 1, s = -2), 101325.),
+    "Torr": (_dims(m = -1, kg = 1, s = -2), 101325. / 760.),
+    "Da": (_dims(kg = 1), "atomic mass constant"), "u": (_dims(kg = 1), "atomic mass constant"),
+    "Eh": (_dims(m = 2, kg = 1, s = -2), "Hartree energy"),
+    "bohr": (_dims(m = 1), "Bohr radius"),
+}
+
+PREFIXES = {"Y": 24, "Z": 21, "E": 18, "P": 15, "T": 12, "G": 9, "M": 6, "k": 3, "h": 2, "da": 1,
+            "d": -1, "c": -2, "m": -3, "u": -6, "µ": -6, "n": -9, "p": -12, "f": -15, "a": -18, "z": -21, "y": -24}
+
+class DimensionError(ValueError):
+    '''Quantities of different dimensions were added, subtracted or converted'''
+
+#################################################################################
+# Unit
+#
+#   dims   : the exponents of the SI base units (see BASE_UNITS)
+#   factor : SciData that converts this unit to the coherent SI unit
+#   name   : how the unit is printed
+#
+# Units are equal (and hash) by their dimension and name. Use unit() to
+# make them from strings.
+#
+@dataclass(frozen=True)
+class Unit:
+    '''A physical unit, as a vector of the exponents of the SI base units and a conversion factor'''
+    dims: tuple
+    factor: SciData = field(compare = False)
+    name: str = ""
+
+    @property
+    def dimensionless(self) -> bool:
+        return not any(self.dims)
+
+    def __mul__(self, other):      return _product(self, other, 1)
+    def __truediv__(self, other):  return _product(self, other, -1)
+    def __pow__(self, n: int):     return _power(self, n)
+
+    def __str__(self):
+        return self.name
+
+_ONE = SciData.exact_from_float(1.)
+DIMENSIONLESS = Unit(dims = _dims(), factor = _ONE, name = "")
+
+@functools.lru_cache(maxsize = None)
+def _product(a: Unit, b: Unit, sign: int) -> Unit:
+    dims = tuple(x + sign * y for x, y in zip(a.dims, b.dims))
+    if sign > 0:
+        return Unit(dims, a.factor * b.factor, " ".join(n for n in (a.name, b.name) if n))
+    wrap = " " in b.name or "/" in b.name
+    return Unit(dims, a.factor / b.factor, f"{a.name or '1'}/({b.name})" if wrap else f"{a.name or '1'}/{b.name}")
+
+@functools.lru_cache(maxsize = None)
+def _power(a: Unit, n: int) -> Unit:
+    assert(int(n) == n), f"Units may only be raised to integer powers, not {n}"
+    n = int(n)
+    wrap = " " in a.name or "/" in a.name
+    return Unit(tuple(x * n for x in a.dims), a.factor**n, f"({a.name})^{n}" if wrap else f"{a.name}^{n}")
+
+#################################################################################
+# unit
+#
+# The Unit of a string (memoized), such as "m/s^2", "kJ/(mol K)" or "g cm-3"
+#
+_TOKENS = re.compile(r"/|[^\s/()·*^]+(?:\s*(?:\^|\*\*)\s*[-+]?\d+)?")
+_TOKEN = re.compile(r"^(.*?[^\d\s\^*+-])\s*(?:\^|\*\*)?\s*([-+]?\d+)?$")
+
+def _factor(f) -> SciData:
+    if isinstance(f, str):
+        from standard_scientific.codata import constants
+        return constants[f]
+    return SciData.exact_from_float(f)
+
+#the power of ten that f is exactly, or None
+def _pow10(f):
+    if isinstance(f, str) or f <= 0.:
+        return None
+    k = int(round(np.log10(f)))
+    return k if f == float(f"1e{k}") else None
+
+#the named unit (without any prefix), and the power of ten of its prefix
+def _named(name: str):
+    if name in UNITS:
+        return name, 0
+    for p in sorted(PREFIXES, key = len, reverse = True):
+        if name.startswith(p) and name[len(p):] in UNITS:
+            return name[len(p):], PREFIXES[p]
+    raise ValueError(f"Unknown unit {name}")
+
+#
+# Powers of ten (the prefixes, and units such as g or L) are summed as
+# integers, and applied in one (correctly rounded) step, so that g cm-3
+# is exactly 1000 rather than 1e-3 * 0.01**-3
+#
+@functools.lru_cache(maxsize = None)
+def unit(s) -> Unit:
+    '''The Unit of a string, such as "m/s^2" or "kJ/(mol K)"'''
+    if isinstance(s, Unit):
+        return s
+    dims = [0] * len(BASE_UNITS)
+    factor = None
+    k = 0
+    sign = 1
+    for tok in _TOKENS.findall(s):
+        if tok == "/":
+            sign = -1
+            continue
+        if tok == "1":
+            continue
+        m = _TOKEN.match(tok)
+        if m is None:
+            raise ValueError(f"Could not parse {tok} in the unit {s}")
+        name, prefix = _named(m.group(1))
+        n = sign * int(m.group(2) or 1)
+        d, f = UNITS[name]
+        dims = [x + n * y for x, y in zip(dims, d)]
+        kf = _pow10(f)
+        k += n * (prefix + (kf or 0))
+        if kf is None:
+            #a single constant is kept as the same instance (see covariance.py)
+            g = _factor(f) if n == 1 else _factor(f)**n
+            factor = g if factor is None else factor * g
+    if k != 0:
+        p = SciData.exact_from_float(float(f"1e{k}"))
+        factor = p if factor is None else factor * p
+    return Unit(tuple(dims), _ONE if factor is None else factor, s.strip())
+
+#################################################################################
+# conversion
+#
+# The (memoized) factor that converts data in one unit to another
+#
+@functools.lru_cache(maxsize = None)
+def conversion(a, b) -> SciData:
+    '''The factor that converts from unit a to unit b'''
+    a, b = unit(a), unit(b)
+    if a.dims != b.dims:
+        raise DimensionError(f"Cannot convert {a} {a.dims} to {b} {b.dims}")
+    return a.factor / b.factor
+
+def _check(a: Unit, b: Unit, what: str):
+    if a.dims != b.dims:
+        raise DimensionError(f"Cannot {what} {a} {a.dims} and {b} {b.dims}")
+
+#################################################################################
+# Quantity
+#
+#   data : SciData or SciDataArray
+#   unit : its Unit (or a string, which is parsed into one)
+#
+@dataclass(eq=False)
+class Quantity:
+    '''SciData or SciDataArray with a physical unit'''
+    data: object
+    unit: Unit = DIMENSIONLESS
+
+    def __post_init__(self):
+        self.unit = unit(self.unit) if isinstance(self.unit, str) else self.unit
+        assert(isinstance(self.unit, Unit)), f"{self.unit} was not a Unit or a string"
+
+    #########################################################
+    # to
+    # The same quantity in another unit (of the same dimension)
+    #
+    def to(self, u):
+        '''Convert to another unit of the same dimension'''
+        u = unit(u)
+        if u == self.unit:
+            return Quantity(self.data, u)
+        f = conversion(self.unit, u)
+        #an exact factor of one changes nothing, not even the rounding
+        if f.is_exact and f.value.value == 1.:
+            return Quantity(self.data, u)
+        return Quantity(self.data * f, u)
+
+    def to_base(self):
+        '''Convert to the coherent SI unit of the same dimension'''
+        name = " ".join(f"{b}{n}" if n != 1 else b for b, n in zip(BASE_UNITS, self.unit.dims) if n != 0)
+        return self.to(Unit(self.unit.dims, _ONE, name))
+
+    @property
+    def dims(self) -> tuple:
+        return self.unit.dims
+
+    #########################################################
+    # Arithmetic
+    #
+    # Sums convert other to the unit of self. Products and quotients combine
+    # the units (without converting anything), and plain numbers or SciData
+    # are dimensionless.
+    #
+    def _sum(self, op, other, reverse = False):
+        if other is self:
+            return Quantity(op(self.data, self.data), self.unit)
+        if not isinstance(other, Quantity):
+            other = Quantity(other, DIMENSIONLESS)
+        _check(self.unit, other.unit, "add")
+        o = other.to(self.unit).data
+        return Quantity(op(o, self.data) if reverse else op(self.data, o), self.unit)
+
+    def __add__(self, other):      return self._sum(lambda a, b: a + b, other)
+    def __radd__(self, other):     return self._sum(lambda a, b: a + b, other, True)
+    def __sub__(self, other):      return self._sum(lambda a, b: a - b, other)
+    def __rsub__(self, other):     return self._sum(lambda a, b: a - b, other, True)
+
+    def __mul__(self, other):
+        if other is self:
+            return Quantity(self.data * self.data, self.unit * self.unit)
+        if isinstance(other, Quantity):
+            return Quantity(self.data * other.data, self.unit * other.unit)
+        return Quantity(self.data * other, self.unit)
+
+    def __rmul__(self, other):
+        return Quantity(other * self.data, self.unit)
+
+    def __truediv__(self, other):
+        if other is self:
+            return Quantity(self.data / self.data, DIMENSIONLESS)
+        if isinstance(other, Quantity):
+            return Quantity(self.data / other.data, self.unit / other.unit)
+        return Quantity(self.data / other, self.unit)
+
+    def __rtruediv__(self, other):
+        return Quantity(other / self.data, DIMENSIONLESS / self.unit)
+
+    def __pow__(self, n):
+        return Quantity(self.data**n, self.unit**n)
+
+    def __neg__(self):
+        return Quantity(-self.data, self.unit)
+
+    def __abs__(self):
+        return Quantity(abs(self.data), self.unit)
+
+    #########################################################
+    # Arrays
+    #
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        return Quantity(self.data[i], self.unit)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __str__(self):
+        return f"{self.data} {self.unit}".rstrip()
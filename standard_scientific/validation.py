@@ -0,0 +1,125 @@
+# validation.py
+#
+# Vectorized validation of SigFigArray and SciDataArray, and the bulk
+# constructors that use it (SigFigArray.from_columns and
+# SciDataArray.from_columns).
+#
+# The dataclass constructors trust their data, and the checks of from_float
+# and from_SigFigs are asserts (which python -O removes) made one object at a
+# time. These check whole arrays at once, without asserts, at one of
+#
+#   "none" : no checks, for trusted pipelines (nothing is computed, and the
+#            uncertainties are only copied to blank those of exact elements)
+#   "fast" : sigfigs > 0, finite values, the exponent consistent with the
+#            value, and (for SciData) a positive uncertainty for every
+#            inexact element; a few vectorized passes
+#   "full" : also that every value (and uncertainty) is rounded to its
+#            sigfig place, which costs a rounding per element
+#
+# and return a boolean mask that is True for every row that violates them.
+# Missing elements (sigfigs = 0 and a value of nan) are valid. The exponent
+# is consistent with the value if it is exponent_from_float of the value, or
+# if |value| == 10**(exponent+1), as from_float gives for values that round
+# up to the next power of ten (9.96 to 2 sigfigs is 10., with an exponent of 0),
+# or if |value| == 10**exponent (the float of which may be just below it).
+# The values of exact SciData are stored unrounded (see exact_from_float),
+# and so are not checked for rounding.
+#
+# Revision History:
+#   October 19, 2026 : created
+#
+
+#imports from within this package
+from standard_scientific.sigfig_array import SigFigArray
+from standard_scientific.sigfig_array import exponents_from_floats
+from standard_scientific.sigfig_array import round_array
+from standard_scientific.sigfig_array import pypow10, POW10, POW10_MIN, POW10_MAX
+from standard_scientific.scidata_array import SciDataArray
+
+#external imports
+import numpy as np
+
+VALIDATE = ("none", "fast", "full")
+
+#################################################################################
+# validate_sigfigs
+#
+def validate_sigfigs(x: SigFigArray, validate: str = "full", rounded = True) -> np.ndarray:
+    '''Mask of the elements of a SigFigArray that are not valid sigfigs'''
+    assert(validate in VALIDATE), f"validate must be one of {VALIDATE}, not {validate}"
+    n = len(x)
+    if validate == "none":
+        return np.zeros(n, dtype = bool)
+
+    v, sf, e = x.value, x.sigfigs, x.exponent
+    missing = (sf == 0) & np.isnan(v)
+    bad = (sf <= 0) | ~np.isfinite(v)
+
+    #the exponent of the unrounded value, which may have rounded up to 10**(e+1)
+    ex = exponents_from_floats(v)
+    #or the float of 10**e may be just below it (1.04e-6 to 2 sigfigs is 1e-06, which
+    #is 9.99...e-07, with an exponent of -6), as pow(10., e) or as float("1e{e}")
+    below = (ex == e - 1) & ((np.abs(v) == pypow10(e)) | (np.abs(v) == POW10[np.clip(e, POW10_MIN, POW10_MAX) - POW10_MIN]))
+    bad |= (ex != e) & ~((ex == e + 1) & (np.abs(v) == pypow10(e + 1))) & ~below
+
+    if validate == "full":
+        check = np.asarray(rounded, dtype = bool) & ~bad & ~missing
+        d = np.where(check, sf - 1 - e, 0)
+        vc = np.where(check, v, 0.)
+        bad |= check & (round_array(vc, d) != vc)
+
+    return bad & ~missing
+
+#################################################################################
+# validate_scidata
+#
+def validate_scidata(x: SciDataArray, validate: str = "full") -> np.ndarray:
+    '''Mask of the elements of a SciDataArray that are not valid'''
+    assert(validate in VALIDATE), f"validate must be one of {VALIDATE}, not {validate}"
+    if validate == "none":
+        return np.zeros(len(x), dtype = bool)
+
+    inexact = ~x.is_exact & ~x.value.is_missing()
+    bad = validate_sigfigs(x.value, validate, rounded = inexact)
+    bad |= inexact & (validate_sigfigs(x.unc, validate) | x.unc.is_missing() | ~(x.unc.value > 0.))
+    return bad
+
+#################################################################################
+# sigfigs_from_columns
+#
+# See SigFigArray.from_columns
+#
+def sigfigs_from_columns(value, sigfigs, exponent = None, validate: str = "fast"):
+    v = np.asarray(value, dtype = float)
+    sf = np.array(np.broadcast_to(np.asarray(sigfigs, dtype = np.int64), v.shape))
+    if exponent is None:
+        e = exponents_from_floats(v)
+    else:
+        e = np.array(np.broadcast_to(np.asarray(exponent, dtype = np.int64), v.shape))
+    x = SigFigArray(value = v, sigfigs = sf, exponent = e)
+    return x, validate_sigfigs(x, validate)
+
+#################################################################################
+# scidata_from_columns
+#
+# See SciDataArray.from_columns. The relative uncertainties are copied for
+# the valid inexact elements if given, and are otherwise computed when first
+# used (with the same rules as from_SigFigArrays).
+#
+def scidata_from_columns(value: SigFigArray, unc: SigFigArray, is_exact = False, rel_unc: SigFigArray = None,
+                         validate: str = "fast"):
+    assert(isinstance(value, SigFigArray)), f"{value} was not an instance of SigFigArray ."
+    assert(isinstance(unc, SigFigArray)), f"{unc} was not an instance of SigFigArray ."
+    n = len(value)
+    exact = np.array(np.broadcast_to(np.asarray(is_exact, dtype = bool), (n,)))
+    if np.any(exact):
+        unc = unc[np.arange(n)]
+        unc[exact] = None
+    x = SciDataArray(value = value, unc = unc, rel_unc = None, is_exact = exact)
+    bad = validate_scidata(x, validate)
+
+    if rel_unc is not None:
+        inexact = ~exact & ~bad
+        x.rel_unc = SigFigArray.missing(n)
+        x.rel_unc[inexact] = rel_unc[inexact]
+    return x, bad
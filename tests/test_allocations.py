@@ -0,0 +1,37 @@
+# test_allocations.py
+#
+# Provides interface with Pytest for testing the allocations of the hot
+# paths against their budgets (see allocations.py)
+
+import pytest
+
+from standard_scientific import allocations
+
+###############################################################
+# every operation is within its budget, and the breakdown of
+# those that are not is printed
+#
+@pytest.mark.parametrize("name", list(allocations.OPERATIONS))
+def test_budget(name):
+    report = allocations.run([name])
+    assert(report.ok), str(report)
+
+def test_every_operation_has_a_budget():
+    assert(set(allocations.BUDGETS) == set(allocations.OPERATIONS))
+
+def test_over_budget():
+    budgets = {"SigFig.__add__": allocations.Budget(blocks = 1, nbytes = 10, peak = 1e6)}
+    report = allocations.run(["SigFig.__add__"], budgets = budgets)
+    assert(not report.ok and report.failures[0].over(budgets["SigFig.__add__"]) == ["blocks", "nbytes"])
+    text = str(report)
+    assert("OVER BUDGET (blocks, nbytes)" in text)
+    assert("SigFig.__add__ allocates, per element:" in text and "sigfig.py:" in text)
+
+def test_measure():
+    a = allocations.measure("SigFig.__add__")
+    assert(3 <= a.blocks and 100 <= a.nbytes and a.peak > a.nbytes)
+    assert(sum(s.nbytes for s in a.sites) == pytest.approx(a.nbytes, rel = 0.2))
+
+def test_main(capsys):
+    assert(allocations.main(["--op", "SigFig.__str__"]) == 0)
+    assert("SigFig.__str__" in capsys.readouterr().out)
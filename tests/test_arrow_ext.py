@@ -0,0 +1,98 @@
+# test_arrow_ext.py
+#
+# Provides interface with Pytest for testing the Arrow extension types and
+# the Parquet helpers
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+pa = pytest.importorskip("pyarrow")
+from standard_scientific import arrow_ext
+
+def _sigfigs():
+    x = si.SigFigArray.from_floats([1.23, 4.6, 0.12, -7.], [3, 2, 3, 1])
+    x[1] = None
+    return x
+
+def _scidata():
+    return si.SciDataArray.from_SciData([si.SciData.from_str(s) for s in ["1.23(4)", "299792458", "-0.131(4)e-3"]])
+
+def _same(a, b):
+    if isinstance(a, si.SigFigArray):
+        return a.to_SigFigs() == b.to_SigFigs()
+    return all(u == v for u, v in zip(a.to_SciData(), b.to_SciData()))
+
+###############################################################
+# round trip through Arrow, with the numeric columns shared
+#
+@pytest.mark.parametrize("x", [_sigfigs(), _scidata()])
+def test_round_trip(x):
+    a = arrow_ext.to_arrow(x)
+    assert(len(a) == len(x))
+    y = arrow_ext.from_arrow(a)
+    assert(type(y) is type(x))
+    assert(_same(x, y))
+
+    v = y.value if isinstance(y, si.SigFigArray) else y.value.value
+    assert(np.shares_memory(v, x.value if isinstance(x, si.SigFigArray) else x.value.value) or np.any(np.isnan(v)))
+
+def test_missing_is_null():
+    a = arrow_ext.to_arrow(_sigfigs())
+    assert(a.null_count == 1)
+    assert(a.storage.is_null().to_pylist() == [False, True, False, False])
+
+###############################################################
+# chunked arrays are concatenated
+#
+def test_chunked():
+    x = _sigfigs()
+    c = pa.chunked_array([arrow_ext.to_arrow(x), arrow_ext.to_arrow(x)])
+    y = arrow_ext.from_arrow(c)
+    assert(y.to_SigFigs() == x.to_SigFigs() * 2)
+
+###############################################################
+# Parquet, written in batches and read back by row group
+#
+def test_parquet(tmp_path):
+    p = tmp_path / "data.parquet"
+    x, d = _sigfigs(), _scidata()
+    batches = ({"x": x[:3], "d": d, "f": np.arange(3.)} for _ in range(4))
+    arrow_ext.write_parquet(p, batches, row_group_size = 2)
+
+    groups = list(arrow_ext.iter_parquet(p))
+    assert(len(groups) == 8)
+    assert(sum(len(g["d"]) for g in groups) == 12)
+
+    r = arrow_ext.read_parquet(p)
+    assert(_same(r["x"][:3], x[:3]))
+    assert(_same(r["d"][3:6], d))
+    assert(list(r["f"][:3]) == [0., 1., 2.])
+
+    r = arrow_ext.read_parquet(p, columns = ["d"])
+    assert(list(r) == ["d"])
+
+def test_parquet_empty(tmp_path):
+    p = tmp_path / "empty.parquet"
+    arrow_ext.write_parquet(p, iter([]), schema = arrow_ext.parquet_schema({"x": si.SigFigArray, "d": si.SciDataArray}))
+    r = arrow_ext.read_parquet(p)
+    assert(list(r) == ["x", "d"] and len(r["x"]) == 0 and isinstance(r["d"], si.SciDataArray) and len(r["d"]) == 0)
+    with pytest.raises(AssertionError, match = "schema"):
+        arrow_ext.write_parquet(tmp_path / "none.parquet", iter([]))
+
+###############################################################
+# the pandas dtypes convert to and from Arrow
+#
+def test_pandas(tmp_path):
+    pd = pytest.importorskip("pandas")
+    import standard_scientific.pandas_ext
+    p = tmp_path / "frame.parquet"
+    df = pd.DataFrame({"x": pd.array(list(_sigfigs()), dtype = "sigfig"),
+                       "d": pd.array(list(_scidata()) + [None], dtype = "scidata")})
+    df.to_parquet(p)
+    r = pd.read_parquet(p)
+    assert(str(r["x"].dtype) == "sigfig" and str(r["d"].dtype) == "scidata")
+    assert(r["x"].isna().tolist() == [False, True, False, False])
+    assert(r["d"].isna().tolist() == [False, False, False, True])
+    assert(r["d"][1] == _scidata()[1])
@@ -0,0 +1,89 @@
+# test_chunked.py
+#
+# Provides interface with Pytest for testing the out-of-core ChunkedArray,
+# whose results must be exactly those of the arrays in memory
+
+import pytest
+import warnings
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific.chunked import ChunkedArray
+from standard_scientific.shared import array_columns
+
+def _sigfigs(n = 1000):
+    rng = np.random.default_rng(0)
+    x = si.SigFigArray.from_floats(rng.uniform(-10., 10., n) * 10.**rng.integers(-3, 3, n), rng.integers(1, 7, n))
+    x[5] = None
+    return x
+
+def _scidata(n = 1000):
+    rng = np.random.default_rng(1)
+    x = si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(rng.uniform(1., 10., n), 6),
+                                          si.SigFigArray.from_floats(rng.uniform(0.01, 0.1, n), 2))
+    x.is_exact[3] = True
+    x.value[7] = None
+    return x
+
+def _same(a, b):
+    (ka, ca), (kb, cb) = array_columns(a), array_columns(b)
+    return ka == kb and all(np.array_equal(u, v, equal_nan = True) for u, v in zip(ca, cb))
+
+###############################################################
+# writing and reading back, in any chunk size
+#
+@pytest.mark.parametrize("x", [_sigfigs(), _scidata()])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 4096])
+def test_write_open(tmp_path, x, chunk_size):
+    c = ChunkedArray.write(tmp_path / "x", (x[i:i + 300] for i in range(0, len(x), 300)), chunk_size = chunk_size)
+    assert(len(c) == len(x))
+    assert(all(len(b) <= chunk_size for b in c.chunks()))
+    assert(_same(c.compute(), x))
+    assert(_same(ChunkedArray.open(tmp_path / "x").compute(workers = 3), x))
+
+###############################################################
+# lazy arithmetic and rounding match the arrays in memory
+#
+@pytest.mark.parametrize("workers", [1, 4])
+def test_arithmetic(tmp_path, workers):
+    x = _sigfigs()
+    x[5] = x[4]
+    c = ChunkedArray.write(tmp_path / "x", x, chunk_size = 64)
+    y = (2. * c - c / 3.).map(lambda a: si.SigFigArray.from_floats(a.value, 2))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")     #re-rounding to fewer sigfigs hits exact halves
+        expected = si.SigFigArray.from_floats((2. * x - x / 3.).value, 2)
+        assert(_same(y.compute(workers), expected))
+        assert(_same(y.save(tmp_path / "y", workers).compute(), expected))
+
+def test_scidata_arithmetic():
+    x = _scidata()
+    x.value[7] = x.value[6]
+    c = ChunkedArray.from_array(x, chunk_size = 100)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert(_same((c * c + 1.).compute(), x * x + 1.))
+        assert(_same((-c).compute(), -x))
+
+###############################################################
+# reductions match those of reductions.py over the whole array
+#
+@pytest.mark.parametrize("how", si.reductions.SIGFIG_REDUCTIONS)
+@pytest.mark.parametrize("chunk_size", [1, 33, 5000])
+def test_reduce_sigfigs(how, chunk_size):
+    x = _sigfigs(200) if how != "prod" else si.SigFigArray.from_floats(np.linspace(0.9, 1.1, 200), 3)
+    expected = si.reduce_sigfigs(x, how)[0]
+    r = ChunkedArray.from_array(x, chunk_size = chunk_size).reduce(how, workers = 2)
+    assert((r.value, r.sigfigs, r.exponent) == (expected.value, expected.sigfigs, expected.exponent))
+
+@pytest.mark.parametrize("how", si.reductions.SCIDATA_REDUCTIONS)
+@pytest.mark.parametrize("chunk_size", [1, 33, 5000])
+def test_reduce_scidata(how, chunk_size):
+    x = _scidata(200)
+    expected = si.reduce_scidata(x, how)[0]
+    r = ChunkedArray.from_array(x, chunk_size = chunk_size).reduce(how)
+    assert(str(r) == str(expected) and r.value.value == expected.value.value)
+
+def test_reduce_missing():
+    x = si.SigFigArray.missing(10)
+    assert(ChunkedArray.from_array(x, chunk_size = 3).reduce("sum") is None)
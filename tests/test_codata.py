@@ -0,0 +1,86 @@
+# test_codata.py
+#
+# Provides interface with Pytest for testing the registry of CODATA
+# constants and the generator of its table
+
+import pytest
+
+import standard_scientific as si
+from standard_scientific.codata_gen import parse_listing
+from standard_scientific.codata_gen import write_table
+
+LISTING = """  Fundamental Physical Constants --- Complete Listing
+             2022 CODATA adjustment
+
+  Quantity                                                       Value                 Uncertainty           Unit
+-----------------------------------------------------------------------------------------------------------------------------
+electron g factor                                           -2.002 319 304 360 92    0.000 000 000 000 36
+Hartree energy                                              4.359 744 722 2060 e-18  0.000 000 000 0048 e-18  J
+molar gas constant                                          8.314 462 618...         (exact)                  J mol^-1 K^-1
+Rydberg constant                                            10 973 731.568 157       0.000 012                m^-1
+speed of light in vacuum                                    299 792 458              (exact)                  m s^-1
+"""
+
+###############################################################
+# the bundled constants are exactly what from_str gives
+#
+@pytest.mark.parametrize("name, s", [
+    ("Hartree energy", "4.359 744 722 2060(48) x 10-18"),
+    ("speed of light in vacuum", "299792458"),
+    ("Newtonian constant of gravitation", "6.674 30(15) e-11"),
+    ("reduced Planck constant", "1.054 571 817 e-34"),
+    ])
+def test_values(name, s):
+    x = si.constants[name]
+    y = si.SciData.from_str(s)
+    assert(x == y and x.is_exact == y.is_exact)
+    if not x.is_exact:
+        assert(x.unc == y.unc and x.rel_unc == y.rel_unc)
+
+###############################################################
+# lookup by name, identifier, and alias all give the same instance
+#
+def test_lookup():
+    c = si.constants
+    assert(c.E_h is c.hartree_energy)
+    assert(c.E_h is c["Hartree energy"])
+    assert(c["hartree energy"] is c.get("E_h"))
+    assert("c" in c and "speed of light" not in c)
+    assert(c.unit("c") == "m s^-1")
+    assert(c.version.startswith("CODATA"))
+    with pytest.raises(AttributeError):
+        c.not_a_constant
+
+###############################################################
+# substring search
+#
+@pytest.mark.parametrize("s, names", [
+    ("planck", ["molar Planck constant", "Planck constant", "reduced Planck constant"]),
+    ("Rydberg", ["Rydberg constant"]),
+    ("no such constant", []),
+    ])
+def test_search(s, names):
+    assert(si.constants.search(s) == names)
+
+def test_search_short():
+    assert(set(si.constants.search("g")) >= set(si.constants.search("gravitation")))
+
+###############################################################
+# the generator
+#
+def test_parse_listing():
+    consts = parse_listing(LISTING)
+    assert([n for n, _, _ in consts] == ["electron g factor", "Hartree energy", "molar gas constant",
+                                         "Rydberg constant", "speed of light in vacuum"])
+    assert(consts[0][1] == si.SciData.from_str("-2.00231930436092(36)"))
+    assert(consts[0][2] == "")
+    assert(consts[2][1].is_exact and consts[2][1].value.sigfigs == 10)
+    assert(consts[3][1] == si.SciData.from_str("10973731.568157(12)"))
+
+def test_write_table(tmp_path, monkeypatch):
+    write_table(LISTING, tmp_path / "my_codata_table.py")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    c = si.ConstantsRegistry("my_codata_table")
+    assert(len(c) == 5 and c.version == "CODATA 2022")
+    assert(c.E_h == si.constants.E_h)
+    assert(c.unit("Rydberg constant") == "m^-1")
@@ -0,0 +1,89 @@
+# test_compact.py
+#
+# Provides interface with Pytest for testing the CompactArray, which must
+# store SigFigArray and SciDataArray without losing anything
+
+import pytest
+import warnings
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific.shared import array_columns
+
+def _sigfigs(n = 1000, sigfigs = (1, 7), exponents = (-3, 3), seed = 0):
+    rng = np.random.default_rng(seed)
+    with warnings.catch_warnings():
+        #many sigfigs are sensitive to machine precision
+        warnings.simplefilter("ignore")
+        x = si.SigFigArray.from_floats(rng.uniform(-10., 10., n) * 10.**rng.integers(*exponents, n), rng.integers(*sigfigs, n))
+    x[5] = None
+    return x
+
+def _scidata(n = 1000, rel_unc = False):
+    rng = np.random.default_rng(1)
+    x = si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(rng.uniform(1., 10., n), 6),
+                                          si.SigFigArray.from_floats(rng.uniform(0.01, 0.1, n), 2))
+    x.is_exact[3] = True
+    x.value[7] = None
+    if rel_unc:
+        x.rel_unc
+    return x
+
+def _same(a, b):
+    (ka, ca), (kb, cb) = array_columns(a), array_columns(b)
+    return ka == kb and all(c.dtype == d.dtype and np.array_equal(c, d, equal_nan = True) for c, d in zip(ca, cb))
+
+###############################################################
+# the narrowest dtypes, and the exact round trip
+#
+@pytest.mark.parametrize("x, dtypes", [
+    (_sigfigs(sigfigs = (1, 5)), ["int16", "int8", "int8"]),
+    (_sigfigs(sigfigs = (1, 10)), ["int32", "int8", "int8"]),
+    (_sigfigs(sigfigs = (10, 16)), ["float64", "int8", "int8"]),
+    (_sigfigs(sigfigs = (2, 4), exponents = (-200, 200)), ["float64", "int8", "int16"]),
+    #relative uncertainties that were not computed are not stored (or computed)
+    (_scidata(), ["int32", "int8", "int8", "int16", "int8", "int8", "bool"]),
+    (_scidata(rel_unc = True), ["int32", "int8", "int8", "int16", "int8", "int8", "int16", "int8", "int8", "bool"]),
+])
+def test_round_trip(x, dtypes):
+    c = si.CompactArray.compact(x)
+    assert(c.dtypes == dtypes)
+    assert(_same(c.expand(), x))
+    assert(c.nbytes < sum(a.nbytes for a in array_columns(x)[1]))
+
+def test_unrounded():
+    #values that are not at their sigfig place are kept as they are
+    x = si.SigFigArray(value = np.array([1.23, 4.567, -0.]), sigfigs = np.array([3, 3, 1]), exponent = np.array([0, 0, 0]))
+    c = si.CompactArray.compact(x)
+    assert(c.dtypes[0] == "float64")
+    assert(_same(c.expand(), x))
+    assert(np.signbit(c.expand().value[2]))
+
+def test_report():
+    x = _sigfigs(sigfigs = (1, 5))
+    r = si.CompactArray.compact(x).report()
+    assert(r.nbytes == 24 * len(x) and r.compact_nbytes == 4 * len(x))
+    assert(r.saved == 20 * len(x) and r.ratio == 6.)
+    assert("6.00x" in str(r))
+
+###############################################################
+# indexing and arithmetic are those of the float64 arrays
+#
+def test_getitem():
+    x = _sigfigs()
+    c = si.CompactArray.compact(x)
+    assert(str(c[3]) == str(x[3]) and str(c[-1]) == str(x[-1]))
+    assert(_same(c[10:20].expand(), x[10:20]))
+    assert(len(c) == len(x))
+
+@pytest.mark.parametrize("x", [_sigfigs(sigfigs = (1, 5)), _scidata()])
+def test_arithmetic(x):
+    x = x[~(x.is_missing() if isinstance(x, si.SigFigArray) else x.value.is_missing())]
+    c = si.CompactArray.compact(x)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert(_same((c * 2.5).expand(), x * 2.5))
+        assert(_same((c + c).expand(), x + x))
+        assert(_same((1. - c).expand(), 1. - x))
+        assert(_same((c / c[::-1]).expand(), x / x[::-1]))
+        assert(_same((-c).expand(), -x))
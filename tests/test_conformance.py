@@ -0,0 +1,62 @@
+# test_conformance.py
+#
+# Provides interface with Pytest for testing the conformance harness, and
+# (through it) every batch implementation against the scalar reference
+
+import pytest
+import warnings
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific import conformance
+from standard_scientific.sigfig import w_round
+from standard_scientific.sigfig_array import w_round_array
+
+###############################################################
+# every implementation agrees with the reference on the corpora
+#
+@pytest.mark.parametrize("op", conformance.OPS)
+def test_conformance(op):
+    report = conformance.run([op], n = 800, seed = 1)
+    assert(report.ok), str(report)
+    assert(len(report.results) == 1 + len(conformance.IMPLEMENTATIONS[op]))
+
+@pytest.mark.parametrize("op", ["exponent", "w_round", "add"])
+def test_corpus(op):
+    inputs, cat = conformance.corpus(op, 400)
+    assert(all(len(a) == 400 for a in inputs))
+    assert(set(cat) == {"random", "halfway", "pow10", "tiny"})
+    x = inputs[0]
+    assert(np.any(x[cat == "tiny"] == 0.) and np.any(np.abs(x) < 2.2250738585072014e-308))
+
+###############################################################
+# a wrong implementation is found, and one that raises is reported
+#
+def test_mismatch(monkeypatch):
+    monkeypatch.setitem(conformance.IMPLEMENTATIONS, "exponent", {
+        "off by one at powers of ten": lambda x: (si.exponents_from_floats(np.nextafter(x, 0.)),),
+        "raises": lambda x: 1 / 0,
+    })
+    report = conformance.run(["exponent"], n = 400)
+    assert(not report.ok)
+    wrong, raises = report.results[1:]
+    assert(len(wrong.mismatches) > 0 and {m.category for m in wrong.mismatches} <= {"pow10", "tiny"})
+    m = wrong.mismatches[0]
+    assert(m.got == (m.expected[0] - 1,))
+    assert(raises.error.startswith("ZeroDivisionError"))
+    assert("ZeroDivisionError" in str(report))
+
+def test_main(capsys):
+    assert(conformance.main(["-n", "200", "--op", "exponent"]) == 0)
+    assert("exponents_from_floats" in capsys.readouterr().out)
+
+###############################################################
+# rounding to the left of the leading digit warns, rather than raising
+# while formatting its warning
+#
+@pytest.mark.parametrize("x, d, expected", [(50., -2, 0.), (-50., -2, -0.), (5., -1, 0.)])
+def test_w_round_negative_places(x, d, expected):
+    with pytest.warns(UserWarning, match = "sensitive"):
+        assert(w_round(x, d) == expected)
+    with pytest.warns(UserWarning, match = "1 of 1"):
+        assert(w_round_array([x], [d])[0] == expected)
@@ -0,0 +1,88 @@
+# test_consistency.py
+#
+# Provides interface with Pytest for testing the consistency (z-score)
+# matrices and Birge ratios of sets of SciData
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+STRINGS = ["1.23(4)", "1.30(5)", "1.5(1)", "1.27(2)", "299792458", "1.23"]
+
+def _data():
+    return [si.SciData.from_str(s) for s in STRINGS]
+
+def _z(a, b):
+    ua = 0. if a.is_exact else a.unc.value
+    ub = 0. if b.is_exact else b.unc.value
+    diff = abs(a.value.value - b.value.value)
+    s = (ua**2 + ub**2)**0.5
+    if s == 0.:
+        return 0. if diff == 0. else np.inf
+    return diff / s
+
+###############################################################
+# every block size gives the z-scores of the scalar definition
+#
+@pytest.mark.parametrize("block_size", [1, 2, 4, 512])
+def test_matrix(block_size):
+    d = _data()
+    z = si.consistency_matrix(d, block_size = block_size)
+    expected = np.array([[_z(a, b) for b in d] for a in d])
+    assert(np.allclose(z, expected, rtol = 1e-14, atol = 0.))
+    assert(np.array_equal(si.consistency_matrix(d, k = 2., block_size = block_size), expected <= 2.))
+
+def test_missing():
+    x = si.SciDataArray.from_SciData(_data())
+    x.value[1] = None
+    z = si.consistency_matrix(x)
+    assert(np.all(np.isnan(z[1])) and np.all(np.isnan(z[:, 1])))
+    i, j, _ = si.inconsistent_pairs(x, k = 0.)
+    assert(1 not in i and 1 not in j)
+
+###############################################################
+# the sparse pairs are those of the matrix above the diagonal
+#
+@pytest.mark.parametrize("block_size", [1, 3, 512])
+@pytest.mark.parametrize("k", [0., 1., 2.])
+def test_pairs(block_size, k):
+    d = _data()
+    i, j, z = si.inconsistent_pairs(d, k = k, block_size = block_size)
+    full = si.consistency_matrix(d)
+    ei, ej = np.nonzero(np.triu(full > k, 1))
+    assert(np.array_equal(i, ei) and np.array_equal(j, ej))
+    assert(np.array_equal(z, full[ei, ej]))
+
+def test_pairs_large():
+    rng = np.random.default_rng(0)
+    n = 2000
+    x = si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(rng.normal(10., 0.1, n), 6),
+                                          si.SigFigArray.from_floats(np.full(n, 0.1), 2))
+    i, j, z = si.inconsistent_pairs(x, k = 3., block_size = 256)
+    full = si.consistency_matrix(x)
+    assert(len(i) == np.count_nonzero(np.triu(full > 3., 1)))
+    assert(np.all(i < j) and np.all(z > 3.))
+
+def test_empty():
+    i, j, z = si.inconsistent_pairs(si.SciDataArray.from_SciData([]))
+    assert(len(i) == len(j) == len(z) == 0)
+
+###############################################################
+# Birge ratio
+#
+def test_birge_ratio():
+    d = _data()[:4]
+    s = si.birge_ratio(d)
+    v = np.array([a.value.value for a in d])
+    w = 1. / np.array([a.unc.value for a in d])**2
+    mean = np.sum(w * v) / np.sum(w)
+    assert(s.dof == 3)
+    assert(s.chi2 == pytest.approx(np.sum(w * (v - mean)**2)))
+    assert(s.birge_ratio == pytest.approx((s.chi2 / 3)**0.5))
+    assert(s.mean.value.value == pytest.approx(mean, abs = 0.01))
+    assert(s.mean.unc.value == si.SigFig.from_float(np.sum(w)**-0.5, 1).value)
+
+def test_birge_ratio_exact():
+    with pytest.raises(AssertionError):
+        si.birge_ratio(_data())
@@ -0,0 +1,115 @@
+# test_convert.py
+#
+# Provides interface with Pytest for testing the streaming converter and
+# the python -m standard_scientific command line
+
+import pytest
+import csv
+import io
+import json
+
+import standard_scientific as si
+from standard_scientific.convert import convert, parse_chunk
+from standard_scientific.__main__ import main
+
+STRINGS = ["1.234(5)e3", "299792458", "-0012.345(67)e-4", "6.62607015e-34", "0.131(4)", "2.3(3)e1"]
+
+def _text(lines):
+    return io.StringIO("".join(s + "\n" for s in lines))
+
+###############################################################
+# every row is that of the scalar SciData.from_str, for any chunk size
+#
+@pytest.mark.parametrize("chunk_size", [1, 4, 100])
+def test_csv(chunk_size):
+    out = io.StringIO()
+    stats = convert(_text(STRINGS[:3] + [""] + STRINGS[3:]), out, chunk_size = chunk_size)
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert(stats.rows == len(rows) == len(STRINGS))
+    for s, r in zip(STRINGS, rows):
+        d = si.SciData.from_str(s)
+        assert(r["text"] == str(d))
+        assert(float(r["value"]) == d.value.value)
+        assert(int(r["sigfigs"]) == d.value.sigfigs)
+        assert(r["is_exact"] == str(d.is_exact))
+        if not d.is_exact:
+            assert(float(r["unc"]) == d.unc.value)
+            assert(int(r["unc_sigfigs"]) == d.unc.sigfigs)
+
+def test_jsonl():
+    out = io.StringIO()
+    convert(_text(STRINGS), out, fmt = "jsonl")
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert([r["text"] for r in rows] == [str(si.SciData.from_str(s)) for s in STRINGS])
+    assert(rows[1]["unc"] is None and rows[1]["is_exact"])
+
+###############################################################
+# workers produce the same output, in order
+#
+def test_workers():
+    lines = STRINGS * 50
+    serial, parallel = io.StringIO(), io.StringIO()
+    convert(_text(lines), serial, chunk_size = 7)
+    stats = convert(_text(lines), parallel, chunk_size = 7, workers = 2)
+    assert(stats.rows == len(lines))
+    assert(parallel.getvalue() == serial.getvalue())
+
+###############################################################
+# invalid lines, rounding of the uncertainties and warnings
+#
+def test_invalid():
+    with pytest.raises(ValueError, match = "line 2"):
+        convert(_text(["1.2(3)", "abc"]), io.StringIO())
+    stats = convert(_text(["1.2(3)", "abc"]), io.StringIO(), skip = True)
+    assert(stats.rows == 1 and stats.skipped == 1)
+
+def test_unc_sigfigs():
+    x, nwarn, skipped = parse_chunk([(1, "1.234(56)"), (2, "299792458")], unc_sigfigs = 1)
+    assert(str(x[0]) == str(si.SciData.from_str("1.23(6)")))
+    assert(str(x[1]) == str(si.SciData.from_str("299792458")))
+    assert(nwarn == 0 and skipped == 0)
+
+    x, nwarn, skipped = parse_chunk([(1, "1.25(25)")], unc_sigfigs = 1)
+    assert(nwarn > 0)
+
+###############################################################
+# the command line
+#
+def test_main(tmp_path, capsys):
+    src = tmp_path / "input.txt"
+    src.write_text("\n".join(STRINGS) + "\n")
+    assert(main([str(src), str(tmp_path / "output.jsonl")]) == 0)
+    assert(len((tmp_path / "output.jsonl").read_text().splitlines()) == len(STRINGS))
+    assert("rows/s" in capsys.readouterr().err)
+
+    src.write_text("1.2(3)\nabc\n")
+    assert(main([str(src), str(tmp_path / "output.csv"), "--quiet"]) == 1)
+    assert("line 2" in capsys.readouterr().err)
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    from standard_scientific.arrow_ext import read_parquet
+    convert(_text(STRINGS), tmp_path / "output.parquet", fmt = "parquet", chunk_size = 4)
+    x = read_parquet(tmp_path / "output.parquet")["data"]
+    assert([str(d) for d in x] == [str(si.SciData.from_str(s)) for s in STRINGS])
+    #an empty input is an empty file
+    convert(_text([]), tmp_path / "empty.parquet", fmt = "parquet")
+    assert(len(read_parquet(tmp_path / "empty.parquet")["data"]) == 0)
+
+def test_main_cache(tmp_path, capsys):
+    src = tmp_path / "input.txt"
+    src.write_text("\n".join(STRINGS) + "\n")
+    assert(main([str(src), str(tmp_path / "output.csv"), "--cache-max-mb", "1"]) == 1)
+    assert("requires --cache" in capsys.readouterr().err)
+    assert(main([str(src), str(tmp_path / "output.csv"), "--quiet", "--cache", str(tmp_path / "cache"), "--cache-max-mb", "1"]) == 0)
+
+###############################################################
+# the bytes read are counted in bytes, not characters (a blank
+# line of a non-breaking space is three), with or without a cache
+#
+def test_bytes_read(tmp_path):
+    text = "".join(s + "\n" for s in STRINGS) + "\u00a0\n"
+    src = tmp_path / "input.txt"
+    src.write_bytes(text.encode())
+    assert(convert(io.StringIO(text), io.StringIO()).bytes_read == len(text.encode()) > len(text))
+    assert(convert(str(src), io.StringIO(), cache = tmp_path / "cache").bytes_read == len(text.encode()))
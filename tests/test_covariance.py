@@ -0,0 +1,101 @@
+# test_covariance.py
+#
+# Provides interface with Pytest for testing the covariance registry
+# and its use in the propagation of uncertainties
+
+import gc
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+###############################################################
+# correlated products and ratios
+#
+@pytest.mark.parametrize("r", [0.9, -0.5, 0.])
+def test_mul_div(r):
+    reg = si.CovarianceRegistry()
+    a = si.SciData.from_str("1.234(6)")
+    b = si.SciData.from_str("2.00(4)e1")
+    reg.set_correlation(a, b, r)
+    ra, rb = 0.006 / 1.234, 0.4 / 20.
+    x = si.propagate(np.multiply, a, b, covariance = reg)
+    y = si.propagate(np.true_divide, a, b, covariance = reg)
+    assert(x.unc.contains(x.value.value * np.sqrt(ra**2 + rb**2 + 2 * r * ra * rb)))
+    assert(y.unc.contains(y.value.value * np.sqrt(ra**2 + rb**2 - 2 * r * ra * rb)))
+
+###############################################################
+# the default registry is used by * and /, but not by + and -
+# unless asked
+#
+def test_default_registry():
+    a = si.SciData.from_str("1.00(2)")
+    b = si.SciData.from_str("2.00(4)")
+    si.set_correlation(a, b, 1.)
+    assert(si.covariance_registry.correlation(a, b) == 1.)
+    assert((a * b).unc.contains(0.08))
+    assert(a.mul_no_covar(b).unc.contains(0.06))
+    assert((a + b).unc.contains(0.04))
+    assert(a.add_covar(b).unc.contains(0.06))
+    assert(a.sub_covar(b).unc.contains(0.02))
+    si.covariance_registry.remove(a)
+    assert(si.covariance_registry.correlation(a, b) == 0.)
+
+###############################################################
+# entries are dropped along with their SciData
+#
+def test_garbage_collected():
+    reg = si.CovarianceRegistry()
+    a = si.SciData.from_str("1.00(3)")
+    b = si.SciData.from_str("1.00(4)")
+    reg.set_correlation(a, b, 0.5)
+    assert(len(reg) == 1)
+    del b
+    gc.collect()
+    assert(len(reg) == 0)
+
+###############################################################
+# removing the last correlation of an instance stops tracking it
+#
+def test_zero_correlation():
+    reg = si.CovarianceRegistry()
+    a = si.SciData.from_str("1.00(3)")
+    b = si.SciData.from_str("1.00(4)")
+    c = si.SciData.from_str("1.00(5)")
+    reg.set_correlation(a, b, 0.5)
+    reg.set_correlation(a, c, 0.5)
+    reg.set_correlation(a, b, 0.)
+    assert(reg.correlation(a, c) == 0.5)
+    assert(len(reg._corr) == 2 and len(reg._finalizers) == 2)
+    reg.remove(c)
+    assert(len(reg._corr) == 0 and len(reg._finalizers) == 0)
+
+###############################################################
+# the batched J.S.J^T agrees with the dense calculation
+#
+def test_propagate_covariance():
+    reg = si.CovarianceRegistry()
+    x = [si.SciData.from_str(s) for s in ["1.234(6)", "2.00(4)e1", "3.1(3)", "7.77(7)"]]
+    reg.set_correlations([(x[0], x[1], 0.3), (x[1], x[3], -0.2)])
+    f = lambda a, b, c, d: [a * b, a / c, c + d, np.exp(a) * d]
+    res, cov = si.propagate_covariance(f, *x, covariance = reg, register = True)
+
+    eps = 1e-7
+    v = np.array([y.as_exact() for y in x])
+    jac = np.array([(np.array(f(*(v + eps * e))) - np.array(f(*(v - eps * e)))) / (2 * eps) for e in np.eye(4)]).T
+    assert(np.allclose(cov, jac @ reg.covariance_matrix(x) @ jac.T))
+
+    assert(all(not y.is_exact for y in res))
+    assert(np.isclose(reg.correlation(res[0], res[1]), cov[0, 1] / np.sqrt(cov[0, 0] * cov[1, 1])))
+
+###############################################################
+# bad correlations
+#
+@pytest.mark.parametrize("a, b, r", [
+    (si.SciData.from_str("1.0(1)"), si.SciData.from_str("1.0(1)"), 1.5),
+    (si.SciData.from_str("1.0(1)"), si.SciData.from_str("1.0"), 0.5),
+    (si.SciData.from_str("1.0(1)"), 1.0, 0.5)
+    ])
+def test_bad_correlation(a, b, r):
+    with pytest.raises(Exception) as e:
+        si.CovarianceRegistry().set_correlation(a, b, r)
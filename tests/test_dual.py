@@ -0,0 +1,58 @@
+# test_dual.py
+#
+# Provides interface with Pytest for testing the forward-mode
+# differentiation in the Dual class
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+###############################################################
+# derivatives of single variable functions against their
+# analytic forms
+#
+@pytest.mark.parametrize("f, df, x", [
+    (np.exp,    np.exp,                           0.7),
+    (np.log,    lambda x: 1. / x,                 0.7),
+    (np.sqrt,   lambda x: 0.5 / np.sqrt(x),       0.7),
+    (np.sin,    np.cos,                           0.7),
+    (np.cos,    lambda x: -np.sin(x),             0.7),
+    (np.tan,    lambda x: 1. / np.cos(x)**2,      0.7),
+    (np.arcsin, lambda x: 1. / np.sqrt(1 - x**2), 0.7),
+    (np.arctan, lambda x: 1. / (1 + x**2),        0.7),
+    (lambda x: x**3, lambda x: 3 * x**2,          0.7),
+    (lambda x: 2**x, lambda x: np.log(2) * 2**x,  0.7),
+    (lambda x: 1 / x - x, lambda x: -1 / x**2 - 1, 0.7),
+    ])
+def test_derivative(f, df, x):
+    d = f(si.Dual.seed(x, 0, 1))
+    assert(np.isclose(d.value, f(x)))
+    assert(np.isclose(d.grad[0], df(x)))
+
+###############################################################
+# gradients with respect to several inputs
+#
+def test_gradient():
+    x = si.Dual.seed(2., 0, 2)
+    y = si.Dual.seed(3., 1, 2)
+    z = x * y + np.exp(x / y)
+    assert(np.allclose(z.grad, [3. + np.exp(2. / 3.) / 3., 2. - 2. * np.exp(2. / 3.) / 9.]))
+
+###############################################################
+# arrays broadcast against scalars
+#
+def test_broadcast():
+    x = si.Dual.seed(np.array([1., 2., 3.]), 0, 2)
+    y = si.Dual.seed(2., 1, 2)
+    z = x * y
+    assert(z.grad.shape == (2, 3))
+    assert(np.allclose(z.grad[0], [2., 2., 2.]))
+    assert(np.allclose(z.grad[1], [1., 2., 3.]))
+
+###############################################################
+# unsupported functions are refused
+#
+def test_unsupported():
+    with pytest.raises(TypeError) as e:
+        np.floor(si.Dual.seed(1.5, 0, 1))
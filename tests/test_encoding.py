@@ -0,0 +1,76 @@
+# test_encoding.py
+#
+# Provides interface with Pytest for testing dictionary encoded arrays
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific.encoding import EncodedArray
+from standard_scientific.shared import array_columns
+
+def _same(a, b):
+    (ka, ca), (kb, cb) = array_columns(a), array_columns(b)
+    return ka == kb and all(np.array_equal(u, v, equal_nan = True) for u, v in zip(ca, cb))
+
+def _sigfigs(n = 10000):
+    rng = np.random.default_rng(0)
+    levels = si.SigFigArray.from_floats([1.23, 0.06, 4.6, 1.23, 7.], [3, 1, 2, 2, 1])
+    return levels[rng.integers(0, len(levels), n)]
+
+def _scidata(n = 10000):
+    rng = np.random.default_rng(1)
+    levels = si.SciDataArray.from_SciData([si.SciData.from_str(s) for s in ["1.234(5)", "299792458", "2.3(3)e1", "1.234(6)"]])
+    return levels[rng.integers(0, len(levels), n)]
+
+###############################################################
+# encoding and decoding
+#
+@pytest.mark.parametrize("x, cardinality", [(_sigfigs(), 5), (_scidata(), 4)])
+def test_round_trip(x, cardinality):
+    e = EncodedArray.encode(x)
+    assert(e.codes.dtype == np.int32)
+    assert(e.cardinality == cardinality)
+    assert(e.nbytes < sum(c.nbytes for c in array_columns(x)[1]) / 4)
+    assert(_same(e.decode(), x))
+    assert(e.counts().sum() == len(x))
+
+def test_order_and_missing():
+    x = si.SigFigArray.from_floats([4., 1., 4., 2.], 1)
+    x[1] = None
+    e = EncodedArray.encode(x)
+    assert(e.codes.tolist() == [0, 1, 0, 2])
+    assert(e[1] is None and e[0] == x[0])
+    assert(_same(e[1:].decode(), x[1:]))
+    assert(EncodedArray.encode(si.SigFigArray.missing(0)).cardinality == 0)
+
+###############################################################
+# operations are computed per distinct element, with the results of
+# the decoded arrays
+#
+def test_arithmetic():
+    x = _sigfigs()
+    e = EncodedArray.encode(x)
+    y = (2. * e + si.SigFig.from_float(1.0, 2)) / 3.
+    assert(y.cardinality == e.cardinality)
+    assert(_same(y.decode(), (2. * x + si.SigFig.from_float(1.0, 2)) / 3.))
+    assert(_same((-e).decode(), -x))
+
+def test_pairs():
+    x, y = _sigfigs(), _sigfigs()[::-1]
+    p = EncodedArray.encode(x) * EncodedArray.encode(y)
+    assert(p.cardinality <= 25)
+    assert(_same(p.decode(), x * y))
+
+def test_scidata():
+    x = _scidata()
+    e = EncodedArray.encode(x)
+    assert(_same((e * e).decode(), x * x))
+    assert(_same((e + 1.).decode(), x + 1.))
+    assert(e.to_strings() == si.to_strings(x))
+
+def test_map():
+    x = _sigfigs()
+    calls = []
+    e = EncodedArray.encode(x).map(lambda d: calls.append(len(d)) or abs(d))
+    assert(calls == [5] and _same(e.decode(), abs(x)))
@@ -0,0 +1,86 @@
+# test_fitting.py
+#
+# Provides interface with Pytest for testing weighted least squares fits
+# of SciData
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+def _data(n = 40, seed = 3, coeffs = (2., 0.5, -0.03)):
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0., 10., n)
+    u = rng.uniform(0.1, 0.3, n)
+    y = np.polyval(coeffs[::-1], x) + rng.normal(0., u)
+    return x, si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(y, 8), si.SigFigArray.from_floats(u, 2))
+
+###############################################################
+# the parameters and covariances are those of np.polyfit
+#
+@pytest.mark.parametrize("degree", [0, 1, 2, 3])
+def test_polynomial(degree):
+    x, y = _data()
+    r = si.fit_polynomial(x, y, degree)
+    w = 1. / y.unc.value
+    p, cov = np.polyfit(x, y.value.value, degree, w = w, cov = "unscaled")
+    assert(np.allclose(r.cov[0], cov[::-1, ::-1], rtol = 1e-8, atol = 0.))
+    for k, s in enumerate(r.parameters()):
+        assert(s.unc.sigfigs == 2)
+        assert(s.value.sigfig_place() == s.unc.sigfig_place())
+        assert(s.value.value == pytest.approx(p[degree - k], abs = s.unc.value))
+        assert(s.unc == si.SigFig.from_float(cov[degree - k, degree - k]**0.5, 2))
+    assert(r.dof[0] == len(x) - degree - 1)
+    assert(r.chi2[0] == pytest.approx(np.sum((w * (y.value.value - np.polyval(p, x)))**2)))
+
+def test_basis():
+    x, y = _data(coeffs = (1., 0.))
+    r = si.fit(si.SigFigArray.from_floats(x, 3), y, [lambda t: 1., np.sin, np.cos])
+    A = np.stack([np.ones_like(x), np.sin(x), np.cos(x)], axis = 1) / y.unc.value[:, None]
+    p = np.linalg.lstsq(A, y.value.value / y.unc.value, rcond = None)[0]
+    assert(np.allclose(np.array([s.value.value for s in r.parameters()]), p, atol = 1e-3))
+
+def test_scidata_input():
+    x, y = _data()
+    a = si.fit_linear(x, y)
+    b = si.fit_linear(si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(x, 5), si.SigFigArray.from_floats(x * 0.01 + 0.01, 1)),
+                      list(y), unc_sigfigs = 1)
+    assert(np.allclose(a.cov, b.cov))
+    assert(all(s.unc.sigfigs == 1 for s in b.parameters()))
+
+###############################################################
+# many fits at once are the fits of each group alone
+#
+def test_groups():
+    x, y = _data(n = 90)
+    ids = np.arange(90) % 4
+    ids[ids == 3] = -1
+    r = si.fit_polynomial(x, y, 2, ids = ids, ngroups = 4)
+    for g in range(3):
+        one = si.fit_polynomial(x[ids == g], y[ids == g], 2)
+        assert(np.allclose(r.cov[g], one.cov[0], rtol = 1e-10))
+        assert([str(s) for s in r.parameters(g)] == [str(s) for s in one.parameters()])
+    assert(all(s.value is None for s in r.parameters(3)))
+    assert(np.all(np.isnan(r.cov[3])))
+
+###############################################################
+# rank deficient groups (all x equal) have no fit, and do not
+# break the other groups
+#
+def test_rank_deficient():
+    y = si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats([1., 1.5, 2., 1.2, 1.3], 2),
+                                          si.SigFigArray.from_floats([0.1] * 5, 1))
+    r = si.fit_linear(np.array([0., 1., 2., 0., 0.]), y, ids = [0, 0, 0, 1, 1], ngroups = 2)
+    one = si.fit_linear([0., 1., 2.], y[:3])
+    assert([str(s) for s in r.parameters(0)] == [str(s) for s in one.parameters()])
+    assert(all(s.value is None for s in r.parameters(1)))
+    assert(np.all(np.isnan(r.cov[1])) and np.isnan(r.chi2[1]))
+
+    r = si.fit_linear([3., 3., 3.], y[:3])
+    assert(all(s.value is None for s in r.parameters()))
+    assert(np.all(np.isnan(r.cov[0])))
+
+def test_exact():
+    x, y = _data()
+    with pytest.raises(AssertionError):
+        si.fit_linear(x, y.as_exact())
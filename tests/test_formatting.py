@@ -0,0 +1,62 @@
+# test_formatting.py
+#
+# Provides interface with Pytest for testing the bulk string formatting,
+# which must be byte-identical to SigFig.__str__ and SciData.__str__
+
+import io
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+sigfigs = [si.SigFig.from_float(x, s) for x, s in [
+    (1.2, 2), (0.12, 2), (12., 2), (-3.14159, 6), (1e-300, 3), (6.02214076e23, 9), (0., 1), (123456., 1)]]
+
+scidata = [si.SciData.from_str(s) for s in [
+    "1.2(345)", "299792458", "-0012.345(67)e-4", "+12.3", "4.359 744 722 2060(48) x 10-18",
+    "6.62607015e-34", "+00.0013(3)", "123000(1)", "9.1093837139(28)e-31"]]
+
+###############################################################
+# the strings match str() exactly
+#
+@pytest.mark.parametrize("x", [
+    sigfigs,
+    scidata,
+    scidata + [si.SciData.exact_from_float(1. / 3.), si.SciData.from_str("1.234(6)") * si.SciData.from_str("2.00(4)e1")]
+    ])
+def test_to_strings(x):
+    assert(si.to_strings(x) == [str(v) for v in x])
+
+###############################################################
+# random data, in small chunks (some of which will round
+# sensitively)
+#
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_random():
+    rng = np.random.default_rng(0)
+    v = rng.standard_normal(1000) * 10.**rng.integers(-30, 30, 1000)
+    a = si.SigFigArray.from_floats(v, rng.integers(1, 16, 1000))
+    assert(si.to_strings(a, chunk_size = 77) == [str(x) for x in a])
+    u = si.SigFigArray.from_floats(np.abs(v) * 1e-3, 2)
+    d = si.SciDataArray.from_SigFigArrays(a, u, None, rng.random(1000) < 0.3)
+    assert(si.to_strings(d, chunk_size = 77) == [str(x) for x in d])
+
+###############################################################
+# writing to text and binary files, and to buffers
+#
+@pytest.mark.parametrize("out", [io.StringIO(), io.BytesIO(), bytearray(1000)])
+def test_write_strings(out):
+    text = "".join(str(x) + ", " for x in scidata)
+    n = si.write_strings(si.SciDataArray.from_SciData(scidata), out, sep = ", ", chunk_size = 4)
+    assert(n == len(text))
+    if isinstance(out, bytearray):
+        assert(bytes(out[:n]).decode() == text)
+    else:
+        assert(out.getvalue() in (text, text.encode()))
+
+###############################################################
+# buffers that are too small
+#
+def test_small_buffer():
+    with pytest.raises(Exception) as e:
+        si.write_strings(sigfigs, bytearray(10))
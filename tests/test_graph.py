@@ -0,0 +1,97 @@
+# test_graph.py
+#
+# Provides interface with Pytest for testing the QuantityGraph of
+# lazily evaluated derived quantities
+
+import pytest
+
+import standard_scientific as si
+
+def make_graph():
+    g = si.QuantityGraph()
+    g.set_input("h", si.SciData.from_str("6.62607015e-34"))
+    g.set_input("c", si.SciData.from_str("299792458"))
+    g.set_input("m", si.SciData.from_str("9.1093837139(28)e-31"))
+    g.define("hc", lambda h, c: h * c)
+    g.define("mc2", lambda m, c: m * c * c)
+    g.define("ratio", lambda hc, mc2: hc / mc2)
+    return g
+
+###############################################################
+# quantities are only evaluated when requested, and once
+#
+def test_lazy():
+    g = make_graph()
+    assert(g.log == [])
+    r = g["ratio"]
+    assert(sorted(x.name for x in g.log) == ["hc", "mc2", "ratio"])
+    g.clear_log()
+    assert(g["ratio"] is r)
+    assert(g.log == [])
+    assert(r == g["hc"] / g["mc2"])
+
+###############################################################
+# only the downstream part of the graph is recomputed
+#
+def test_downstream():
+    g = make_graph()
+    g.evaluate()
+    g.clear_log()
+    g.set_input("m", si.SciData.from_str("9.1093837(28)e-31"))
+    assert(g.is_stale("mc2") and g.is_stale("ratio") and not g.is_stale("hc"))
+    g.evaluate()
+    assert(sorted(x.name for x in g.log) == ["mc2", "ratio"])
+    assert(all(x.seconds >= 0. for x in g.log))
+
+###############################################################
+# identical inputs (or results) do not trigger recomputation
+#
+def test_early_cutoff():
+    g = make_graph()
+    g.define("sign", lambda m: 1 if m.as_exact() > 0 else -1)
+    g.define("twice", lambda sign: 2 * sign)
+    g.evaluate()
+    g.clear_log()
+    g.set_input("h", si.SciData.from_str("6.62607015e-34"))
+    assert(not g.is_stale("hc"))
+    g.set_input("m", si.SciData.from_str("9.2(1)e-31"))
+    g.evaluate(["twice"])
+    assert([(x.name, x.changed) for x in g.log] == [("sign", False)])
+
+def test_early_cutoff_rel_unc():
+    #whether the relative uncertainty was computed does not matter
+    g = make_graph()
+    g.evaluate()
+    g.clear_log()
+    m = si.SciData.from_str("9.1093837139(28)e-31")
+    assert(g["mc2"] is not None and m._rel_unc is None)
+    g.set_input("m", m)
+    assert(not g.is_stale("mc2"))
+    m = si.SciData.from_str("9.1093837139(28)e-31")
+    m.rel_unc
+    g.set_input("m", m)
+    assert(not g.is_stale("mc2"))
+    assert("_rel_unc" not in repr(m))
+
+###############################################################
+# introspection
+#
+def test_introspection():
+    g = make_graph()
+    assert(sorted(g.inputs()) == ["c", "h", "m"])
+    assert(sorted(g.derived()) == ["hc", "mc2", "ratio"])
+    assert(g.dependencies("mc2") == ["m", "c"])
+    assert(g.upstream("ratio") == {"h", "c", "m", "hc", "mc2"})
+    assert(g.downstream("c") == {"hc", "mc2", "ratio"})
+
+###############################################################
+# bad definitions
+#
+@pytest.mark.parametrize("name, func, deps", [
+    ("x", lambda y: y, None),
+    ("hc", lambda ratio: ratio, None),
+    ("h", lambda c: c, None),
+    ])
+def test_bad_define(name, func, deps):
+    with pytest.raises(Exception) as e:
+        make_graph().define(name, func, deps)
@@ -0,0 +1,81 @@
+# test_linalg.py
+#
+# Provides interface with Pytest for testing the matrix products and
+# solves of SigFigArray
+
+import pytest
+import warnings
+from functools import reduce
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific.linalg import matmul, dot, solve, inv
+
+def _matrix(rng, shape):
+    return si.SigFigArray.from_floats(rng.uniform(-9., 9., shape) * 10.**rng.integers(-2, 3, shape),
+                                      rng.integers(2, 6, shape))
+
+def _element(x, *i):
+    return si.SigFig(value = float(x.value[i]), sigfigs = int(x.sigfigs[i]), exponent = int(x.exponent[i]))
+
+###############################################################
+# the places are those of the chained scalar operators, and the
+# values are within K units of the last place of theirs
+#
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("m", [1, 3, 8])
+def test_matmul(seed, m):
+    rng = np.random.default_rng(seed)
+    a, b = _matrix(rng, (4, m)), _matrix(rng, (m, 5))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        c = a @ b
+        for i in range(4):
+            for j in range(5):
+                try:
+                    s = reduce(lambda x, y: x + y, [_element(a, i, k) * _element(b, k, j) for k in range(m)])
+                except AssertionError:
+                    continue    #the chain fails where it cancels to zero
+                assert(_element(c, i, j).sigfig_place() == s.sigfig_place())
+                assert(abs(c.value[i, j] - s.value) <= m * 10.**s.sigfig_place() * (1. + 1e-9))
+
+def test_plain_numbers():
+    rng = np.random.default_rng(0)
+    a = _matrix(rng, (3, 3))
+    x = np.array([1., 2., 3.])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        c = a @ x
+        for i in range(3):
+            s = reduce(lambda u, v: u + v, [_element(a, i, k) * x[k] for k in range(3)])
+            assert(_element(c, i).sigfig_place() == s.sigfig_place())
+        assert((x @ a).shape == (3,))
+
+def test_dot():
+    v = si.SigFigArray.from_floats([1.1, 2.2, 3.3], [2, 2, 3])
+    d = dot(v, v)
+    assert(isinstance(d, si.SigFig))
+    assert(d == (v[0] * v[0] + v[1] * v[1]) + v[2] * v[2])
+    with pytest.raises(AssertionError):
+        dot(si.SigFigArray.from_floats(np.ones((2, 2)), 2), v[:2])
+
+###############################################################
+# solves, with sigfigs reduced by the condition number
+#
+def test_solve():
+    a = si.SigFigArray.from_floats([[4., 1.], [2., 3.]], [4, 5])
+    b = si.SigFigArray.from_floats([1.2, 3.4], 3)
+    x = solve(a, b)
+    assert(np.allclose(x.value, np.linalg.solve(a.value, b.value), rtol = 1e-2))
+    assert(np.all(x.sigfigs == 3))
+    assert(np.all(inv(a).sigfigs == 4))
+
+    #cond ~ 4e4 takes four sigfigs
+    a = si.SigFigArray.from_floats([[1., 1.], [1., 1.0001]], 6)
+    assert(np.all(solve(a, np.array([2., 2.0001])).sigfigs == 2))
+    assert(np.all(inv(si.SigFigArray.from_floats([[1., 1.], [1., 1.0001]], 5)).sigfigs == 1))
+
+def test_singular():
+    a = si.SigFigArray.from_floats([[1., 2.], [2., 4.]], 3)
+    with pytest.raises(np.linalg.LinAlgError):
+        solve(a, np.ones(2))
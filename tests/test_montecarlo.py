@@ -0,0 +1,83 @@
+# test_montecarlo.py
+#
+# Provides interface with Pytest for testing the Monte Carlo
+# uncertainty propagation engine
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+###############################################################
+# the supported sigfigs of a sample standard deviation
+#
+@pytest.mark.parametrize("n, s", [
+    (10**3, 1),
+    (10**4, 2),
+    (10**6, 3),
+    (2, 1)
+    ])
+def test_unc_sigfigs_from_samples(n, s):
+    assert(si.unc_sigfigs_from_samples(n) == s)
+
+###############################################################
+# linear functions should reproduce first-order propagation
+#
+@pytest.mark.parametrize("func, a, b, v, u", [
+    (np.add,      "1.000(3)", "2.000(4)", 3.000, 0.005),
+    (np.subtract, "1.000(3)", "2.000(4)", -1.000, 0.005),
+    (np.add,      "1.000(3)", "2.000",    3.000, 0.003)
+    ])
+def test_linear(func, a, b, v, u):
+    x = si.monte_carlo(func, si.SciData.from_str(a), si.SciData.from_str(b),
+                       samples = 10**5, chunk_size = 10**4, seed = 1)
+    assert(not x.is_exact)
+    assert(x.value.contains(v))
+    assert(x.unc.contains(u))
+
+###############################################################
+# correlations should be honored
+#
+@pytest.mark.parametrize("r, u", [
+    ( 0.5, 0.0061),
+    (-0.5, 0.0036),
+    ( 0.0, 0.0050)
+    ])
+def test_correlated(r, u):
+    a = si.SciData.from_str("1.000(3)")
+    b = si.SciData.from_str("2.000(4)")
+    corr = [[1., r], [r, 1.]]
+    x = si.monte_carlo(np.add, a, b, corr = corr, samples = 10**5, seed = 2, unc_sigfigs = 2)
+    assert(abs(x.unc.value - u) < 2e-4)
+
+###############################################################
+# results should only depend on the seed, not the chunking
+# over processes
+#
+def test_reproducible():
+    a = si.SciData.from_str("1.23(4)")
+    b = si.SciData.from_str("4.56(7)")
+    x = si.monte_carlo(np.multiply, a, b, samples = 4 * 10**4, chunk_size = 10**4, seed = 3)
+    y = si.monte_carlo(np.multiply, a, b, samples = 4 * 10**4, chunk_size = 10**4, seed = 3, workers = 2)
+    assert(x == y)
+    assert(x.value.value == y.value.value and x.unc.value == y.unc.value)
+
+###############################################################
+# nothing to sample gives an exact result
+#
+def test_exact():
+    x = si.monte_carlo(np.multiply, si.SciData.from_str("2"), 3.)
+    assert(x.is_exact)
+    assert(x.as_exact() == 6.)
+
+###############################################################
+# bad correlation matrices
+#
+@pytest.mark.parametrize("corr", [
+    [[1., 2.], [2., 1.]],
+    [[1., 0.5], [0.4, 1.]],
+    [[1.]]
+    ])
+def test_bad_corr(corr):
+    with pytest.raises(Exception) as e:
+        si.monte_carlo(np.add, si.SciData.from_str("1.0(1)"), si.SciData.from_str("1.0(1)"), corr = corr)
@@ -0,0 +1,82 @@
+# test_ordering.py
+#
+# Provides interface with Pytest for testing the sorting, searching and
+# selection of SigFigArray and SciDataArray, against the scalar operators
+
+import pytest
+import bisect
+import numpy as np
+
+import standard_scientific as si
+
+def _sigfigs(n = 500, seed = 0):
+    rng = np.random.default_rng(seed)
+    #few distinct values, so that there are many ties (some with different sigfigs)
+    return si.SigFigArray.from_floats(rng.integers(-5, 6, n) * 0.5, rng.integers(2, 5, n))
+
+def _scidata(n = 200):
+    rng = np.random.default_rng(1)
+    return si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(rng.integers(1, 8, n) * 1.25, 4),
+                                             si.SigFigArray.from_floats(rng.uniform(0.01, 0.1, n), 2))
+
+###############################################################
+# the sorts are those of sorted() of the scalars, ties included
+#
+@pytest.mark.parametrize("x", [_sigfigs(), _scidata()])
+@pytest.mark.parametrize("descending", [False, True])
+def test_argsort(x, descending):
+    scalars = list(x)
+    expected = sorted(range(len(x)), key = lambda i: scalars[i], reverse = descending)
+    assert(si.argsort(x, descending).tolist() == expected)
+    s = si.sort(x, descending)
+    assert(s.shape == x.shape)
+
+def test_missing():
+    x = _sigfigs(20)
+    x[3] = None
+    x[0] = None
+    order = si.argsort(x).tolist()
+    assert(order[-2:] == [0, 3])
+    assert(si.argsort(x, descending = True).tolist()[-2:] == [0, 3])
+    assert(not si.between(x, -10., 10.)[0])
+
+###############################################################
+# searchsorted is bisect
+#
+@pytest.mark.parametrize("side", ["left", "right"])
+def test_searchsorted(side):
+    x = si.sort(_sigfigs())
+    scalars = list(x)
+    f = bisect.bisect_left if side == "left" else bisect.bisect_right
+    probes = [si.SigFig.from_float(v, 2) for v in [-3.0, -0.5, 0.0, 1.2, 2.5, 9.]]
+    assert(si.searchsorted(x, probes, side).tolist() == [f(scalars, p) for p in probes])
+    assert(si.searchsorted(x, 1.0, side) == f(scalars, si.SigFig.from_float(1.0, 3)))
+
+###############################################################
+# top_k is sorted()[:k]
+#
+@pytest.mark.parametrize("k", [0, 1, 7, 50, 500, 600])
+@pytest.mark.parametrize("largest", [True, False])
+def test_top_k(k, largest):
+    x = _sigfigs()
+    x[10] = None
+    scalars = list(x)
+    valid = [i for i in range(len(x)) if scalars[i] is not None]
+    expected = sorted(valid, key = lambda i: scalars[i], reverse = largest)
+    expected = (expected + [10])[:k]
+    values, idx = si.top_k(x, k, largest = largest, return_indices = True)
+    assert(idx.tolist() == expected)
+    assert(len(values) == len(expected))
+
+###############################################################
+# range filters, by value
+#
+@pytest.mark.parametrize("inclusive", ["both", "left", "right", "neither"])
+def test_between(inclusive):
+    x = _scidata()
+    low, high = si.SciData.from_str("2.50(1)"), 5.
+    v = x.value.value
+    lo = v >= 2.5 if inclusive in ("both", "left") else v > 2.5
+    hi = v <= 5. if inclusive in ("both", "right") else v < 5.
+    assert(np.array_equal(si.between(x, low, high, inclusive), lo & hi))
+    assert(np.array_equal(si.between(x, high = high), v <= 5.))
@@ -0,0 +1,140 @@
+# test_pandas_ext.py
+#
+# Provides interface with Pytest for testing the pandas extension dtypes,
+# and the reductions they use
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific.reductions import reduce_sigfigs
+from standard_scientific.reductions import reduce_scidata
+
+pd = pytest.importorskip("pandas")
+import standard_scientific.pandas_ext
+
+def _sigfigs():
+    return [si.SigFig.from_float(x, n) for x, n in [(1.23, 3), (4.6, 2), (0.120, 3), (12., 2)]]
+
+def _scidata():
+    return [si.SciData.from_str(x) for x in ["1.23(4)", "4.6(2)", "0.131(4)", "2.3(3)e1"]]
+
+###############################################################
+# construction, dtype, and missing values
+#
+@pytest.mark.parametrize("x, dtype", [
+    (_sigfigs(), "sigfig"),
+    (_scidata(), "scidata"),
+    ])
+def test_construct(x, dtype):
+    s = pd.Series(x + [None], dtype = dtype)
+    assert(str(s.dtype) == dtype)
+    assert(s.isna().tolist() == [False] * len(x) + [True])
+    assert(all(a == b for a, b in zip(s.iloc[:-1], x)))
+    assert(s.nbytes > 0)
+    assert(s.dropna().shape == (len(x),))
+
+###############################################################
+# arithmetic is identical to the scalar operators, and missing
+# rows stay missing
+#
+def test_sigfig_arithmetic():
+    x = _sigfigs()
+    s = pd.Series(x + [None], dtype = "sigfig")
+    y = s[::-1].reset_index(drop = True)
+    for op in [lambda a, b: a + b, lambda a, b: a - b, lambda a, b: a * b, lambda a, b: a / b]:
+        r = op(s, y)
+        assert(r.dtype == s.dtype)
+        assert(r.isna().tolist() == [True] + [False] * (len(x) - 1) + [True])
+        for i in range(1, len(x)):
+            assert(r[i] == op(x[i], x[len(x) - i]))
+    assert(((s * 2.)[0]) == x[0] * 2.)
+    assert((-s)[1] == si.SigFig.from_float(-4.6, 2))
+
+def test_scidata_arithmetic():
+    x = _scidata()
+    s = pd.Series(x + [None], dtype = "scidata")
+    r = s * s
+    assert(r.isna().tolist() == [False] * len(x) + [True])
+    for i in range(len(x)):
+        assert(r[i] == x[i] * x[i])
+    assert((s / 3)[1] == x[1] / 3)
+
+###############################################################
+# comparisons, sorting, factorizing
+#
+def test_compare_sort():
+    x = _sigfigs()
+    s = pd.Series(x + [None], dtype = "sigfig")
+    assert((s == x[0]).tolist() == [True, False, False, False, False])
+    assert((s == 1.23).tolist() == [False] * 5)
+    assert((s < 2.).tolist() == [True, False, True, False, False])
+    assert(s.sort_values().index.tolist() == [2, 0, 1, 3, 4])
+    assert(s.equals(s.copy()))
+
+    t = pd.Series(x + [x[0], None], dtype = "sigfig")
+    assert(len(t.unique()) == 5)
+    assert(t.value_counts().iloc[0] == 2)
+
+###############################################################
+# take and concat
+#
+@pytest.mark.parametrize("x, dtype", [
+    (_sigfigs(), "sigfig"),
+    (_scidata(), "scidata"),
+    ])
+def test_take_concat(x, dtype):
+    a = pd.array(x, dtype = dtype)
+    t = a.take([1, -1, 0], allow_fill = True)
+    assert(t.isna().tolist() == [False, True, False])
+    assert(t[0] == x[1] and t[2] == x[0])
+    c = pd.concat([pd.Series(a), pd.Series(a)], ignore_index = True)
+    assert(c.dtype == a.dtype and len(c) == 2 * len(x))
+    assert(c[len(x)] == x[0])
+
+###############################################################
+# reductions round once, to the limiting place
+#
+def test_sigfig_reductions():
+    x = _sigfigs()
+    s = pd.Series(x + [None], dtype = "sigfig")
+    assert(s.sum() == si.SigFig.from_float(18., 2))
+    assert(s.min() == x[2] and s.max() == x[3])
+    assert(s.prod() == si.SigFig.from_float(1.23 * 4.6 * 0.12 * 12., 2))
+    assert(s.mean() == si.SigFig.from_float(4.5, 2))
+    assert(np.isnan(s.sum(skipna = False)))
+
+def test_scidata_reductions():
+    x = _scidata()
+    s = pd.Series(x, dtype = "scidata")
+    total = s.sum()
+    assert(total.unc.as_exact() == pytest.approx(np.sqrt(0.04**2 + 0.2**2 + 0.004**2 + 3.**2), rel = 0.05))
+    assert(total.value.as_exact() == pytest.approx(29., abs = 0.5))
+    assert(s.max() == x[3] and s.min() == x[2])
+
+###############################################################
+# groupby matches the reduction of every group
+#
+@pytest.mark.parametrize("how", ["sum", "mean", "min", "max"])
+def test_groupby(how):
+    x = _sigfigs()
+    df = pd.DataFrame({"g": [1, 2, 1, 2, 1], "x": pd.Series(x + [None], dtype = "sigfig")})
+    r = getattr(df.groupby("g")["x"], how)()
+    assert(r.dtype == df["x"].dtype)
+    for g in (1, 2):
+        assert(r[g] == getattr(df["x"][df["g"] == g], how)())
+
+###############################################################
+# reductions over groups directly, with empty groups missing
+#
+def test_reduce_groups():
+    a = si.SigFigArray.from_floats([1.0, 2.0, 3.0, 4.0], [2, 2, 2, 2])
+    r = reduce_sigfigs(a, "sum", np.array([0, 2, 0, 2]), 3)
+    assert(r[0] == si.SigFig.from_float(4.0, 2))
+    assert(r[1] is None)
+    assert(r[2] == si.SigFig.from_float(6.0, 2))
+
+    d = si.SciDataArray.from_SciData(_scidata())
+    r = reduce_scidata(d, "max", np.array([1, 1, -1, 0]), 3)
+    assert(r[0] == _scidata()[3] and r[1] == _scidata()[1])
+    assert(r.value.is_missing()[2])
@@ -0,0 +1,98 @@
+# test_parallel.py
+#
+# Provides interface with Pytest for testing the thread pool Executor, whose
+# results and warnings must be exactly those of the same operations on the
+# whole array
+
+import pytest
+import warnings
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific.reductions import reduce_sigfigs, reduce_scidata
+from standard_scientific.shared import array_columns
+
+def _sigfigs(n = 1000):
+    rng = np.random.default_rng(0)
+    return si.SigFigArray.from_floats(rng.uniform(-10., 10., n) * 10.**rng.integers(-3, 3, n), rng.integers(1, 7, n))
+
+def _scidata(n = 1000):
+    rng = np.random.default_rng(1)
+    x = si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(rng.uniform(1., 10., n), 6),
+                                          si.SigFigArray.from_floats(rng.uniform(0.01, 0.1, n), 2))
+    x.is_exact[3] = True
+    return x
+
+def _same(a, b):
+    (ka, ca), (kb, cb) = array_columns(a), array_columns(b)
+    return ka == kb and all(np.array_equal(u, v, equal_nan = True) for u, v in zip(ca, cb))
+
+def _recorded(func, *args):
+    with warnings.catch_warnings(record = True) as w:
+        warnings.simplefilter("always")
+        r = func(*args)
+        getattr(r, "rel_unc", None)     #computed when first used
+    return r, [str(m.message) for m in w]
+
+###############################################################
+# elementwise operations, for any number of workers and chunk size
+#
+@pytest.mark.parametrize("x", [_sigfigs(), _scidata()])
+@pytest.mark.parametrize("workers, chunk_size", [(1, 100), (3, 7), (4, 1000), (2, 4096)])
+def test_map(x, workers, chunk_size):
+    ex = si.Executor(workers = workers, chunk_size = chunk_size)
+    expected, w = _recorded(lambda: x * x + 2.5)
+    y, wy = _recorded(ex.map, lambda a: a * a + 2.5, x)
+    assert(_same(y, expected) and wy == w)
+    expected, w = _recorded(lambda: x / x[::-1])
+    y, wy = _recorded(ex.map, lambda a, b: a / b, x, x[::-1])
+    assert(_same(y, expected) and wy == w)
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 100), (3, 7), (4, 1000)])
+def test_from_floats(workers, chunk_size):
+    rng = np.random.default_rng(2)
+    v, sf = rng.uniform(-1e3, 1e3, 1000), rng.integers(1, 8, 1000)
+    ex = si.Executor(workers = workers, chunk_size = chunk_size)
+    expected, w = _recorded(si.SigFigArray.from_floats, v, sf)
+    x, wx = _recorded(ex.from_floats, v, sf)
+    assert(_same(x, expected))
+    assert(wx == w)
+    d = sf - 1 - si.sigfig_array.exponents_from_floats(v)
+    r, mask = ex.map(lambda a, b: si.sigfig_array.w_round_array(a, b, mask = True), v, d)
+    assert(np.array_equal(r, expected.value) and mask.shape == v.shape)
+
+###############################################################
+# the warnings are merged into those of the whole array
+#
+@pytest.mark.parametrize("workers, chunk_size", [(1, 2), (2, 1), (3, 2), (4, 100)])
+def test_warnings(workers, chunk_size):
+    x = [0.5, 1.25, 2.5, 3.1, 4.5, 7.25]
+    d = [0, 1, 0, 0, 0, 1]
+    expected, w = _recorded(si.sigfig_array.w_round_array, x, d)
+    assert(len(w) == 1)
+    r, wr = _recorded(si.Executor(workers = workers, chunk_size = chunk_size).w_round, x, d)
+    assert(np.array_equal(r, expected))
+    assert(wr == w)
+
+def test_nested():
+    x = np.array([0.5, 1.25, 2.5, 3.1, 4.5, 7.25])
+    inner = si.Executor(workers = 2, chunk_size = 1)
+    _, w = _recorded(si.sigfig_array.w_round_array, x, 0)
+    _, wn = _recorded(si.Executor(workers = 2, chunk_size = 3).map, lambda a: inner.w_round(a, 0), x)
+    assert(wn == w)
+
+###############################################################
+# reductions of an elementwise function
+#
+@pytest.mark.parametrize("x, reduce, hows", [(_sigfigs(), reduce_sigfigs, ["sum", "mean", "min", "max"]),
+                                             (_scidata(), reduce_scidata, ["sum", "mean", "min", "max"])])
+@pytest.mark.parametrize("workers, chunk_size", [(1, 100), (3, 7)])
+def test_reduce(x, reduce, hows, workers, chunk_size):
+    ex = si.Executor(workers = workers, chunk_size = chunk_size)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for how in hows:
+            assert(str(ex.reduce(how, x)) == str(reduce(x, how)[0]))
+            r = ex.reduce(how, x, func = lambda a: a * 2.)
+            e = reduce(x * 2., how)
+            assert(str(r) == str(e[0]))
@@ -0,0 +1,131 @@
+# test_parse_cache.py
+#
+# Provides interface with Pytest for testing the persistent cache of parsed
+# chunks of files of strings in scientific notation
+
+import pytest
+import io
+import json
+import warnings
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific import parse_cache
+from standard_scientific.convert import convert, parse_chunk, ConvertStats
+from standard_scientific.parse_cache import ParseCache, content_chunks
+from standard_scientific.shared import array_columns
+
+def _lines(n = 2000, seed = 4):
+    rng = np.random.default_rng(seed)
+    return [f"{v:.4f}({u})" for v, u in zip(rng.uniform(1., 100., n), rng.integers(11, 99, n))]
+
+def _write(path, lines):
+    with open(path, "w") as f:
+        f.write("".join(s + "\n" for s in lines))
+
+def _same(a, b):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return all(np.array_equal(u, v, equal_nan = True) for u, v in zip(array_columns(a)[1], array_columns(b)[1]))
+
+###############################################################
+# chunks are split by content, so that an insertion only
+# changes the chunks around it
+#
+def test_content_chunks():
+    lines = _lines()
+    a = [[s for _, s in c] for c in content_chunks(io.StringIO("".join(s + "\n" for s in lines)), 64)]
+    assert(sum(a, []) == lines)
+    assert(all(len(c) <= 4 * 64 for c in a))
+    b = [[s for _, s in c] for c in content_chunks(io.StringIO("".join(s + "\n" for s in lines[:500] + ["1.0(1)"] + lines[500:])), 64)]
+    assert(len(set(map(tuple, a)) - set(map(tuple, b))) <= 2)
+
+###############################################################
+# re-ingestion only parses the chunks that changed, with the
+# results of parse_chunk
+#
+def test_reingest(tmp_path):
+    lines = _lines()
+    _write(tmp_path / "in.txt", lines)
+    stats = ConvertStats()
+    x = ParseCache(tmp_path / "cache").load(tmp_path / "in.txt", chunk_size = 64, stats = stats)
+    assert(stats.cache_hits == 0 and stats.rows == len(lines))
+    assert(_same(x, parse_chunk(list(enumerate(lines, 1)))[0]))
+
+    lines[100] = "1.000(1)"
+    lines.insert(1000, "2.00(3)e4")
+    _write(tmp_path / "in.txt", lines)
+    stats = ConvertStats()
+    cache = ParseCache(tmp_path / "cache")
+    y = cache.load(tmp_path / "in.txt", chunk_size = 64, stats = stats)
+    assert(0 < stats.cache_misses <= 4 and stats.cache_hits > 0)
+    assert(_same(y, parse_chunk(list(enumerate(lines, 1)))[0]))
+
+    out, expected = io.StringIO(), io.StringIO()
+    stats = convert(str(tmp_path / "in.txt"), out, chunk_size = 64, cache = cache)
+    convert(str(tmp_path / "in.txt"), expected)
+    assert(stats.cache_misses == 0 and out.getvalue() == expected.getvalue())
+
+###############################################################
+# warnings and skipped lines are cached along with the data
+#
+def test_counts(tmp_path):
+    lines = ["2.5(1)", "abc", "0.25(3)", "1.2(3)"]
+    _write(tmp_path / "in.txt", lines)
+    expected = convert(str(tmp_path / "in.txt"), io.StringIO(), skip = True)
+    for hits in (0, 1):
+        stats = convert(str(tmp_path / "in.txt"), io.StringIO(), skip = True, cache = tmp_path / "cache")
+        assert(stats.cache_hits == hits)
+        assert((stats.rows, stats.skipped, stats.precision_warnings) ==
+               (expected.rows, expected.skipped, expected.precision_warnings))
+    with pytest.raises(ValueError, match = "line 2"):
+        convert(str(tmp_path / "in.txt"), io.StringIO(), cache = tmp_path / "cache")
+
+###############################################################
+# limits, eviction and version stamping
+#
+def test_limits(tmp_path):
+    _write(tmp_path / "in.txt", _lines())
+    cache = ParseCache(tmp_path / "cache", max_entries = 3)
+    cache.load(tmp_path / "in.txt", chunk_size = 64)
+    assert(len(cache) == 3 and len(list((tmp_path / "cache").glob("*.bin"))) == 3)
+    cache = ParseCache(tmp_path / "cache", max_bytes = 0)
+    cache.load(tmp_path / "in.txt", chunk_size = 64)
+    assert(len(cache) == 0 and cache.nbytes == 0)
+
+def test_version(tmp_path):
+    _write(tmp_path / "in.txt", _lines())
+    cache = ParseCache(tmp_path / "cache")
+    cache.load(tmp_path / "in.txt", chunk_size = 64)
+    assert(len(ParseCache(tmp_path / "cache")) == len(cache) > 0)
+    with open(tmp_path / "cache" / "index.json") as f:
+        index = json.load(f)
+    index["version"] = "old"
+    with open(tmp_path / "cache" / "index.json", "w") as f:
+        json.dump(index, f)
+    assert(len(ParseCache(tmp_path / "cache")) == 0)
+    assert(len(list((tmp_path / "cache").glob("*.bin"))) == 0)
+    assert(parse_cache.parser_version() == ParseCache(tmp_path / "cache").version)
+
+###############################################################
+# entries removed or truncated by another cache on the same
+# directory are misses, and are parsed again
+#
+def test_shared_directory(tmp_path):
+    lines = _lines()
+    _write(tmp_path / "in.txt", lines)
+    cache = ParseCache(tmp_path / "cache")
+    cache.load(tmp_path / "in.txt", chunk_size = 64)
+    n = len(cache)
+    ParseCache(tmp_path / "cache", max_bytes = cache.nbytes // 2).evict()
+    key = next(k for k in cache._entries if (tmp_path / "cache" / f"{k}.bin").exists())
+    with open(tmp_path / "cache" / f"{key}.bin", "r+b") as f:
+        f.truncate(1)
+    gone = sum(not (tmp_path / "cache" / f"{k}.bin").exists() for k in cache._entries) + 1
+
+    stats = ConvertStats()
+    x = cache.load(tmp_path / "in.txt", chunk_size = 64, stats = stats)
+    assert(stats.cache_misses == gone > 1 and stats.cache_hits + stats.cache_misses == n)
+    assert(_same(x, parse_chunk(list(enumerate(lines, 1)))[0]))
+    cache.clear()
+    assert(len(list((tmp_path / "cache").glob("*.bin"))) == 0)
@@ -0,0 +1,78 @@
+# test_propagation.py
+#
+# Provides interface with Pytest for testing the first-order
+# propagation of uncertainty through SciData arithmetic and functions
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+a = si.SciData.from_str("1.234(6)")
+b = si.SciData.from_str("2.00(4)e1")
+c = si.SciData.from_str("299792458")
+
+###############################################################
+# arithmetic between SciData against hand-written propagation
+#
+@pytest.mark.parametrize("x, v, u", [
+    (a + b,      21.234,        np.hypot(0.006, 0.4)),
+    (a - b,     -18.766,        np.hypot(0.006, 0.4)),
+    (a * b,      24.68,         24.68 * np.hypot(0.006 / 1.234, 0.4 / 20.)),
+    (a / b,      0.0617,        0.0617 * np.hypot(0.006 / 1.234, 0.4 / 20.)),
+    (a ** 2,     1.234**2,      2 * 1.234 * 0.006),
+    (a * a,      1.234**2,      2 * 1.234 * 0.006),
+    (2 * a,      2.468,         0.012),
+    (a * c,      1.234 * 299792458, 0.006 * 299792458),
+    (si.exp(a),  np.exp(1.234), np.exp(1.234) * 0.006),
+    (si.log(a),  np.log(1.234), 0.006 / 1.234),
+    (si.sqrt(a), np.sqrt(1.234), 0.003 / np.sqrt(1.234)),
+    (si.sin(a),  np.sin(1.234), np.cos(1.234) * 0.006),
+    (-a,        -1.234,         0.006)
+    ])
+def test_arithmetic(x, v, u):
+    assert(not x.is_exact)
+    assert(x.value.contains(v))
+    assert(x.unc.contains(u))
+
+###############################################################
+# exact data behaves as a float
+#
+@pytest.mark.parametrize("x, v", [
+    (c * c,     299792458.**2),
+    (c / 3,     299792458. / 3),
+    (si.exp(si.SciData.from_str("1")), np.exp(1.)),
+    (a - a,     0.)
+    ])
+def test_exact(x, v):
+    assert(x.is_exact)
+    assert(x.as_exact() == v)
+
+###############################################################
+# the sigfigs of the result follow those of the uncertainty
+#
+@pytest.mark.parametrize("x, vs, us", [
+    (a + b, 3, 1),
+    (a * b, 3, 1),
+    (a * c, 3, 1)
+    ])
+def test_sigfigs(x, vs, us):
+    assert(x.value.sigfigs == vs)
+    assert(x.unc.sigfigs == us)
+
+###############################################################
+# arrays give the same results as the scalars
+#
+@pytest.mark.parametrize("f", [
+    lambda x, y: x + y,
+    lambda x, y: x * y,
+    lambda x, y: x / y - y,
+    lambda x, y: si.exp(x / 10) * y,
+    lambda x, y: si.sqrt(x * y)
+    ])
+def test_array(f):
+    x = [a, b, si.SciData.from_str("7.1(2)")]
+    y = si.SciData.from_str("3.000(7)")
+    r = f(si.SciDataArray.from_SciData(x), y)
+    assert(isinstance(r, si.SciDataArray))
+    assert(all(p == f(q, y) for p, q in zip(r, x)))
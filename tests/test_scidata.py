@@ -133,3 +133,44 @@ def test_from_str_bad(s):
 def test_from_str_good(s, c):
     assert(si.SciData.from_str(s) == c)
 
+
+###############################################################
+# compact pickling round trips every field
+#
+@pytest.mark.parametrize("s", [
+    "1.2(345)e1",
+    "299792458",
+    ])
+def test_pickle(s):
+    import pickle
+    x = si.SciData.from_str(s)
+    b = pickle.dumps(x)
+    assert(pickle.loads(b) == x)
+    assert(b"is_exact" not in b)
+
+###############################################################
+# the relative uncertainty is computed when first used, with
+# the same result, and given ones are kept
+#
+@pytest.mark.parametrize("s", [
+    "1.2345(67)",
+    "1.2(345)e1",
+    "-0.0012345(67)",
+    ])
+def test_lazy_rel_unc(s):
+    import pickle
+    x = si.SciData.from_str(s)
+    assert(x._rel_unc is None)
+    y = pickle.loads(pickle.dumps(x))
+    assert(y._rel_unc is None)
+    assert(x.rel_unc == x.unc / abs(x.value))
+    assert(x._rel_unc is x.rel_unc)
+    assert(y == x)
+    r = si.SigFig.from_float(0.5, 1)
+    z = si.SciData.from_SigFigs(x.value, x.unc, r, False)
+    assert(z.rel_unc is r)
+
+def test_lazy_rel_unc_none():
+    zero = si.SciData.from_SigFigs(si.SigFig(0., 2, 0), si.SigFig.from_float(0.12, 2), None, False)
+    assert(zero.rel_unc is None)
+    assert(si.SciData.from_str("299792458").rel_unc is None)
@@ -0,0 +1,113 @@
+# test_scidata_array.py
+#
+# Provides interface with Pytest for testing the SciDataArray class
+
+import pytest
+import warnings
+import numpy as np
+
+import standard_scientific as si
+
+###############################################################
+# round trip through SciDataArray
+#
+@pytest.mark.parametrize("s", [
+    ["1.2(345)", "299792458", "-0012.345(67)e-4"],
+    ["+12.3"]
+    ])
+def test_round_trip(s):
+    x = [si.SciData.from_str(v) for v in s]
+    a = si.SciDataArray.from_SciData(x)
+    assert(len(a) == len(x))
+    assert(all(u == v for u, v in zip(a.to_SciData(), x)))
+    assert(list(a.is_exact) == [v.is_exact for v in x])
+
+###############################################################
+# from_SigFigArrays generates the relative uncertainty as
+# from_SigFigs does
+#
+def test_from_SigFigArrays():
+    v = si.SigFigArray.from_floats([12.345, 1.2, 5.], [5, 2, 1])
+    u = si.SigFigArray.from_floats([0.067, 34.5, 1.], [2, 3, 1])
+    a = si.SciDataArray.from_SigFigArrays(v, u, None, [False, False, True])
+    for i in range(2):
+        assert(a[i] == si.SciData.from_SigFigs(v[i], u[i], None, False))
+    assert(a[2].is_exact and a[2].unc is None)
+
+###############################################################
+# inexact elements require an uncertainty
+#
+def test_from_SigFigArrays_bad():
+    v = si.SigFigArray.from_floats([12.345], [5])
+    with pytest.raises(Exception) as e:
+        si.SciDataArray.from_SigFigArrays(v, si.SigFigArray.missing(1), None, False)
+
+###############################################################
+# the column of relative uncertainties is computed when first
+# used, as SciData computes them
+#
+def test_lazy_rel_unc():
+    v = si.SigFigArray.from_floats([12.345, 1.2, 5., 0.], [5, 2, 1, 2])
+    u = si.SigFigArray.from_floats([0.067, 34.5, 1., 0.12], [2, 3, 1, 2])
+    a = si.SciDataArray.from_SigFigArrays(v, u, None, [False, False, True, False])
+    assert(a._rel_unc is None and a[1:]._rel_unc is None)
+    assert(a[1].rel_unc == si.SciData.from_SigFigs(v[1], u[1], None, False).rel_unc)
+    assert(a._rel_unc is None)
+    r = a.rel_unc
+    assert(a._rel_unc is r)
+    assert(r[0] == u[0] / abs(v[0]) and r[1] == u[1] / abs(v[1]))
+    assert(r.is_missing()[2] and r.is_missing()[3])
+    b = si.SciDataArray.from_SigFigArrays(v, u, r, [False, False, True, False])
+    assert(b._rel_unc is not None and b[0].rel_unc == r[0])
+    c = si.SciDataArray.from_SciData(a.to_SciData())
+    assert(c._rel_unc is not None)
+    assert(si.SciDataArray.from_SciData([si.SciData.from_str("1.2(3)")])._rel_unc is None)
+
+###############################################################
+# the lazy column is the one from_SigFigArrays used to compute
+# eagerly, with zero values and exact elements mixed in
+#
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_lazy_rel_unc_eager(seed):
+    rng = np.random.default_rng(seed)
+    n = 500
+    values = rng.uniform(-1e3, 1e3, n) * 10.**rng.integers(-5, 5, n)
+    values[rng.random(n) < 0.2] = 0.
+    v = si.SigFigArray.from_floats(values, rng.integers(1, 6, n))
+    u = si.SigFigArray.from_floats(rng.uniform(0.01, 10., n), rng.integers(1, 3, n))
+    exact = rng.random(n) < 0.3
+    a = si.SciDataArray.from_SigFigArrays(v, u, None, exact)
+
+    expected = si.SigFigArray.missing(n)
+    sel = ~exact & (v.value != 0.)
+    with warnings.catch_warnings():
+        #some of the relative uncertainties are half-way roundings
+        warnings.simplefilter("ignore")
+        expected[sel] = si.SigFigArray.from_floats(u.value[sel] / np.abs(v.value[sel]), np.minimum(u.sigfigs[sel], v.sigfigs[sel]))
+        assert(a._rel_unc is None)
+        assert(np.array_equal(a.rel_unc.value, expected.value, equal_nan = True))
+    assert(np.array_equal(a.rel_unc.sigfigs, expected.sigfigs))
+    assert(np.array_equal(a.rel_unc.exponent, expected.exponent))
+
+###############################################################
+# the bulk consumers of SciDataArray keep the relative
+# uncertainties lazy, and give those of the eager array
+#
+def test_lazy_consumers(tmp_path):
+    v = si.SigFigArray.from_floats(np.tile([12.345, 1.2, 5., 0., 3.3], 20), [5, 2, 1, 2, 2] * 20)
+    u = si.SigFigArray.from_floats(np.tile([0.067, 34.5, 1., 0.12, 0.4], 20), [2, 3, 1, 2, 1] * 20)
+    def lazy():
+        return si.SciDataArray.from_SigFigArrays(v, u, None, [False, False, True, False, False] * 20)
+    expected = lazy().rel_unc
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with si.publish(lazy()) as block:
+            results = [si.EncodedArray.encode(lazy()).decode(), si.CompactArray.compact(lazy()).expand(),
+                       si.ChunkedArray.write(tmp_path / "x", [lazy()[:50], lazy()[50:]]).compute(),
+                       si.Executor(workers = 2, chunk_size = 30).map(lambda a: a, lazy()), block.array[np.arange(100)]]
+        for r in results:
+            assert(r._rel_unc is None)
+            assert(np.array_equal(r.rel_unc.value, expected.value, equal_nan = True))
+            assert(np.array_equal(r.rel_unc.sigfigs, expected.sigfigs))
+        for how in ("min", "max", "sum"):
+            assert(si.reduce_scidata(lazy(), how, np.arange(100) % 3, 4)._rel_unc is None)
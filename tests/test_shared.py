@@ -0,0 +1,55 @@
+# test_shared.py
+#
+# Provides interface with Pytest for testing the publishing of arrays in
+# shared memory
+
+import pytest
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import standard_scientific as si
+
+def _arrays():
+    x = si.SigFigArray.from_floats([1.23, -4.5e-7, 6.], [3, 2, 1])
+    x[2] = None
+    d = si.SciDataArray.from_SciData([si.SciData.from_str(s) for s in ["1.2(345)", "299792458", "-0012.345(67)e-4"]])
+    return [x, d, si.SigFigArray.missing(0)]
+
+def _strings(x):
+    return [str(v) for v in x]
+
+def _attached_strings(handle):
+    with si.attach(handle) as block:
+        return _strings(block.array)
+
+###############################################################
+# publish and attach within one process
+#
+@pytest.mark.parametrize("x", _arrays())
+def test_publish_attach(x):
+    with si.publish(x) as block:
+        assert(block.handle.length == len(x))
+        assert(_strings(block.array) == _strings(x))
+        with si.attach(block.handle) as other:
+            assert(_strings(other.array) == _strings(x))
+
+###############################################################
+# the handle is all a worker needs
+#
+def test_worker():
+    x = _arrays()[1]
+    with si.publish(x) as block:
+        assert(len(pickle.dumps(block.handle)) < 200)
+        with ProcessPoolExecutor(1) as pool:
+            assert(pool.submit(_attached_strings, block.handle).result() == _strings(x))
+
+###############################################################
+# the memory cannot be released while its arrays are in use
+#
+def test_close_in_use():
+    block = si.publish(_arrays()[0])
+    a = block.array
+    with pytest.raises(BufferError):
+        block.close()
+    del a
+    block.close()
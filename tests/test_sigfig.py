@@ -349,3 +349,16 @@ def test_contains_onesided(x, y):
     ])
 def test_not_contains(x, y):
     assert(not x.contains(y) and not y.contains(x))
+
+################################################################
+# Test compact pickling
+@pytest.mark.parametrize("x", [
+    si.SigFig.from_float(10., 2),
+    si.SigFig.from_float(-1.2345e-20, 3)
+    ])
+def test_pickle(x):
+    import pickle
+    b = pickle.dumps(x)
+    y = pickle.loads(b)
+    assert(y == x and y.exponent == x.exponent)
+    assert(b"__dict__" not in b and b"sigfigs" not in b)
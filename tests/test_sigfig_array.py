@@ -0,0 +1,78 @@
+# test_sigfig_array.py
+#
+# Provides interface with Pytest for testing the SigFigArray class
+# and the vectorized rounding routines, which must agree EXACTLY with
+# their scalar counterparts
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+
+###############################################################
+# exponents agree with exponent_from_float, including powers of
+# ten that are stored below their true value
+#
+@pytest.mark.parametrize("x", [
+    [3.14, 10, 1e6, 578, 1e-3, -10e-3, 0.0015],
+    [1e22, 1e23, 1e-5, 9.999999999999999e22, 5e-324, 1.7976931348623157e308],
+    [0., -0.]
+    ])
+def test_exponents_from_floats(x):
+    assert(list(si.exponents_from_floats(x)) == [si.exponent_from_float(v) for v in x])
+
+###############################################################
+# round_array is identical to round, including near half-way
+# points and places where the powers of ten are inexact
+#
+@pytest.mark.parametrize("x, d", [
+    ([10.234, 10.234, 10.234, 10.234, 10.234, 10.234], [3, 2, 1, 0, -1, -2]),
+    ([0.5, 1.5, 2.5, -0.5, 0.125, 0.375], [0, 0, 0, 0, 2, 2]),
+    ([0.025, 0.035, 0.045, 1.005, 2.675], [2, 2, 2, 2, 2]),
+    ([4.3597447222060e-18, 6.62607015e-34, 1.23e30], [31, 41, -28])
+    ])
+def test_round_array(x, d):
+    r = si.round_array(x, d)
+    assert(all(a == round(v, k) for a, v, k in zip(r, x, d)))
+
+###############################################################
+# from_floats matches from_float element by element
+#
+@pytest.mark.parametrize("x, s", [
+    ([3.14, 1.23456e10, -12.34e-2], [2, 6, 5]),
+    ([210.123, 210.12, 210.1, 210, 2.1e2, 2e2], [6, 5, 4, 3, 2, 1])
+    ])
+def test_from_floats(x, s):
+    a = si.SigFigArray.from_floats(x, s)
+    for i, (v, k) in enumerate(zip(x, s)):
+        b = si.SigFig.from_float(v, k)
+        assert(a[i].value == b.value and a[i].sigfigs == b.sigfigs and a[i].exponent == b.exponent)
+
+###############################################################
+# a single warning reports every sensitive rounding
+#
+def test_w_round_array_warning():
+    with pytest.warns(UserWarning, match = "2 of 3") as w:
+        r, m = si.w_round_array([10.5, -10.5, 10.4], 0, mask = True)
+    assert(list(m) == [True, True, False])
+
+###############################################################
+# bad construction
+#
+@pytest.mark.parametrize("x, s", [
+    ([1.234], [0]),
+    ([np.nan], [1]),
+    ([np.inf], [2])
+    ])
+def test_bad_construction(x, s):
+    with pytest.raises(Exception) as e:
+        si.SigFigArray.from_floats(x, s)
+
+###############################################################
+# missing elements become None
+#
+def test_from_SigFigs():
+    a = si.SigFigArray.from_SigFigs([si.SigFig.from_float(1.5, 2), None])
+    assert(a[0] == si.SigFig.from_float(1.5, 2))
+    assert(a[1] is None)
+    assert(list(a.is_missing()) == [False, True])
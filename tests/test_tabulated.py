@@ -0,0 +1,93 @@
+# test_tabulated.py
+#
+# Provides interface with Pytest for testing lookup and interpolation of
+# tabulated SciData
+
+import bisect
+import warnings
+import pytest
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific.tabulated import _linear, _cubic
+
+X = ["300.00(5)", "250.00(5)", "350.00(5)", "400.00(5)", "450.00(5)", "500"]
+Y = ["1.2345(12)", "1.1000(12)", "1.3456(12)", "1.4000(20)", "1.4500(20)", "1.48(3)"]
+
+def _table():
+    return si.Table.from_SciData([si.SciData.from_str(s) for s in X], [si.SciData.from_str(s) for s in Y])
+
+def _queries(n = 200, seed = 5):
+    rng = np.random.default_rng(seed)
+    return si.SciDataArray.from_SigFigArrays(si.SigFigArray.from_floats(rng.uniform(250., 500., n), 5),
+                                             si.SigFigArray.from_floats(rng.uniform(0.1, 0.9, n), 1))
+
+###############################################################
+# the entries are sorted, and the brackets are those of a
+# linear scan
+#
+def test_bracket():
+    t = _table()
+    xs = sorted(float(s.split("(")[0]) for s in X)
+    assert(list(t.order) == [1, 0, 2, 3, 4, 5])
+    assert(list(t.x.value.value) == xs)
+    q = np.random.default_rng(0).uniform(250., 500., 1000)
+    expected = [min(bisect.bisect_right(xs, v) - 1, len(xs) - 2) for v in q]
+    assert(list(t.bracket(q)) == expected)
+    assert(list(t.bracket([250., 300., 500.])) == [0, 1, 4])
+
+###############################################################
+# every interpolated element is the scalar propagation through
+# its neighbouring entries
+#
+@pytest.mark.parametrize("kind", ["linear", "cubic"])
+def test_interpolate(kind):
+    t = _table()
+    q = _queries()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        r = t.interpolate(q, kind)
+        for k in range(0, len(q), 7):
+            i = t.bracket(q[k])[0]
+            if kind == "linear":
+                idx, func = [i, i + 1], _linear
+            else:
+                j = min(max(i - 1, 0), len(t) - 4)
+                idx, func = [j, j + 1, j + 2, j + 3], _cubic
+            expected = si.propagate(func, q[k], *[t.x[j] for j in idx], *[t.y[j] for j in idx], covariance = False)
+            assert(r[k] == expected)
+            assert(r[k].unc == expected.unc)
+            assert(t.interpolate(q[k], kind) == expected)
+
+###############################################################
+# exact tables at exact points are exact, and cubic interpolation
+# reproduces a cubic polynomial
+#
+def test_exact():
+    x = np.linspace(0., 5., 6)
+    p = lambda v: 1. + 0.5 * v - 0.25 * v**2 + 0.125 * v**3
+    t = si.Table.from_SciData([si.SciData.exact_from_float(v) for v in x[::-1]],
+                              [si.SciData.exact_from_float(p(v)) for v in x[::-1]])
+    q = np.linspace(0., 5., 41)
+    r = t.interpolate(q, "cubic")
+    assert(np.all(r.is_exact))
+    assert(np.allclose(r.value.value, p(q), rtol = 1e-12))
+    r = t.interpolate(2.5)
+    assert(r.is_exact and r.value.value == pytest.approx((p(2.) + p(3.)) / 2.))
+
+###############################################################
+# invalid tables and queries
+#
+def test_bad():
+    t = _table()
+    with pytest.raises(AssertionError, match = "outside"):
+        t.interpolate([240., 300.])
+    r = t.interpolate(550., extrapolate = True)
+    assert(r == si.propagate(_linear, 550., t.x[4], t.x[5], t.y[4], t.y[5], covariance = False))
+    with pytest.raises(AssertionError, match = "kind"):
+        t.interpolate(300., "quadratic")
+    with pytest.raises(AssertionError, match = "distinct"):
+        si.Table.from_SciData([si.SciData.from_str("1.0(1)")] * 2, [si.SciData.from_str("2.0(1)")] * 2)
+    with pytest.raises(AssertionError, match = "at least 4"):
+        si.Table.from_SciData([si.SciData.from_str(s) for s in X[:3]],
+                              [si.SciData.from_str(s) for s in Y[:3]]).interpolate(300., "cubic")
@@ -0,0 +1,108 @@
+# test_units.py
+#
+# Provides interface with Pytest for testing the units of SciData and
+# SciDataArray, and their conversions
+
+import pytest
+import numpy as np
+
+import standard_scientific as si
+from standard_scientific import units
+from standard_scientific.shared import array_columns
+
+def _same(a, b):
+    (ka, ca), (kb, cb) = array_columns(a), array_columns(b)
+    return ka == kb and all(np.array_equal(u, v, equal_nan = True) for u, v in zip(ca, cb))
+
+###############################################################
+# parsing into dimensions and factors
+#
+@pytest.mark.parametrize("s, dims, factor", [
+    ("m", (1, 0, 0, 0, 0, 0, 0), 1.),
+    ("m/s^2", (1, 0, -2, 0, 0, 0, 0), 1.),
+    ("m s-2", (1, 0, -2, 0, 0, 0, 0), 1.),
+    ("m*s**-2", (1, 0, -2, 0, 0, 0, 0), 1.),
+    ("kJ/(mol K)", (2, 1, -2, 0, -1, -1, 0), 1000.),
+    ("J/mol K", (2, 1, -2, 0, -1, -1, 0), 1.),
+    ("g cm-3", (-3, 1, 0, 0, 0, 0, 0), 1000.),
+    ("µm", (1, 0, 0, 0, 0, 0, 0), 1e-6),
+    ("km/h", (1, 0, -1, 0, 0, 0, 0), 1000. / 3600.),
+    ("min", (0, 0, 1, 0, 0, 0, 0), 60.),
+    ("hPa", (-1, 1, -2, 0, 0, 0, 0), 100.),
+    ("MeV", (2, 1, -2, 0, 0, 0, 0), 1.602176634e-19 * 1e6),
+    ("1/s", (0, 0, -1, 0, 0, 0, 0), 1.),
+])
+def test_unit(s, dims, factor):
+    u = si.unit(s)
+    assert(u.dims == dims)
+    assert(u.factor.is_exact and u.factor.value.value == pytest.approx(factor, rel = 1e-15))
+    assert(si.unit(s) is u)
+
+def test_unknown():
+    with pytest.raises(ValueError):
+        si.unit("furlong")
+
+def test_inexact_factor():
+    u = si.unit("Eh")
+    assert(not u.factor.is_exact)
+    assert(u.factor is si.constants["Hartree energy"])
+
+###############################################################
+# conversions are single multiplies by the cached factor
+#
+def test_conversion_cache():
+    units.conversion.cache_clear()
+    f = units.conversion("km/h", "m/s")
+    assert(units.conversion("km/h", "m/s") is f)
+    assert(units.conversion.cache_info().hits == 1)
+    with pytest.raises(si.DimensionError):
+        units.conversion("km/h", "m")
+
+def test_to():
+    x = si.SciData.from_str("88.0(5)")
+    v = x.with_unit("km/h")
+    w = v.to("m/s")
+    assert(str(w.unit) == "m/s")
+    expected = x * si.SciData.exact_from_float(1000. / 3600.)
+    assert(w.data.value == expected.value and w.data.unc == expected.unc)
+    #an exact factor of one keeps the data as it is
+    assert(v.to("km h-1").data is x)
+    assert(str(v.to_base().unit) == "m s-1")
+
+def test_inexact_conversion():
+    x = si.SciData.from_str("1.000000(1)")
+    e = x.with_unit("Eh").to("eV")
+    f = si.constants["Hartree energy"] / si.constants["elementary charge"]
+    assert(e.data.value.value == pytest.approx(f.value.value, rel = 1e-6))
+    assert(not e.data.is_exact)
+
+def test_array():
+    a = si.SciDataArray.from_SciData([si.SciData.from_str(s) for s in ["1.234(5)", "25.0(2)", "3"]])
+    q = a.with_unit("in").to("cm")
+    assert(_same(q.data, a * si.SciData.exact_from_float(2.54)))
+    assert(str(q[1].unit) == "cm" and len(q) == 3)
+    assert(q[2].data.is_exact)
+
+###############################################################
+# arithmetic with units
+#
+def test_arithmetic():
+    d = si.SciData.from_str("1.50(2)").with_unit("km")
+    e = si.SciData.from_str("250(3)").with_unit("m")
+    t = si.SciData.from_str("12.0(1)").with_unit("min")
+    s = d + e
+    assert(str(s.unit) == "km")
+    assert(s.data.value.value == pytest.approx(1.75))
+    assert((e - d).unit == si.unit("m"))
+    v = (d + e) / t
+    assert(v.dims == (1, 0, -1, 0, 0, 0, 0))
+    assert(v.to("m/s").data.value.value == pytest.approx(1750. / 720., rel = 1e-2))
+    assert((d * d).dims == (2, 0, 0, 0, 0, 0, 0))
+    assert((d ** 3).dims == (3, 0, 0, 0, 0, 0, 0))
+    assert((1. / t).dims == (0, 0, -1, 0, 0, 0, 0))
+    assert((d / d).data.is_exact)
+    assert((2. * d).unit == d.unit and (-d).unit == d.unit)
+    with pytest.raises(si.DimensionError):
+        d + t
+    with pytest.raises(si.DimensionError):
+        d + 1.
@@ -0,0 +1,107 @@
+# test_validation.py
+#
+# Provides interface with Pytest for testing the validated bulk constructors
+# of SigFigArray and SciDataArray, and their violation masks
+
+import pytest
+import warnings
+import numpy as np
+
+import standard_scientific as si
+
+def _sigfigs(n = 300, seed = 0):
+    rng = np.random.default_rng(seed)
+    return si.SigFigArray.from_floats(rng.uniform(-1e3, 1e3, n) * 10.**rng.integers(-5, 5, n), rng.integers(1, 6, n))
+
+###############################################################
+# arrays made by from_floats are valid at every level
+#
+@pytest.mark.parametrize("validate", ["none", "fast", "full"])
+def test_valid(validate):
+    x = _sigfigs()
+    u = si.SigFigArray.from_floats(np.full(len(x), 0.12), 2)
+    with warnings.catch_warnings():
+        #some of the relative uncertainties are half-way roundings
+        warnings.simplefilter("ignore")
+        s = si.SciDataArray.from_SigFigArrays(x, u)
+    assert(not si.validate_scidata(s, validate).any())
+    x[5] = None
+    y, bad = si.SigFigArray.from_columns(x.value, x.sigfigs, x.exponent, validate = validate)
+    assert(not bad.any())
+    assert(np.array_equal(y.value, x.value, equal_nan = True))
+
+###############################################################
+# each of the checks, and the level at which it is made
+#
+@pytest.mark.parametrize("value, sigfigs, exponent, fast, full", [
+    (1.23, 3, 0, False, False),
+    (10.0, 2, 0, False, False),   #9.96 to 2 sigfigs
+    (1.23, 0, 0, True, True),
+    (1.23, -1, 0, True, True),
+    (1.23, 3, 1, True, True),
+    (123., 3, 1, True, True),
+    (np.inf, 3, 0, True, True),
+    (1.234, 3, 0, False, True),
+    (1250., 2, 3, False, True),
+    (0., 1, 0, False, False),
+])
+def test_checks(value, sigfigs, exponent, fast, full):
+    for validate, expected in [("none", False), ("fast", fast), ("full", full)]:
+        _, bad = si.SigFigArray.from_columns([value], [sigfigs], [exponent], validate = validate)
+        assert(bad.tolist() == [expected])
+
+###############################################################
+# every output of from_floats is valid, including values that round
+# to a power of ten whose float is just below it (1.04e-6 -> 1e-06)
+#
+@pytest.mark.parametrize("seed", [0, 1])
+def test_from_floats_valid(seed):
+    rng = np.random.default_rng(seed)
+    v = np.concatenate([rng.uniform(-10., 10., 20000) * 10.**rng.integers(-300, 300, 20000),
+                        np.repeat(10.**np.arange(-300, 300), 2) * np.tile([1.04, 0.996], 600)])
+    sf = rng.integers(1, 16, len(v))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        x = si.SigFigArray.from_floats(v, sf)
+    assert(not si.validate_sigfigs(x, "full").any())
+    assert(not si.validate_sigfigs(si.SigFigArray.from_floats([1.04e-6], [2]), "fast").any())
+
+def test_exponent_default():
+    x, bad = si.SigFigArray.from_columns([1.23, 0.0456, 7.8e5], [3, 3, 2])
+    assert(not bad.any())
+    assert(x.exponent.tolist() == [0, -2, 5])
+
+###############################################################
+# SciData: positive uncertainties for inexact elements only
+#
+def test_scidata():
+    value = si.SigFigArray.from_floats([1.23, 4.56, 7.89, 1.5, 3.14159], [3, 3, 3, 2, 6])
+    unc = si.SigFigArray.from_floats([0.01, 0.02, 0.03, 0.1, 1.], 1)
+    unc.value[1] = 0.
+    unc.value[2] = -0.03
+    unc[3] = None
+    value.value[4] = 3.14159265
+    x, bad = si.SciDataArray.from_columns(value, unc, is_exact = [False, False, False, False, True], validate = "full")
+    assert(bad.tolist() == [False, True, True, True, False])
+    assert(x.unc.is_missing().tolist() == [False, False, False, True, True])
+    assert(x.rel_unc[0] == si.SciDataArray.from_SigFigArrays(value[:1], unc[:1]).rel_unc[0])
+    assert(x.rel_unc.is_missing()[1:].all())
+    #the relative uncertainties are computed when first used, unless they are given
+    for validate in ("none", "fast", "full"):
+        y, _ = si.SciDataArray.from_columns(value, unc, is_exact = [False, False, False, False, True], validate = validate)
+        assert(y._rel_unc is None)
+        assert(np.array_equal(y.rel_unc.value, x.rel_unc.value, equal_nan = True))
+        assert(np.array_equal(y.rel_unc.sigfigs, x.rel_unc.sigfigs))
+    r = si.SigFigArray.from_floats([0.5] * 5, 1)
+    y, _ = si.SciDataArray.from_columns(value, unc, is_exact = [False, False, False, False, True], rel_unc = r)
+    assert(y.rel_unc.is_missing().tolist() == [False, True, True, True, True] and y.rel_unc[0] == r[0])
+    #unrounded inexact values are only found by "full"
+    value.value[4] = 3.14159265
+    _, bad = si.SciDataArray.from_columns(value, unc, validate = "fast")
+    assert(bad.tolist() == [False, True, True, True, False])
+    _, bad = si.SciDataArray.from_columns(value, unc, validate = "full")
+    assert(bad.tolist() == [False, True, True, True, True])
+
+def test_policy():
+    with pytest.raises(AssertionError):
+        si.validate_sigfigs(_sigfigs(), "some")